@@ -0,0 +1,427 @@
+"""Compiled catalog cache for skillsctl.
+
+Parsing catalog/skills.json on every command is the dominant cost of a
+skillsctl invocation on large catalogs. The compiled cache stores the parsed
+skills in marshal format together with the fingerprint of the JSON file it
+was built from, so later invocations can skip JSON decoding entirely.
+
+The cache is keyed either on the git object holding the catalog in the
+skills submodule's HEAD (the catalog/skills.json blob or the
+catalog/skills.d/ tree), or, when the object store is unavailable, on the
+working tree file's size, mtime and content hash.
+
+Cache file layout::
+
+    header   magic, cache version, marshal version, source kind,
+             catalog size, catalog mtime (ns), catalog SHA-256 or object SHA
+    layout   skill count, index size
+    index    marshal-encoded (ids, aliases, distinct tag tuples)
+    offsets  native uint64 record offsets (count + 1), 8-byte aligned
+    records  marshal-encoded (title, description, tag tuple no, paths) per skill
+
+Records are addressable individually, which lets LazyCatalog decode only
+the skills a command actually touches.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+
+from .catalog import CATALOG_FILE, JSONL_FILE, SHARD_DIR, Catalog, Skill
+from .git_ops import GitOps
+from .index import PrefixIndex
+
+CACHE_VERSION = 4
+CACHE_MAGIC = b"SKLC"
+CACHE_FILENAME = "catalog.cache"
+HEAD_FILENAME = "catalog.head"
+
+SOURCE_FILE = 0
+SOURCE_OBJECT = 1
+
+_HEADER = struct.Struct("<4sHHB3xQq32s")
+_LAYOUT = struct.Struct("<QQ")
+
+CacheIndex = tuple[tuple[str, ...], tuple[tuple[str, ...], ...], tuple[tuple[str, ...], ...]]
+CacheRecord = tuple[str, str, int, tuple[str, ...]]
+
+
+class LazyCatalog(Catalog):
+    """Catalog that decodes skills from the compiled cache on demand.
+
+    Only skill IDs and aliases are decoded up front. Titles, descriptions,
+    tags and paths stay in the mapped cache file until a skill is first
+    requested through get(), list_all() or suggest().
+    """
+
+    def __init__(
+        self,
+        ids: tuple[str, ...],
+        aliases: tuple[tuple[str, ...], ...],
+        tag_sets: tuple[tuple[str, ...], ...],
+        offsets: Sequence[int],
+        records: memoryview,
+    ) -> None:
+        """Initialize catalog from decoded cache index and raw records."""
+        self._ids = ids
+        self._aliases = aliases
+        self._tag_sets = tag_sets
+        self._offsets = offsets
+        self._records = records
+        self._positions: dict[str, int] | None = None
+        self._materialized: dict[int, Skill] = {}
+        self._all: list[Skill] | None = None
+
+    @property
+    def skills(self) -> list[Skill]:
+        """All skills in catalog order (materializes every record)."""
+        if self._all is None:
+            with _gc_paused():
+                self._all = self._materialize_all()
+        return self._all
+
+    @property
+    def prefix_index(self) -> PrefixIndex:
+        """Sorted ID and alias index, built without decoding any record."""
+        if self._prefix_index is None:
+            self._prefix_index = PrefixIndex(self._ids, self._aliases)
+        return self._prefix_index
+
+    def get_by_id(self, skill_id: str) -> Skill | None:
+        """Get skill by ID, decoding only that record."""
+        if self._positions is None:
+            # Built on first lookup: suggest() through a search index needs none
+            self._positions = {skill_id: pos for pos, skill_id in enumerate(self._ids)}
+        pos = self._positions.get(skill_id)
+        if pos is None:
+            return None
+        return self._skill_at(pos)
+
+    def _materialize_all(self) -> list[Skill]:
+        """Decode every record in one pass, reusing already decoded skills."""
+        records = self._records
+        tag_sets = self._tag_sets
+        materialized = self._materialized
+        loads = marshal.loads
+        skills: list[Skill] = []
+        append = skills.append
+        for pos, (skill_id, aliases, start, end) in enumerate(
+            zip(self._ids, self._aliases, self._offsets, self._offsets[1:], strict=False)
+        ):
+            skill = materialized.get(pos) if materialized else None
+            if skill is None:
+                title, description, tag_set, paths = loads(records[start:end])
+                skill = Skill(skill_id, title, description, tag_sets[tag_set], paths, aliases)
+            append(skill)
+        return skills
+
+    def _skill_at(self, pos: int) -> Skill:
+        """Decode (once) the skill stored at a record position."""
+        skill = self._materialized.get(pos)
+        if skill is None:
+            record: CacheRecord = marshal.loads(
+                self._records[self._offsets[pos] : self._offsets[pos + 1]]
+            )
+            title, description, tag_set, paths = record
+            skill = Skill(
+                self._ids[pos],
+                title,
+                description,
+                self._tag_sets[tag_set],
+                paths,
+                self._aliases[pos],
+            )
+            self._materialized[pos] = skill
+        return skill
+
+
+def cache_path_for(git_dir: Path) -> Path:
+    """Get the compiled cache location inside a submodule git directory."""
+    return git_dir / "skillsctl" / CACHE_FILENAME
+
+
+def load_cached(catalog_path: Path, cache_path: Path, lazy: bool = False) -> Catalog:
+    """Load catalog through the compiled cache, rebuilding it when stale.
+
+    The cache is considered fresh when the catalog size and mtime match the
+    recorded fingerprint. When only the mtime differs (e.g. after a checkout
+    that rewrote identical content), the content hash decides and the
+    recorded mtime is refreshed.
+
+    Args:
+        catalog_path: Path to catalog/skills.json file.
+        cache_path: Path to the compiled cache file.
+        lazy: Return a LazyCatalog when the cache is fresh.
+
+    Returns:
+        Catalog instance.
+
+    Raises:
+        CatalogError: If catalog file is missing or invalid.
+    """
+    try:
+        st = catalog_path.stat()
+    except OSError:
+        # Let Catalog.load produce the usual error
+        return Catalog.load(catalog_path)
+
+    mm = _map(cache_path)
+    if mm is not None:
+        header = _read_header(mm)
+        if header is not None and header[:2] == (SOURCE_FILE, st.st_size):
+            _, size, mtime_ns, digest = header
+            stale_mtime = mtime_ns != st.st_mtime_ns
+            if not stale_mtime or hashlib.sha256(catalog_path.read_bytes()).digest() == digest:
+                cached = _decode(mm, lazy)
+                if cached is not None:
+                    if stale_mtime:
+                        with contextlib.suppress(OSError):
+                            _refresh_header(cache_path, SOURCE_FILE, size, st.st_mtime_ns, digest)
+                    return cached
+
+    data = catalog_path.read_bytes()
+    catalog = Catalog.loads(data)
+    with contextlib.suppress(OSError):
+        write_cache(
+            cache_path,
+            catalog,
+            SOURCE_FILE,
+            st.st_size,
+            st.st_mtime_ns,
+            hashlib.sha256(data).digest(),
+        )
+    return catalog
+
+
+def load_cached_object(
+    object_sha: str,
+    build: Callable[[], Catalog],
+    cache_path: Path,
+    lazy: bool = False,
+) -> Catalog:
+    """Load catalog stored in a git object through the compiled cache.
+
+    The object SHA (a blob for catalog/skills.json, a tree for
+    catalog/skills.d/) identifies the content, so a cache built from the
+    same object is used without reading or hashing anything.
+
+    Args:
+        object_sha: Hex SHA of the catalog blob or shard tree.
+        build: Callable that reads and parses the object, used on cache miss.
+        cache_path: Path to the compiled cache file.
+        lazy: Return a LazyCatalog when the cache is fresh.
+
+    Returns:
+        Catalog instance.
+
+    Raises:
+        CatalogError: If catalog data is invalid.
+    """
+    key = bytes.fromhex(object_sha).ljust(32, b"\0")
+    mm = _map(cache_path)
+    if mm is not None:
+        header = _read_header(mm)
+        if header is not None and header[0] == SOURCE_OBJECT and header[3] == key:
+            cached = _decode(mm, lazy)
+            if cached is not None:
+                return cached
+
+    catalog = build()
+    with contextlib.suppress(OSError):
+        write_cache(cache_path, catalog, SOURCE_OBJECT, 0, 0, key)
+    return catalog
+
+
+def resolve_catalog_object(
+    git: GitOps,
+    skills_dir: Path,
+    cache_dir: Path,
+) -> tuple[str, str] | None:
+    """Find the catalog in the skills submodule's HEAD commit.
+
+    Looks for catalog/skills.json, then for a catalog/skills.d/ shard tree,
+    then for catalog/skills.jsonl.
+    The result for the last seen HEAD commit is remembered next to the
+    cache, so an unchanged HEAD is resolved by reading a few small files
+    instead of spawning git.
+
+    Args:
+        git: Git operations for the project.
+        skills_dir: Submodule path relative to project root.
+        cache_dir: Directory holding the compiled cache.
+
+    Returns:
+        (path in repository, object SHA), or None if HEAD has no catalog.
+    """
+    memo_path = cache_dir / HEAD_FILENAME
+    commit = git.head_commit(skills_dir)
+    if commit is not None:
+        with contextlib.suppress(OSError, ValueError):
+            memo_commit, memo_path_in_repo, memo_sha = memo_path.read_text().split()
+            if memo_commit == commit:
+                return memo_path_in_repo, memo_sha
+
+    found = find_catalog_object(git, skills_dir, "HEAD")
+    if found is not None and commit is not None:
+        with contextlib.suppress(OSError):
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            memo_path.write_text(f"{commit} {found[0]} {found[1]}\n")
+    return found
+
+
+def find_catalog_object(git: GitOps, skills_dir: Path, rev: str) -> tuple[str, str] | None:
+    """Find the catalog in a revision of the skills submodule.
+
+    Args:
+        git: Git operations for the project.
+        skills_dir: Submodule path relative to project root.
+        rev: Revision to look in, e.g. "HEAD" or a commit SHA.
+
+    Returns:
+        (path in repository, object SHA), or None if the revision has no catalog.
+    """
+    for path_in_repo in (CATALOG_FILE, SHARD_DIR, JSONL_FILE):
+        sha = git.rev_parse(skills_dir, f"{rev}:{path_in_repo}")
+        if sha is not None:
+            return path_in_repo, sha
+    return None
+
+
+def write_cache(
+    cache_path: Path,
+    catalog: Catalog,
+    source: int,
+    size: int,
+    mtime_ns: int,
+    digest: bytes,
+) -> None:
+    """Write compiled cache atomically.
+
+    Args:
+        cache_path: Path to the compiled cache file.
+        catalog: Parsed catalog to store.
+        source: SOURCE_FILE or SOURCE_OBJECT.
+        size: Size of the source catalog file (0 for git objects).
+        mtime_ns: Modification time of the source catalog file (0 for git objects).
+        digest: SHA-256 of the source file, or the raw git object SHA.
+    """
+    skills = catalog.skills
+    tag_set_numbers: dict[tuple[str, ...], int] = {}
+    offsets = array("Q", [0])
+    records: list[bytes] = []
+    for skill in skills:
+        tag_set = tag_set_numbers.setdefault(skill.tags, len(tag_set_numbers))
+        record: CacheRecord = (skill.title, skill.description, tag_set, skill.paths)
+        records.append(marshal.dumps(record))
+        offsets.append(offsets[-1] + len(records[-1]))
+
+    index: CacheIndex = (
+        tuple(s.id for s in skills),
+        tuple(s.aliases for s in skills),
+        tuple(tag_set_numbers),
+    )
+    index_blob = marshal.dumps(index)
+    header = _pack_header(source, size, mtime_ns, digest)
+    layout = _LAYOUT.pack(len(skills), len(index_blob))
+    padding = b"\0" * (-(len(header) + len(layout) + len(index_blob)) % 8)
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(header + layout + index_blob + padding)
+            f.write(offsets.tobytes())
+            f.writelines(records)
+        os.replace(tmp_path, cache_path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            tmp_path.unlink()
+
+
+def _map(cache_path: Path) -> mmap.mmap | None:
+    """Map the cache file read-only, or None if there is no usable file."""
+    try:
+        with open(cache_path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+def _pack_header(source: int, size: int, mtime_ns: int, digest: bytes) -> bytes:
+    """Build the cache header for a catalog fingerprint."""
+    return _HEADER.pack(CACHE_MAGIC, CACHE_VERSION, marshal.version, source, size, mtime_ns, digest)
+
+
+def _read_header(mm: mmap.mmap) -> tuple[int, int, int, bytes] | None:
+    """Parse cache header, returning None if it is not a usable cache."""
+    if len(mm) < _HEADER.size + _LAYOUT.size:
+        return None
+    magic, version, marshal_version, source, size, mtime_ns, digest = _HEADER.unpack_from(mm)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION or marshal_version != marshal.version:
+        return None
+    return source, size, mtime_ns, digest
+
+
+def _decode(mm: mmap.mmap, lazy: bool) -> Catalog | None:
+    """Decode a compiled cache into an eager or lazy catalog.
+
+    A lazy catalog keeps views into the mapping, so it is never closed
+    explicitly; it is unmapped once the catalog is garbage collected.
+
+    Returns:
+        Catalog instance, or None if the cache is corrupt.
+    """
+    try:
+        return _decode_payload(mm, lazy)
+    except (ValueError, EOFError, TypeError, IndexError, struct.error):
+        return None
+
+
+def _decode_payload(mm: mmap.mmap, lazy: bool) -> Catalog:
+    """Decode the index and records following the cache header."""
+    count, index_size = _LAYOUT.unpack_from(mm, _HEADER.size)
+    view = memoryview(mm)
+    index_start = _HEADER.size + _LAYOUT.size
+    offsets_start = index_start + index_size + (-(index_start + index_size) % 8)
+    records_start = offsets_start + 8 * (count + 1)
+
+    with _gc_paused():
+        index: CacheIndex = marshal.loads(view[index_start : index_start + index_size])
+        offsets = view[offsets_start:records_start].cast("Q")
+        if len(index[0]) != count or offsets[count] != len(view) - records_start:
+            raise ValueError("Truncated catalog cache")
+        catalog = LazyCatalog(*index, offsets, view[records_start:])
+        if lazy:
+            return catalog
+        return Catalog(catalog.skills)
+
+
+@contextlib.contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause the cyclic GC while bulk-allocating acyclic objects.
+
+    Decoding creates hundreds of thousands of containers, which otherwise
+    triggers repeated full collections for no benefit.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _refresh_header(cache_path: Path, source: int, size: int, mtime_ns: int, digest: bytes) -> None:
+    """Rewrite the cache header in place with a new catalog fingerprint."""
+    with open(cache_path, "r+b") as f:
+        f.write(_pack_header(source, size, mtime_ns, digest))
@@ -2,22 +2,91 @@
 
 from __future__ import annotations
 
+import heapq
 import json
+import os
 import re
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from .index import (
+    PositionSet,
+    PrefixIndex,
+    SearchIndex,
+    SkillFields,
+    TagIndex,
+    field_words,
+    skill_fields,
+)
 
-@dataclass
+if TYPE_CHECKING:
+    from .vector import VectorScorer
+
+CATALOG_FILE = "catalog/skills.json"
+SHARD_DIR = "catalog/skills.d"
+JSONL_FILE = "catalog/skills.jsonl"
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Below this total size, process pool startup costs more than it saves
+PARALLEL_LOAD_THRESHOLD = 4 << 20
+
+# Highest score a single query token can add (tag + title + description)
+TOKEN_MAX_SCORE = 20 + 10 + 5
+
+RANKER_V1 = "v1"
+RANKER_BM25 = "bm25"
+RANKERS = (RANKER_V1, RANKER_BM25)
+
+# From this many candidates on, v1 scoring runs vectorized when NumPy is
+# installed (see vector); below it, setting up the arrays costs more
+VECTOR_MIN_CANDIDATES = 20_000
+
+# From this many candidates on, suggest(workers=N) scores them in N forked
+# processes; below it, forking costs more than scoring serially
+PARALLEL_SUGGEST_MIN_CANDIDATES = 20_000
+
+# Default maximum edit distance for fuzzy suggest, and points lost per edit
+FUZZY_DISTANCE = 2
+FUZZY_PENALTY = 5
+
+# Largest match set a SuggestSession remembers; scoring more candidates on
+# every keystroke costs more than a pruned Catalog.suggest()
+SESSION_MAX_CANDIDATES = 5000
+
+_SCALAR_END = re.compile(r"[,\]}\s]")
+
+SkillRecord = tuple[str, str, str, tuple[str, ...], tuple[str, ...], tuple[str, ...]]
+
+
+@dataclass(frozen=True, slots=True)
 class Skill:
-    """Represents a skill in the catalog."""
+    """Represents a skill in the catalog.
+
+    Skills are immutable; list fields are stored as tuples so that equal
+    tag and alias sets can be shared across the catalog (see InternTable).
+    """
 
     id: str
     title: str
     description: str
-    tags: list[str] = field(default_factory=list)
-    paths: list[str] = field(default_factory=list)
-    aliases: list[str] = field(default_factory=list)
+    tags: tuple[str, ...] = ()
+    paths: tuple[str, ...] = ()
+    aliases: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Accept any sequence for list fields."""
+        # Fast path: loaders always pass tuples
+        if type(self.tags) is tuple and type(self.paths) is tuple and type(self.aliases) is tuple:
+            return
+        for name in ("tags", "paths", "aliases"):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
 
     def to_dict(self) -> dict[str, str | list[str]]:
         """Convert skill to dictionary."""
@@ -25,47 +94,89 @@ class Skill:
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "tags": self.tags,
-            "paths": self.paths,
-            "aliases": self.aliases,
+            "tags": list(self.tags),
+            "paths": list(self.paths),
+            "aliases": list(self.aliases),
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScoredSkill:
     """Skill with search score."""
 
     skill: Skill
-    score: int
+    score: float
 
-    def to_dict(self) -> dict[str, str | list[str] | int]:
+    def to_dict(self) -> dict[str, str | list[str] | float]:
         """Convert to dictionary with score."""
-        result: dict[str, str | list[str] | int] = {
+        result: dict[str, str | list[str] | float] = {
             "id": self.skill.id,
             "title": self.skill.title,
             "description": self.skill.description,
-            "tags": self.skill.tags,
-            "paths": self.skill.paths,
-            "aliases": self.skill.aliases,
+            "tags": list(self.skill.tags),
+            "paths": list(self.skill.paths),
+            "aliases": list(self.skill.aliases),
             "score": self.score,
         }
         return result
 
 
+class InternTable:
+    """Catalog-wide table of shared strings and string tuples.
+
+    Tags like "pdf" or "python" repeat across thousands of skills; routing
+    them through one table keeps a single copy of each distinct string and
+    each distinct tuple.
+    """
+
+    __slots__ = ("_strings", "_tuples")
+
+    def __init__(self) -> None:
+        """Initialize empty table."""
+        self._strings: dict[str, str] = {}
+        self._tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+    def string(self, value: str) -> str:
+        """Return the shared copy of a string."""
+        return self._strings.setdefault(value, value)
+
+    def strings(self, values: object) -> tuple[str, ...]:
+        """Return the shared tuple for a list of strings.
+
+        Non-list values are treated as empty.
+        """
+        if not isinstance(values, list | tuple) or not values:
+            return ()
+        key = tuple(self._strings.setdefault(v, v) if isinstance(v, str) else v for v in values)
+        return self._tuples.setdefault(key, key)
+
+
 class Catalog:
     """Skills catalog manager."""
 
+    _prefix_index: PrefixIndex | None = None
+    _search_index: SearchIndex | None = None
+    _tag_index: TagIndex | None = None
+    _vector: VectorScorer | None = None
+
     def __init__(self, skills: list[Skill]) -> None:
         """Initialize catalog with skills list."""
-        self.skills = skills
+        self._skills = skills
         self._by_id: dict[str, Skill] = {s.id: s for s in skills}
 
+    @property
+    def skills(self) -> list[Skill]:
+        """All skills in catalog order."""
+        return self._skills
+
     @classmethod
     def load(cls, catalog_path: Path) -> Catalog:
         """Load catalog from JSON file.
 
         Args:
-            catalog_path: Path to catalog/skills.json file.
+            catalog_path: Path to catalog/skills.json file, a JSON Lines
+                catalog/skills.jsonl file, or a directory of shards such as
+                catalog/skills.d/ (see loads_shards).
 
         Returns:
             Catalog instance.
@@ -76,43 +187,225 @@ class Catalog:
         if not catalog_path.exists():
             raise CatalogError(f"Catalog file not found: {catalog_path}")
 
+        if catalog_path.is_dir():
+            return cls.loads_shards(
+                [(shard.name, shard.read_bytes()) for shard in shard_files(catalog_path)]
+            )
+
+        with open(catalog_path, "rb") as f:
+            if catalog_path.suffix == ".jsonl":
+                return cls.loads_jsonl(f.read())
+            return cls.loads(f.read())
+
+    @classmethod
+    def loads(cls, data: str | bytes) -> Catalog:
+        """Load catalog from JSON text.
+
+        Args:
+            data: Contents of a catalog/skills.json file.
+
+        Returns:
+            Catalog instance.
+
+        Raises:
+            CatalogError: If catalog data is invalid.
+        """
         try:
-            with open(catalog_path) as f:
-                data = json.load(f)
+            items = json.loads(data)
         except json.JSONDecodeError as e:
             raise CatalogError(f"Invalid JSON in catalog: {e}") from e
 
-        if not isinstance(data, list):
+        if not isinstance(items, list):
             raise CatalogError("Catalog must be a JSON array")
 
+        table = InternTable()
         skills = []
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-            if "id" not in item or "title" not in item:
-                continue
-
-            skill = Skill(
-                id=item["id"],
-                title=item["title"],
-                description=item.get("description", ""),
-                tags=item.get("tags", []),
-                paths=item.get("paths", []),
-                aliases=item.get("aliases", []),
-            )
-            skills.append(skill)
+        for item in items:
+            skill = _skill_from_item(item, table)
+            if skill is not None:
+                skills.append(skill)
+
+        return cls(skills)
+
+    @classmethod
+    def loads_jsonl(cls, data: bytes) -> Catalog:
+        """Load catalog from JSON Lines text (one skill object per line).
+
+        Args:
+            data: Contents of a catalog/skills.jsonl file.
+
+        Returns:
+            Catalog instance.
+
+        Raises:
+            CatalogError: If a line is not valid JSON.
+        """
+        table = InternTable()
+        skills = []
+        for line_no, line in enumerate(data.splitlines(), start=1):
+            skill = _skill_from_line(line, table, line_no)
+            if skill is not None:
+                skills.append(skill)
+        return cls(skills)
+
+    @classmethod
+    def loads_shards(
+        cls,
+        shards: Sequence[tuple[str, bytes]],
+        max_workers: int | None = None,
+    ) -> Catalog:
+        """Load catalog from several JSON array shards.
+
+        Shards are merged in name order, so the result does not depend on
+        which worker finishes first. Large shard sets are parsed in a
+        process pool. Unlike a single catalog file, duplicate IDs across
+        or within shards are an error.
+
+        Args:
+            shards: (name, JSON content) pairs, e.g. from catalog/skills.d/.
+            max_workers: Process pool size. Defaults to the CPU count.
+
+        Returns:
+            Catalog instance.
+
+        Raises:
+            CatalogError: If a shard is invalid or IDs are duplicated.
+        """
+        ordered = sorted(shards)
+        workers = min(len(ordered), max_workers or os.cpu_count() or 1)
+        total_size = sum(len(data) for _, data in ordered)
+
+        table = InternTable()
+        parsed: list[list[Skill]]
+        if workers > 1 and total_size >= PARALLEL_LOAD_THRESHOLD:
+            # Imported here: multiprocessing adds ~20 ms to every startup
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parsed = [
+                    [
+                        Skill(r[0], r[1], r[2], table.strings(r[3]), r[4], table.strings(r[5]))
+                        for r in records
+                    ]
+                    for records in pool.map(_parse_shard, ordered)
+                ]
+        else:
+            parsed = [_load_shard(name, data, table) for name, data in ordered]
+
+        skills: list[Skill] = []
+        origin: dict[str, str] = {}
+        duplicates: list[str] = []
+        for (name, _), shard_skills in zip(ordered, parsed, strict=True):
+            for skill in shard_skills:
+                if skill.id in origin:
+                    duplicates.append(f"{skill.id} ({origin[skill.id]}, {name})")
+                    continue
+                origin[skill.id] = name
+                skills.append(skill)
+
+        if duplicates:
+            raise CatalogError(f"Duplicate skill IDs in catalog shards: {', '.join(duplicates)}")
 
         return cls(skills)
 
+    @classmethod
+    def load_stream(cls, catalog_path: Path) -> Catalog:
+        """Load catalog without materializing the parsed JSON tree.
+
+        Args:
+            catalog_path: Path to catalog/skills.json file.
+
+        Returns:
+            Catalog instance.
+
+        Raises:
+            CatalogError: If catalog file is invalid.
+        """
+        return cls(list(iter_skills(catalog_path)))
+
+    @property
+    def prefix_index(self) -> PrefixIndex:
+        """Sorted ID and alias index, built on first use."""
+        if self._prefix_index is None:
+            self._prefix_index = PrefixIndex.for_skills(self.skills)
+        return self._prefix_index
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Token and prefix index used by suggest(), built on first use."""
+        if self._search_index is None:
+            self._search_index = SearchIndex.for_skills(self.skills, self.prefix_index)
+        return self._search_index
+
+    def use_search_index(self, index: SearchIndex) -> None:
+        """Answer suggest() from a prebuilt index, e.g. a persistent one.
+
+        The index must have been built from this catalog's skills in order.
+        """
+        self._search_index = index
+        self._tag_index = None
+        self._vector = None
+
+    @property
+    def tag_index(self) -> TagIndex:
+        """Per-tag skill bitmaps: the search index's, or else built on first use."""
+        if self._search_index is not None:
+            return self._search_index.tags
+        if self._tag_index is None:
+            self._tag_index = TagIndex.for_skills(self.skills)
+        return self._tag_index
+
+    def with_tags(self, tags: Sequence[str]) -> list[Skill]:
+        """List the skills having every one of some tags (case-insensitive)."""
+        matched = self.tag_index.skills_with_all(tags)
+        if matched is None:
+            return self.list_all()
+        return [self._skill_at(pos) for pos in matched]
+
+    def facets(self, tags: Sequence[str] = ()) -> dict[str, int]:
+        """Count the skills having each tag, among those having every one of tags.
+
+        Returns:
+            Non-zero counts by lowercased tag, sorted by count descending, then by tag.
+        """
+        return self.tag_index.counts(self.tag_index.skills_with_all(tags))
+
     def get(self, skill_id: str) -> Skill | None:
-        """Get skill by ID."""
+        """Get skill by ID, or else by alias.
+
+        IDs take precedence over aliases; an alias defined by several
+        skills resolves to the first of them in catalog order.
+        """
+        skill = self.get_by_id(skill_id)
+        if skill is None:
+            skill = self.get_by_alias(skill_id)
+        return skill
+
+    def get_by_id(self, skill_id: str) -> Skill | None:
+        """Get skill by ID only."""
         return self._by_id.get(skill_id)
 
+    def get_by_alias(self, alias: str) -> Skill | None:
+        """Get skill by alias (case-sensitive)."""
+        skill_id = self.prefix_index.alias_owner(alias)
+        return None if skill_id is None else self.get_by_id(skill_id)
+
     def list_all(self) -> list[Skill]:
         """List all skills."""
         return self.skills
 
-    def suggest(self, query: str, limit: int = 10) -> list[ScoredSkill]:
+    def suggest(
+        self,
+        query: str,
+        limit: int = 10,
+        ranker: str = RANKER_V1,
+        fuzzy: int = 0,
+        fuzzy_penalty: int = FUZZY_PENALTY,
+        stats: SuggestStats | None = None,
+        after: RankPosition | None = None,
+        tags: Sequence[str] = (),
+        workers: int = 1,
+    ) -> list[ScoredSkill]:
         """Suggest skills based on query.
 
         Scoring algorithm (v1, deterministic):
@@ -124,65 +417,965 @@ class Catalog:
           - in description: +5
         - Alias match: same as id (exact +100, prefix +40)
 
+        The bm25 ranker keeps the id and alias points but scores token
+        matches with BM25 over tags, title and description (weighted 4:2:1),
+        so a token that is rare in the catalog, or frequent in a short
+        skill, counts for more. Scores are rounded to 4 decimals.
+
+        With fuzzy > 0 (v1 only), typos are tolerated, allowing at most one
+        edit per 3 characters: a field without the token but with an indexed
+        word at most fuzzy edits away from it scores the token's points less
+        fuzzy_penalty per edit, and an id or alias at most fuzzy edits away
+        from the query scores 40 less fuzzy_penalty per edit (at least 1
+        point either way), so exact hits still rank first.
+
+        On large catalogs, broad v1 queries are scored with NumPy when it is
+        installed (see vector), with identical results. Otherwise, with
+        workers > 1, they are scored in that many processes, each taking a
+        contiguous partition of the catalog (see _score_partitions); the
+        merged results are identical to serial scoring.
+
         Args:
             query: Search query.
             limit: Maximum number of results.
+            ranker: "v1" or "bm25".
+            fuzzy: Maximum edit distance of fuzzy matches (0 disables them).
+            fuzzy_penalty: Points lost per edit in a fuzzy match.
+            stats: Receives candidate counts and stage timings (v1 only).
+            after: Where the previous page of results ended (see
+                RankPosition); only results ranking after it are returned.
+            tags: Only suggest skills having every one of these tags
+                (case-insensitive), filtered with the tag bitmaps.
+            workers: Processes scoring large v1 candidate sets (1: serial).
 
         Returns:
-            List of scored skills, sorted by score descending.
+            List of scored skills, sorted by score descending, then by id.
+
+        Raises:
+            ValueError: If ranker is unknown, workers is below 1, or the fuzzy
+                options are invalid or used with bm25.
         """
-        query_lower = query.lower()
-        # Tokenize query by non-alphanumeric characters
-        tokens = [t for t in re.split(r"[^a-zA-Z0-9]+", query_lower) if t]
-
-        scored: list[ScoredSkill] = []
-
-        for skill in self.skills:
-            score = 0
-            id_lower = skill.id.lower()
-
-            # Exact id match
-            if id_lower == query_lower:
-                score += 100
-            # Prefix id match
-            elif id_lower.startswith(query_lower):
-                score += 40
-
-            # Alias matching
-            for alias in skill.aliases:
-                alias_lower = alias.lower()
-                if alias_lower == query_lower:
-                    score += 100
-                elif alias_lower.startswith(query_lower):
-                    score += 40
-
-            # Token matching
-            title_lower = skill.title.lower()
-            desc_lower = skill.description.lower()
-            tags_lower = [t.lower() for t in skill.tags]
-
-            for token in tokens:
-                # Tags
-                for tag in tags_lower:
-                    if token in tag:
-                        score += 20
-                        break
+        watch = _Stopwatch(stats)
+        query_lower, tokens = tokenize(query)
+        watch.lap("tokenize")
+        if ranker not in RANKERS:
+            raise ValueError(f"Unknown ranker: {ranker}")
+        if fuzzy < 0 or fuzzy_penalty < 1:
+            raise ValueError("Fuzzy distance must be >= 0 and penalty >= 1")
+        if fuzzy and ranker != RANKER_V1:
+            raise ValueError(f"Fuzzy matching is not supported by the {ranker} ranker")
+        if workers < 1:
+            raise ValueError("Workers must be >= 1")
+        if limit <= 0:
+            return []
+        # Also fetch the results tied with the previous page's last one, then drop them
+        page_limit = limit if after is None else limit + after.repeats
+        index = self.search_index
+        watch.lap("index")
+        allowed = index.tags.skills_with_all(tags) if tags else None
+        if allowed is not None:
+            watch.lap("tags")
+            if not allowed:
+                return []
+        if ranker == RANKER_BM25:
+            results = self._suggest_bm25(query_lower, tokens, page_limit, after, allowed)
+        else:
+            results = self._suggest_v1(
+                query_lower,
+                tokens,
+                page_limit,
+                fuzzy,
+                fuzzy_penalty,
+                after,
+                allowed,
+                watch,
+                stats,
+                workers,
+            )
+        return results if after is None else after.skip(results)[:limit]
+
+    def session(self) -> SuggestSession:
+        """Start a search-as-you-type session over this catalog (see SuggestSession)."""
+        return SuggestSession(self)
+
+    def _suggest_v1(
+        self,
+        query_lower: str,
+        tokens: list[str],
+        limit: int,
+        fuzzy: int,
+        fuzzy_penalty: int,
+        after: RankPosition | None,
+        allowed: PositionSet | None,
+        watch: _Stopwatch,
+        stats: SuggestStats | None,
+        workers: int = 1,
+    ) -> list[ScoredSkill]:
+        """Rank skills with the v1 scores (see suggest), among allowed ones if given."""
+        index = self.search_index
+        top = _TopK(limit, after)
+        score: Callable[[SkillFields], int] = partial(
+            score_fields, query_lower=query_lower, tokens=tokens
+        )
+        fuzzy_words = None
+        prefixed = set(index.prefix_index.prefixed(query_lower))
+        if fuzzy:
+            fuzzy_query = _FuzzyQuery(index, query_lower, tokens, fuzzy, fuzzy_penalty)
+            score = fuzzy_query.score
+            fuzzy_words = fuzzy_query.word_ids
+            prefixed.update(fuzzy_query.key_positions)
+        if allowed is not None:
+            prefixed = {pos for pos in prefixed if pos in allowed}
+        watch.lap("candidates")
+
+        # ID and alias prefix (or fuzzy) matches can score anything; score them all
+        for pos in sorted(prefixed):
+            fields = index.fields(pos)
+            top.offer(fields[0], score(fields), pos)
+        watch.lap("score")
+        if stats is not None:
+            stats.candidates = stats.scored = len(prefixed)
+
+        # Any other skill scores at most TOKEN_MAX_SCORE per token it contains
+        if top.threshold() > TOKEN_MAX_SCORE * len(tokens):
+            results = top.results(self._skill_at)
+            watch.lap("sort")
+            return results
+        hits = index.token_hits(tokens, fuzzy_words)
+        if allowed is not None:
+            if hits is None:
+                hits = dict.fromkeys(allowed, len(tokens))
+            else:
+                hits = {pos: count for pos, count in hits.items() if pos in allowed}
+        candidates = len(index) if hits is None else len(hits)
+        watch.lap("candidates")
+        if stats is not None:
+            stats.candidates = candidates if hits is None else len(prefixed.union(hits))
+        vector = None
+        # An in-memory index only has the postings' field bits once computed
+        if not fuzzy and candidates >= VECTOR_MIN_CANDIDATES and index.has_term_stats:
+            vector = self._vector_scorer()
+        if vector is not None:
+            id_points = {pos: score_ids(index.fields(pos), query_lower) for pos in prefixed}
+            ranked = vector.rank(tokens, id_points, limit, after, allowed)
+            watch.lap("score")
+            if stats is not None:
+                stats.scored = len(index) if allowed is None else len(allowed)
+                stats.vectorized = True
+            results = [ScoredSkill(skill=self._skill_at(pos), score=s) for s, pos in ranked]
+            watch.lap("sort")
+            return results
+        buckets: list[tuple[int, Sequence[int]]]
+        if hits is None:
+            buckets = [(len(tokens), range(len(index)))]
+        else:
+            by_count: dict[int, list[int]] = {}
+            for pos, count in hits.items():
+                by_count.setdefault(count, []).append(pos)
+            buckets = sorted(by_count.items(), reverse=True)
+
+        if workers > 1 and candidates >= PARALLEL_SUGGEST_MIN_CANDIDATES and _can_fork():
+            # Partitions find their range of each bucket by bisection
+            sorted_buckets = [
+                (count, positions if hits is None else sorted(positions))
+                for count, positions in buckets
+            ]
+            job = _PartitionJob(
+                index, score, sorted_buckets, prefixed, limit, after, top.threshold()
+            )
+            scored = 0
+            for entries, partition_scored in _score_partitions(job, len(index), workers):
+                for entry_score, skill_id, pos in entries:
+                    top.offer(skill_id, entry_score, pos)
+                scored += partition_scored
+            watch.lap("score")
+            if stats is not None:
+                stats.scored += scored
+            results = top.results(self._skill_at)
+            watch.lap("sort")
+            return results
+
+        for count, positions in buckets:
+            if top.threshold() > TOKEN_MAX_SCORE * count:
+                break
+            for pos in positions:
+                if pos not in prefixed:
+                    fields = index.fields(pos)
+                    top.offer(fields[0], score(fields), pos)
+            if stats is not None:
+                stats.scored += len(positions) - len(prefixed.intersection(positions))
+        watch.lap("score")
+
+        results = top.results(self._skill_at)
+        watch.lap("sort")
+        return results
 
-                # Title
-                if token in title_lower:
-                    score += 10
+    def _suggest_bm25(
+        self,
+        query_lower: str,
+        tokens: list[str],
+        limit: int,
+        after: RankPosition | None,
+        allowed: PositionSet | None,
+    ) -> list[ScoredSkill]:
+        """Rank skills by id and alias points plus BM25 token scores."""
+        index = self.search_index
+        scores = index.bm25_scores(tokens)
+        for pos in set(index.prefix_index.prefixed(query_lower)):
+            scores[pos] = scores.get(pos, 0.0) + score_ids(index.fields(pos), query_lower)
+        if allowed is not None:
+            scores = {pos: score for pos, score in scores.items() if pos in allowed}
 
-                # Description
-                if token in desc_lower:
-                    score += 5
+        ranked = [(round(score, 4), pos) for pos, score in scores.items() if score > 0]
+        if after is not None:
+            ranked = [
+                (score, pos)
+                for score, pos in ranked
+                if score < after.score
+                or (score == after.score and not after.ranks_before(score, index.fields(pos)[0]))
+            ]
+        if len(ranked) > limit:
+            # IDs only break ties, so only fetch them for the top scores
+            cutoff = heapq.nlargest(limit, ranked)[-1][0]
+            ranked = [entry for entry in ranked if entry[0] >= cutoff]
+        ranked.sort(key=lambda entry: (-entry[0], index.fields(entry[1])[0], entry[1]))
+        return [
+            ScoredSkill(skill=self._skill_at(pos), score=score) for score, pos in ranked[:limit]
+        ]
 
+    def _vector_scorer(self) -> VectorScorer | None:
+        """The vectorized scorer for the search index, or None without NumPy."""
+        if self._vector is None:
+            from .vector import HAVE_NUMPY, VectorScorer
+
+            if not HAVE_NUMPY:
+                return None
+            self._vector = VectorScorer(self.search_index)
+        return self._vector
+
+    def _skill_at(self, pos: int) -> Skill:
+        """Get the skill at a catalog position."""
+        return self.skills[pos]
+
+
+class SuggestSession:
+    """Search-as-you-type over a catalog, with v1 ranking.
+
+    Each suggest() remembers the skills its query matched. When the next
+    query extends the previous one (another keystroke), only those skills
+    and the skills containing newly started tokens can match, so only they
+    are scored. A query that does not extend the previous one starts over,
+    and one matching more than max_candidates skills is answered by
+    Catalog.suggest() instead. Results are always identical to
+    Catalog.suggest().
+    """
+
+    def __init__(self, catalog: Catalog, max_candidates: int = SESSION_MAX_CANDIDATES) -> None:
+        """Initialize for a catalog, remembering at most max_candidates matches."""
+        self._catalog = catalog
+        self._max_candidates = max_candidates
+        self._query_lower: str | None = None
+        self._tokens: list[str] = []
+        self._matches: set[int] | None = None
+
+    def suggest(self, query: str, limit: int = 10) -> list[ScoredSkill]:
+        """Suggest skills for the next query of the session (see Catalog.suggest)."""
+        query_lower, tokens = tokenize(query)
+        index = self._catalog.search_index
+        candidates = self._candidates(index, query_lower, tokens)
+        self._query_lower = query_lower
+        self._tokens = tokens
+        self._matches = None
+        if candidates is None or len(candidates) > self._max_candidates:
+            return self._catalog.suggest(query, limit=limit)
+
+        scored: list[tuple[int, str, int]] = []
+        for pos in candidates:
+            fields = index.fields(pos)
+            score = score_fields(fields, query_lower, tokens)
             if score > 0:
-                scored.append(ScoredSkill(skill=skill, score=score))
+                scored.append((-score, fields[0], pos))
+        self._matches = {pos for _, _, pos in scored}
+        return [
+            ScoredSkill(skill=self._catalog._skill_at(pos), score=-negated)
+            for negated, _, pos in heapq.nsmallest(limit, scored)
+        ]
+
+    def _candidates(
+        self, index: SearchIndex, query_lower: str, tokens: list[str]
+    ) -> set[int] | None:
+        """Positions of all skills that can match a query, or None if too many to list.
+
+        A skill matching an extended query has an ID or alias starting with
+        the previous query too, or contains a token that either contains a
+        previous token or is new; only new tokens need the index.
+        """
+        if self._matches is not None and query_lower.startswith(self._query_lower or ""):
+            candidates = set(self._matches)
+            fresh = [t for t in tokens if not any(old in t for old in self._tokens)]
+        else:
+            prefixed = index.prefix_index.prefixed(query_lower)
+            if len(prefixed) > self._max_candidates:
+                return None
+            candidates = set(prefixed)
+            fresh = tokens
+        if fresh:
+            hits = index.token_hits(fresh, budget=self._max_candidates)
+            if hits is None:
+                return None
+            candidates.update(hits)
+        return candidates
+
+
+class _FuzzyQuery:
+    """Query expanded with the indexed words and keys near its tokens.
+
+    Scores like score_fields, plus the discounted points of fuzzy matches
+    (see Catalog.suggest).
+    """
+
+    def __init__(
+        self,
+        index: SearchIndex,
+        query_lower: str,
+        tokens: list[str],
+        max_distance: int,
+        penalty: int,
+    ) -> None:
+        """Find the fuzzy matches of a tokenized query in a search index."""
+        self.query_lower = query_lower
+        self.tokens = tokens
+        self.penalty = penalty
+        # Per token, (word, distance) closest first, and the word IDs
+        self.expansions: list[list[tuple[str, int]]] = []
+        self.word_ids: list[list[int]] = []
+        for token in tokens:
+            matches = index.fuzzy_words(token, _allowed_edits(token, max_distance))
+            self.expansions.append([(word, distance) for word, _, distance in matches])
+            self.word_ids.append([word_id for _, word_id, _ in matches])
+
+        self.keys: dict[str, int] = {}
+        self.key_positions: set[int] = set()
+        if query_lower:
+            edits = _allowed_edits(query_lower, max_distance)
+            for key, pos, distance in index.prefix_index.fuzzy(query_lower, edits):
+                if not key.startswith(query_lower):
+                    self.keys[key] = distance
+                    self.key_positions.add(pos)
+
+    def score(self, fields: SkillFields) -> int:
+        """Score a skill's lowercased fields, counting fuzzy matches."""
+        _, id_lower, aliases_lower, title_lower, desc_lower, tags_lower = fields
+        score = score_ids(fields, self.query_lower)
+        for key in (id_lower, *aliases_lower):
+            distance = self.keys.get(key)
+            if distance is not None:
+                score += self._discount(40, distance)
+
+        # Tokens and words are alphanumeric, so they never span two tags
+        tags_text = "\n".join(tags_lower)
+        # Fuzzy words are whole indexed words: match them against each
+        # field's words, split only when a token misses the field
+        words_by_points: dict[int, set[str]] = {}
+        for token, expansion in zip(self.tokens, self.expansions, strict=True):
+            for points, text in ((20, tags_text), (10, title_lower), (5, desc_lower)):
+                if token in text:
+                    score += points
+                    continue
+                if not expansion:
+                    continue
+                words = words_by_points.get(points)
+                if words is None:
+                    words = words_by_points[points] = field_words(text)
+                for word, distance in expansion:
+                    if word in words:
+                        score += self._discount(points, distance)
+                        break
+        return score
+
+    def _discount(self, points: int, distance: int) -> int:
+        """Points of a match distance edits away."""
+        return max(points - self.penalty * distance, 1)
+
+
+def _allowed_edits(term: str, max_distance: int) -> int:
+    """Edits allowed for a fuzzy match of term: at most one per 3 characters."""
+    return min(max_distance, len(term) // 3)
+
+
+@dataclass(slots=True)
+class SuggestStats:
+    """Work done by a Catalog.suggest() call that was passed this object.
+
+    candidates counts the skills found by the ID/alias prefix and token
+    lookups (the whole catalog if they could not narrow it down), scored
+    those actually scored; the rest were pruned by the top-k score bound.
+    timings holds the seconds spent per stage: "tokenize", "index" (loading
+    or building the search index), "tags" (with a tag filter), "candidates",
+    "score" and "sort".
+    """
+
+    candidates: int = 0
+    scored: int = 0
+    vectorized: bool = False
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def pruned(self) -> int:
+        """Candidates skipped without scoring."""
+        return max(self.candidates - self.scored, 0)
+
+    def to_dict(self) -> dict[str, int | bool | dict[str, float]]:
+        """Convert stats to dictionary, with timings in milliseconds."""
+        return {
+            "candidates": self.candidates,
+            "scored": self.scored,
+            "pruned": self.pruned,
+            "vectorized": self.vectorized,
+            "timings_ms": {stage: round(t * 1000, 3) for stage, t in self.timings.items()},
+        }
+
+
+class _Stopwatch:
+    """Adds the time since the previous lap to a stage of SuggestStats.timings.
+
+    Does nothing without stats, so normal suggest() calls pay one call per lap.
+    """
+
+    __slots__ = ("_stats", "_last")
+
+    def __init__(self, stats: SuggestStats | None) -> None:
+        self._stats = stats
+        self._last = time.perf_counter() if stats is not None else 0.0
+
+    def lap(self, stage: str) -> None:
+        if self._stats is None:
+            return
+        now = time.perf_counter()
+        timings = self._stats.timings
+        timings[stage] = timings.get(stage, 0.0) + now - self._last
+        self._last = now
+
+
+@dataclass(frozen=True, slots=True)
+class RankPosition:
+    """Where a page of suggest results ended, to rank the next page from.
+
+    Results are ordered by score descending, then by ID, so the next page
+    holds the results ranking after the last one shown. If that one shares
+    its ID and score with others (duplicate IDs), repeats counts how many of
+    them were shown.
+    """
+
+    score: float
+    skill_id: str
+    repeats: int = 1
+
+    @classmethod
+    def after(
+        cls, results: Sequence[ScoredSkill], previous: RankPosition | None = None
+    ) -> RankPosition | None:
+        """Get the position after a page of results.
+
+        Args:
+            results: The page, as returned by suggest().
+            previous: Position the page was ranked after, if any.
+
+        Returns:
+            Position after the page's last result, or previous for an empty page.
+        """
+        if not results:
+            return previous
+        last = results[-1]
+        repeats = 0
+        for result in reversed(results):
+            if (result.score, result.skill.id) != (last.score, last.skill.id):
+                break
+            repeats += 1
+        if (
+            repeats == len(results)
+            and previous is not None
+            and (previous.score, previous.skill_id) == (last.score, last.skill.id)
+        ):
+            repeats += previous.repeats
+        return cls(last.score, last.skill.id, repeats)
+
+    def ranks_before(self, score: float, skill_id: str) -> bool:
+        """Check if a result ranks before every result tied with the position."""
+        return score > self.score or (score == self.score and skill_id < self.skill_id)
+
+    def skip(self, results: list[ScoredSkill]) -> list[ScoredSkill]:
+        """Drop the leading results tied with the position that were already shown."""
+        shown = 0
+        for result in results[: self.repeats]:
+            if (result.score, result.skill.id) != (self.score, self.skill_id):
+                break
+            shown += 1
+        return results[shown:]
+
+
+class _TopK:
+    """Bounded selection of the best scored skills, ordered by (-score, id).
+
+    Ties on score and id (duplicate IDs) keep catalog order, matching a
+    stable sort of the whole catalog.
+    """
+
+    def __init__(self, k: int, after: RankPosition | None = None) -> None:
+        """Initialize for at most k results ranking after a position."""
+        self._k = k
+        self._after = after
+        # Min-heap on (score, inverted id order, inverted position): the
+        # root is the worst of the current top k
+        self._heap: list[_Ranked] = []
+
+    def threshold(self) -> int:
+        """Lowest score that can still enter the results (0 while not full)."""
+        if len(self._heap) < self._k:
+            return 0
+        return self._heap[0].score
+
+    def offer(self, skill_id: str, score: int, pos: int) -> None:
+        """Consider a scored skill; scores of zero never qualify."""
+        if score <= 0 or (self._after is not None and self._after.ranks_before(score, skill_id)):
+            return
+        entry = _Ranked(score, skill_id, pos)
+        if len(self._heap) < self._k:
+            heapq.heappush(self._heap, entry)
+        elif self._heap[0] < entry:
+            heapq.heapreplace(self._heap, entry)
+
+    def results(self, skill_at: Callable[[int], Skill]) -> list[ScoredSkill]:
+        """Selected skills sorted by score descending, then by id.
+
+        Args:
+            skill_at: Gets the skill at a catalog position.
+        """
+        ranked = sorted(self._heap, reverse=True)
+        return [ScoredSkill(skill=skill_at(entry.pos), score=entry.score) for entry in ranked]
+
+    def entries(self) -> list[tuple[int, str, int]]:
+        """Selected (score, id, position) entries, in no particular order."""
+        return [(entry.score, entry.skill_id, entry.pos) for entry in self._heap]
+
+
+class _Ranked:
+    """Heap entry for _TopK; a < b means a ranks below b."""
+
+    __slots__ = ("score", "skill_id", "pos")
+
+    def __init__(self, score: int, skill_id: str, pos: int) -> None:
+        self.score = score
+        self.skill_id = skill_id
+        self.pos = pos
+
+    def __lt__(self, other: _Ranked) -> bool:
+        if self.score != other.score:
+            return self.score < other.score
+        if self.skill_id != other.skill_id:
+            return self.skill_id > other.skill_id
+        return self.pos > other.pos
+
+
+@dataclass(frozen=True, slots=True)
+class _PartitionJob:
+    """Scoring state shared with forked suggest workers (see _score_partitions)."""
+
+    index: SearchIndex
+    score: Callable[[SkillFields], int]
+    # (token count, ascending candidate positions), best count first
+    buckets: Sequence[tuple[int, Sequence[int]]]
+    # Already scored by the caller
+    prefixed: set[int]
+    limit: int
+    after: RankPosition | None
+    # The caller's threshold: lower scores cannot enter its results
+    floor: int
+
+
+# Set in each forked suggest worker by _init_partition_worker
+_partition_job: _PartitionJob | None = None
+
+
+def _can_fork() -> bool:
+    """Check if suggest workers can be forked, inheriting the search index."""
+    # Imported here: multiprocessing adds ~20 ms to every startup
+    import multiprocessing
+
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _score_partitions(
+    job: _PartitionJob, size: int, workers: int
+) -> list[tuple[list[tuple[int, str, int]], int]]:
+    """Score the candidates of a job in contiguous catalog partitions.
+
+    The workers are forked, so they share the search index (the in-memory
+    tables copy-on-write, a persistent index's mapping as is) and the query
+    state with the caller: only partition bounds and each partition's top
+    entries cross process boundaries. Partitions are returned in catalog
+    order; as the top-k selection only depends on the (-score, id, position)
+    order, offering their entries to the caller's _TopK gives exactly the
+    serial results.
+
+    Args:
+        job: Candidates and query state.
+        size: Number of skills in the catalog.
+        workers: Number of processes and partitions.
+
+    Returns:
+        (top (score, id, position) entries, number of skills scored) by
+        partition.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    bounds = [size * number // workers for number in range(workers + 1)]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_partition_worker,
+        initargs=(job,),
+    ) as pool:
+        return list(pool.map(_score_partition, bounds[:-1], bounds[1:]))
+
+
+def _init_partition_worker(job: _PartitionJob) -> None:
+    """Keep the job a forked worker inherited (initargs are not pickled when forking)."""
+    global _partition_job
+    _partition_job = job
+
+
+def _score_partition(start: int, stop: int) -> tuple[list[tuple[int, str, int]], int]:
+    """Select the top entries among the job's candidates in [start, stop).
+
+    Runs in forked workers. Buckets are pruned as in serial scoring, also
+    against the caller's threshold.
+    """
+    job = _partition_job
+    if job is None:
+        raise RuntimeError("Suggest worker was not initialized")
+    top = _TopK(job.limit, job.after)
+    scored = 0
+    for count, positions in job.buckets:
+        if max(job.floor, top.threshold()) > TOKEN_MAX_SCORE * count:
+            break
+        first = bisect_left(positions, start)
+        for pos in positions[first : bisect_left(positions, stop, first)]:
+            if pos not in job.prefixed:
+                fields = job.index.fields(pos)
+                top.offer(fields[0], job.score(fields), pos)
+                scored += 1
+    return top.entries(), scored
+
+
+def tokenize(query: str) -> tuple[str, list[str]]:
+    """Normalize a query for scoring.
+
+    Returns:
+        Lowercased query and its tokens split on non-alphanumeric characters.
+    """
+    query_lower = query.lower()
+    tokens = [t for t in re.split(r"[^a-zA-Z0-9]+", query_lower) if t]
+    return query_lower, tokens
+
+
+@dataclass(frozen=True, slots=True)
+class ScoreContribution:
+    """Points a single match added to a v1 score (see explain_score)."""
+
+    field: str
+    term: str
+    match: str
+    points: int
+
+    def to_dict(self) -> dict[str, str | int]:
+        """Convert contribution to dictionary."""
+        return {"field": self.field, "term": self.term, "match": self.match, "points": self.points}
+
+    def __str__(self) -> str:
+        """Format contribution as "+points field match 'term'"."""
+        return f"+{self.points} {self.field} {self.match} {self.term!r}"
+
+
+def explain_score(skill: Skill, query: str) -> list[ScoreContribution]:
+    """Break a skill's v1 score for a query down into its matches.
+
+    Mirrors score_fields: each ID or alias match contributes for the whole
+    lowercased query ("exact" or "prefix"), each token found in a field
+    contributes for that token ("contains") to field "tags", "title" or
+    "description". The points add up to the skill's score.
+    """
+    query_lower, tokens = tokenize(query)
+    _, id_lower, aliases_lower, title_lower, desc_lower, tags_lower = skill_fields(skill)
+    contributions: list[ScoreContribution] = []
+    for name, key in [("id", id_lower), *(("alias", alias) for alias in aliases_lower)]:
+        if key == query_lower:
+            contributions.append(ScoreContribution(name, query_lower, "exact", 100))
+        elif key.startswith(query_lower):
+            contributions.append(ScoreContribution(name, query_lower, "prefix", 40))
+    for token in tokens:
+        if any(token in tag for tag in tags_lower):
+            contributions.append(ScoreContribution("tags", token, "contains", 20))
+        if token in title_lower:
+            contributions.append(ScoreContribution("title", token, "contains", 10))
+        if token in desc_lower:
+            contributions.append(ScoreContribution("description", token, "contains", 5))
+    return contributions
+
+
+def score_skill(skill: Skill, query_lower: str, tokens: list[str]) -> int:
+    """Score a skill against a tokenized query (see Catalog.suggest)."""
+    return score_fields(skill_fields(skill), query_lower, tokens)
+
+
+def score_ids(fields: SkillFields, query_lower: str) -> int:
+    """Score the id and alias matches of a skill's lowercased fields (see score_fields)."""
+    _, id_lower, aliases_lower, _, _, _ = fields
+    score = 0
+
+    # Exact id match
+    if id_lower == query_lower:
+        score += 100
+    # Prefix id match
+    elif id_lower.startswith(query_lower):
+        score += 40
+
+    # Alias matching
+    for alias_lower in aliases_lower:
+        if alias_lower == query_lower:
+            score += 100
+        elif alias_lower.startswith(query_lower):
+            score += 40
+
+    return score
+
+
+def score_fields(fields: SkillFields, query_lower: str, tokens: list[str]) -> int:
+    """Score a skill's lowercased fields (see skill_fields) against a tokenized query."""
+    _, _, _, title_lower, desc_lower, tags_lower = fields
+    score = score_ids(fields, query_lower)
+
+    # Token matching
+    for token in tokens:
+        # Tags
+        for tag in tags_lower:
+            if token in tag:
+                score += 20
+                break
+
+        # Title
+        if token in title_lower:
+            score += 10
+
+        # Description
+        if token in desc_lower:
+            score += 5
+
+    return score
+
+
+def suggest_stream(
+    skills: Iterable[Skill],
+    query: str,
+    limit: int = 10,
+    after: RankPosition | None = None,
+    tags: Sequence[str] = (),
+) -> list[ScoredSkill]:
+    """Suggest skills from a stream, keeping only the best `limit` in memory.
+
+    Produces the same results as Catalog.suggest.
+
+    Args:
+        skills: Skills to score, e.g. from iter_skills().
+        query: Search query.
+        limit: Maximum number of results.
+        after: Where the previous page of results ended.
+        tags: Only suggest skills having every one of these tags.
+
+    Returns:
+        List of scored skills, sorted by score descending.
+    """
+    query_lower, tokens = tokenize(query)
+    required = {tag.lower() for tag in tags}
+    matches = (
+        ScoredSkill(skill=skill, score=score)
+        for skill in skills
+        if (not required or required.issubset([tag.lower() for tag in skill.tags]))
+        and (score := score_skill(skill, query_lower, tokens)) > 0
+        and (after is None or not after.ranks_before(score, skill.id))
+    )
+    if after is None:
+        return heapq.nsmallest(limit, matches, key=lambda s: (-s.score, s.skill.id))
+    results = heapq.nsmallest(limit + after.repeats, matches, key=lambda s: (-s.score, s.skill.id))
+    return after.skip(results)[:limit]
+
+
+def iter_skills(catalog_path: Path, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Skill]:
+    """Stream skills from a catalog file one array element at a time.
+
+    Only the current element and a bounded read buffer are held in memory,
+    so peak memory does not grow with the catalog size. Invalid entries are
+    skipped exactly as Catalog.load does.
+
+    Args:
+        catalog_path: Path to catalog/skills.json, catalog/skills.jsonl or a
+            shard directory. Shards are streamed in order without the
+            duplicate ID check.
+        chunk_size: Number of characters to read at a time.
+
+    Yields:
+        Skills in catalog order.
+
+    Raises:
+        CatalogError: If catalog file is missing or invalid.
+    """
+    if not catalog_path.exists():
+        raise CatalogError(f"Catalog file not found: {catalog_path}")
+
+    if catalog_path.is_dir():
+        for shard in shard_files(catalog_path):
+            yield from iter_skills(shard, chunk_size)
+        return
+
+    if catalog_path.suffix == ".jsonl":
+        jsonl_table = InternTable()
+        with open(catalog_path, "rb") as jsonl_file:
+            for line_no, line in enumerate(jsonl_file, start=1):
+                skill = _skill_from_line(line, jsonl_table, line_no)
+                if skill is not None:
+                    yield skill
+        return
+
+    decoder = json.JSONDecoder()
+    table = InternTable()
+    with open(catalog_path, encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            """Append the next chunk to the buffer, dropping consumed text."""
+            nonlocal buf, pos, eof
+            chunk = f.read(max(chunk_size, len(buf) - pos))
+            buf = buf[pos:] + chunk
+            pos = 0
+            eof = not chunk
+            return not eof
+
+        def skip_ws() -> str:
+            """Skip whitespace and return the next character ("" at EOF)."""
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\n\r":
+                    pos += 1
+                if pos < len(buf):
+                    return buf[pos]
+                if not fill():
+                    return ""
+
+        def decode_value() -> object:
+            """Decode the JSON value at the current position."""
+            nonlocal pos
+            ch = skip_ws()
+            if ch not in ("{", "[", '"'):
+                # Scalars have no closing delimiter; make sure one is buffered
+                while _SCALAR_END.search(buf, pos) is None and fill():
+                    pass
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    # The value may just be cut off at the end of the buffer
+                    if eof or not fill():
+                        raise CatalogError(f"Invalid JSON in catalog: {e}") from e
+                    continue
+                pos = end
+                return value
+
+        if skip_ws() != "[":
+            # Not an array: let the regular loader produce the precise error
+            f.seek(0)
+            Catalog.loads(f.read())
+            raise CatalogError("Catalog must be a JSON array")
+        pos += 1
+
+        if skip_ws() == "]":
+            pos += 1
+        else:
+            while True:
+                item = decode_value()
+                skill = _skill_from_item(item, table)
+                if skill is not None:
+                    yield skill
+
+                ch = skip_ws()
+                pos += 1
+                if ch == "]":
+                    break
+                if ch != ",":
+                    raise CatalogError(
+                        f"Invalid JSON in catalog: expected ',' or ']', got {ch or 'end of file'!r}"
+                    )
+
+        if skip_ws() != "":
+            raise CatalogError("Invalid JSON in catalog: extra data after array")
+
+
+def shard_files(shard_dir: Path) -> list[Path]:
+    """List catalog shards (*.json) in a directory, in merge order."""
+    return sorted(p for p in shard_dir.glob("*.json") if p.is_file())
+
+
+def _load_shard(name: str, data: bytes, table: InternTable) -> list[Skill]:
+    """Parse one catalog shard, prefixing errors with the shard name."""
+    try:
+        items = json.loads(data)
+    except json.JSONDecodeError as e:
+        raise CatalogError(f"{name}: Invalid JSON in catalog: {e}") from None
+    if not isinstance(items, list):
+        raise CatalogError(f"{name}: Catalog must be a JSON array")
+    return [skill for item in items if (skill := _skill_from_item(item, table)) is not None]
+
+
+def _parse_shard(shard: tuple[str, bytes]) -> list[SkillRecord]:
+    """Parse one catalog shard into plain skill records.
+
+    Runs in pool workers; plain tuples pickle much faster than Skill objects.
+    """
+    name, data = shard
+    return [
+        (s.id, s.title, s.description, s.tags, s.paths, s.aliases)
+        for s in _load_shard(name, data, InternTable())
+    ]
+
+
+def _skill_from_line(line: bytes, table: InternTable, line_no: int) -> Skill | None:
+    """Build a Skill from one JSON Lines record; blank lines are skipped."""
+    if not line.strip():
+        return None
+    try:
+        item = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise CatalogError(f"Invalid JSON in catalog line {line_no}: {e}") from e
+    return _skill_from_item(item, table)
+
 
-        # Sort by score desc, then by id asc for stability
-        scored.sort(key=lambda s: (-s.score, s.skill.id))
+def _skill_from_item(item: object, table: InternTable) -> Skill | None:
+    """Build a Skill from a catalog entry, or None if the entry is unusable."""
+    if not isinstance(item, dict):
+        return None
+    if "id" not in item or "title" not in item:
+        return None
 
-        return scored[:limit]
+    return Skill(
+        id=item["id"],
+        title=item["title"],
+        description=item.get("description", ""),
+        tags=table.strings(item.get("tags")),
+        paths=tuple(paths) if isinstance(paths := item.get("paths"), list) else (),
+        aliases=table.strings(item.get("aliases")),
+    )
 
 
 class CatalogError(Exception):
@@ -5,18 +5,64 @@ from __future__ import annotations
 import argparse
 import sys
 
+from .catalog import FUZZY_DISTANCE, FUZZY_PENALTY, RANKER_V1, RANKERS
 from .commands import (
     cmd_catalog,
+    cmd_catalog_diff,
+    cmd_catalog_facets,
+    cmd_catalog_validate,
     cmd_doctor,
     cmd_install,
     cmd_remove,
     cmd_set,
     cmd_status,
     cmd_suggest,
+    cmd_suggest_batch,
     cmd_sync,
 )
 
 
+def _add_json_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the mutually exclusive --json and --ndjson options to a command."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--json", action="store_true", help="Output as JSON")
+    group.add_argument(
+        "--ndjson", action="store_true", help="Output one JSON object per line as produced"
+    )
+
+
+def _add_paging_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the mutually exclusive --offset and --cursor options to a command."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--offset",
+        type=_non_negative,
+        metavar="N",
+        help="Show the page starting after the first N results, with the next page's cursor",
+    )
+    group.add_argument("--cursor", help="Show the page a previous page's cursor points to")
+
+
+def _add_tag_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the repeatable --tag filter to a command."""
+    parser.add_argument(
+        "--tag",
+        action="append",
+        default=[],
+        dest="tags",
+        metavar="TAG",
+        help="Only include skills with this tag (repeatable: all tags must match)",
+    )
+
+
+def _non_negative(value: str) -> int:
+    """Parse a non-negative integer argument."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0: {value}")
+    return number
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for skillsctl CLI.
 
@@ -37,13 +83,79 @@ def main(argv: list[str] | None = None) -> int:
 
     # catalog command
     catalog_parser = subparsers.add_parser("catalog", help="List all available skills")
-    catalog_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    catalog_parser.add_argument(
+        "action",
+        nargs="?",
+        choices=["validate"],
+        help="'validate' checks the catalog and reports every problem",
+    )
+    _add_json_arguments(catalog_parser)
+    catalog_parser.add_argument(
+        "--stream", action="store_true", help="Stream the catalog instead of loading it"
+    )
+    catalog_parser.add_argument(
+        "--limit", type=_non_negative, help="Max skills, or skills per page (default: all)"
+    )
+    _add_paging_arguments(catalog_parser)
+    _add_tag_argument(catalog_parser)
+    catalog_parser.add_argument(
+        "--facets", action="store_true", help="Count the skills having each tag"
+    )
+    catalog_parser.add_argument(
+        "--diff",
+        metavar="REV..REV",
+        help="Show skills added, removed and changed between two submodule revisions",
+    )
 
     # suggest command
     suggest_parser = subparsers.add_parser("suggest", help="Suggest skills based on query")
-    suggest_parser.add_argument("query", help="Search query")
+    suggest_parser.add_argument("query", nargs="?", help="Search query")
     suggest_parser.add_argument("--limit", type=int, default=10, help="Max results")
-    suggest_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    _add_json_arguments(suggest_parser)
+    _add_tag_argument(suggest_parser)
+    suggest_parser.add_argument(
+        "--stream", action="store_true", help="Stream the catalog instead of loading it"
+    )
+    suggest_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help='Read {"query": ..., "limit": ...} lines from stdin, write NDJSON results',
+    )
+    suggest_parser.add_argument(
+        "--ranker",
+        choices=RANKERS,
+        default=RANKER_V1,
+        help="Scoring: fixed v1 weights (default) or BM25 term statistics",
+    )
+    suggest_parser.add_argument(
+        "--fuzzy",
+        type=int,
+        nargs="?",
+        const=FUZZY_DISTANCE,
+        default=0,
+        metavar="N",
+        help=f"Tolerate typos up to N edits (default N: {FUZZY_DISTANCE})",
+    )
+    suggest_parser.add_argument(
+        "--fuzzy-penalty",
+        type=int,
+        default=FUZZY_PENALTY,
+        metavar="P",
+        help=f"Points lost per edit in a fuzzy match (default: {FUZZY_PENALTY})",
+    )
+    _add_paging_arguments(suggest_parser)
+    suggest_parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="Show the points each field and token added, candidate counts and timings",
+    )
+    suggest_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Score large candidate sets in N processes (default: 1)",
+    )
 
     # install command
     install_parser = subparsers.add_parser("install", help="Install skills")
@@ -85,10 +197,70 @@ def main(argv: list[str] | None = None) -> int:
         return cmd_doctor()
     elif args.command == "status":
         return cmd_status(as_json=args.json)
+    elif args.command == "catalog" and (args.ndjson or args.tags) and (args.action or args.diff):
+        catalog_parser.error("--ndjson and --tag only apply to the skill listing and facets")
+    elif args.command == "catalog" and args.facets:
+        if args.action or args.diff or args.stream:
+            catalog_parser.error("--facets needs the loaded catalog")
+        if args.limit is not None or args.offset is not None or args.cursor is not None:
+            catalog_parser.error("--facets cannot be paged")
+        return cmd_catalog_facets(args.tags, as_json=args.json, ndjson=args.ndjson)
+    elif args.command == "catalog" and args.action == "validate":
+        return cmd_catalog_validate(as_json=args.json)
+    elif args.command == "catalog" and args.diff:
+        return cmd_catalog_diff(args.diff, as_json=args.json)
     elif args.command == "catalog":
-        return cmd_catalog(as_json=args.json)
+        return cmd_catalog(
+            as_json=args.json,
+            stream=args.stream,
+            limit=args.limit,
+            offset=args.offset,
+            cursor=args.cursor,
+            ndjson=args.ndjson,
+            tags=args.tags,
+        )
     elif args.command == "suggest":
-        return cmd_suggest(args.query, limit=args.limit, as_json=args.json)
+        if args.fuzzy < 0 or args.fuzzy_penalty < 1:
+            suggest_parser.error("--fuzzy must be >= 0 and --fuzzy-penalty >= 1")
+        if args.fuzzy and (args.stream or args.ranker != RANKER_V1):
+            suggest_parser.error("--fuzzy needs the search index and the v1 ranker")
+        if args.explain and (args.batch or args.stream or args.fuzzy or args.ranker != RANKER_V1):
+            suggest_parser.error("--explain needs one query, the search index and the v1 ranker")
+        if args.workers < 1:
+            suggest_parser.error("--workers must be >= 1")
+        if args.workers > 1 and (args.batch or args.stream or args.ranker != RANKER_V1):
+            suggest_parser.error("--workers needs one query, the search index and the v1 ranker")
+        if args.batch:
+            if args.offset is not None or args.cursor is not None:
+                suggest_parser.error("--batch cannot be paged")
+            if args.query is not None or args.stream:
+                suggest_parser.error("--batch reads queries from stdin and cannot be streamed")
+            return cmd_suggest_batch(
+                limit=args.limit,
+                ranker=args.ranker,
+                fuzzy=args.fuzzy,
+                fuzzy_penalty=args.fuzzy_penalty,
+                tags=args.tags,
+            )
+        if args.query is None:
+            suggest_parser.error("the following arguments are required: query")
+        if args.stream and args.ranker != RANKER_V1:
+            suggest_parser.error("--ranker bm25 needs catalog statistics and cannot be streamed")
+        return cmd_suggest(
+            args.query,
+            limit=args.limit,
+            as_json=args.json,
+            stream=args.stream,
+            ranker=args.ranker,
+            fuzzy=args.fuzzy,
+            fuzzy_penalty=args.fuzzy_penalty,
+            explain=args.explain,
+            offset=args.offset,
+            cursor=args.cursor,
+            ndjson=args.ndjson,
+            tags=args.tags,
+            workers=args.workers,
+        )
     elif args.command == "install":
         return cmd_install(args.ids, stage=args.stage, yes=args.yes)
     elif args.command == "remove":
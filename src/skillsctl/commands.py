@@ -3,15 +3,283 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import json
+import os
 import sys
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 
-from .catalog import Catalog, CatalogError, Skill
-from .config import Config, ConfigError
-from .git_ops import GitOps
+from .cache import (
+    cache_path_for,
+    find_catalog_object,
+    load_cached,
+    load_cached_object,
+    resolve_catalog_object,
+)
+from .catalog import (
+    CATALOG_FILE,
+    FUZZY_PENALTY,
+    JSONL_FILE,
+    RANKER_V1,
+    SHARD_DIR,
+    Catalog,
+    CatalogError,
+    RankPosition,
+    ScoredSkill,
+    Skill,
+    SuggestStats,
+    explain_score,
+    iter_skills,
+    shard_files,
+    suggest_stream,
+)
+from .config import Config, ConfigError, Source
+from .delta import CatalogDelta, diff_catalogs
+from .federation import FederatedCatalog, load_sources
+from .git_ops import GitError, GitOps
+from .index_cache import (
+    open_search_index,
+    search_index_current,
+    search_index_path_for,
+    write_search_index,
+)
+from .jsonl import index_path_for, open_jsonl
 from .manifest import Manifest
+from .paging import Cursor, CursorError, request_key
+from .result_cache import ResultCache, result_cache_dir_for
+from .validate import (
+    ValidationIssue,
+    load_verdict,
+    save_verdict,
+    validate_catalog,
+    verdict_path_for,
+)
+
+
+def catalog_file(project_root: Path, skills_dir: Path) -> Path:
+    """Get the catalog path inside the skills submodule's working tree.
+
+    Returns catalog/skills.json, or else the catalog/skills.d/ shard
+    directory or the catalog/skills.jsonl file, whichever exists first.
+    """
+    catalog_path = project_root / skills_dir / CATALOG_FILE
+    if catalog_path.exists():
+        return catalog_path
+    shard_dir = project_root / skills_dir / SHARD_DIR
+    if shard_dir.is_dir():
+        return shard_dir
+    jsonl_path = project_root / skills_dir / JSONL_FILE
+    if jsonl_path.exists():
+        return jsonl_path
+    return catalog_path
+
+
+def load_catalog(git: GitOps, skills_dir: Path, lazy: bool = False) -> Catalog | None:
+    """Load the catalog from the skills submodule.
+
+    The catalog is read from HEAD:catalog/skills.json (or the
+    HEAD:catalog/skills.d/ shard tree, or HEAD:catalog/skills.jsonl) in the
+    submodule's object database, so it is available even before
+    sparse-checkout has materialized it, and goes through the compiled cache
+    keyed by object SHA. When a persistent search index was written for the
+    same object (see update_search_index), the catalog is loaded lazily and
+    answers suggest() from that index. Without an object store (e.g. a plain
+    copy), the working tree is used instead.
+
+    A lazy load of a checked-out skills.jsonl skips both and reads single
+    lines through the ID/alias offset index instead.
+
+    Args:
+        git: Git operations for the project.
+        skills_dir: Submodule path relative to project root.
+        lazy: Decode skill fields on demand (for commands that only look up IDs).
+
+    Returns:
+        Catalog instance, or None if the catalog is not present.
+
+    Raises:
+        CatalogError: If catalog file is invalid.
+    """
+    git_dir = git.submodule_git_dir(skills_dir)
+    catalog_path = catalog_file(git.project_root, skills_dir)
+    if lazy and catalog_path.suffix == ".jsonl":
+        return open_jsonl(catalog_path, index_path_for(git_dir) if git_dir else None)
+
+    if git_dir is not None:
+        cache_path = cache_path_for(git_dir)
+        found = resolve_catalog_object(git, skills_dir, cache_path.parent)
+        if found is not None:
+            path_in_repo, sha = found
+
+            def build() -> Catalog:
+                return _build_catalog(git, skills_dir, path_in_repo, sha)
+
+            index = open_search_index(search_index_path_for(git_dir), sha)
+            with contextlib.suppress(GitError):
+                catalog = load_cached_object(sha, build, cache_path, lazy=lazy or index is not None)
+                if index is not None:
+                    catalog.use_search_index(index)
+                return catalog
+
+    if not catalog_path.exists():
+        return None
+    if git_dir is None or catalog_path.is_dir():
+        return Catalog.load(catalog_path)
+    return load_cached(catalog_path, cache_path_for(git_dir), lazy=lazy)
+
+
+def update_search_index(git: GitOps, skills_dir: Path) -> bool:
+    """Write the persistent search index for the submodule's HEAD catalog.
+
+    Nothing is written if the index already matches the catalog object.
+
+    Args:
+        git: Git operations for the project.
+        skills_dir: Submodule path relative to project root.
+
+    Returns:
+        True if an index for the current catalog is in place.
+
+    Raises:
+        CatalogError: If catalog data is invalid.
+    """
+    git_dir = git.submodule_git_dir(skills_dir)
+    if git_dir is None:
+        return False
+    cache_path = cache_path_for(git_dir)
+    found = resolve_catalog_object(git, skills_dir, cache_path.parent)
+    if found is None:
+        return False
+    path_in_repo, sha = found
+    index_path = search_index_path_for(git_dir)
+    if search_index_current(index_path, sha):
+        return True
+
+    def build() -> Catalog:
+        return _build_catalog(git, skills_dir, path_in_repo, sha)
+
+    try:
+        catalog = load_cached_object(sha, build, cache_path, lazy=True)
+        write_search_index(index_path, catalog.skills, sha)
+    except (GitError, OSError):
+        return False
+    return True
+
+
+def _update_search_indexes(ctx: CommandContext, sources: list[Source]) -> None:
+    """Refresh the persistent search index of each source, ignoring failures."""
+    for source in sources:
+        with contextlib.suppress(CatalogError):
+            update_search_index(ctx.git, Path(source.skills_dir))
+
+
+def load_federated_catalog(
+    git: GitOps,
+    config: Config,
+    lazy: bool = False,
+) -> FederatedCatalog | None:
+    """Load and federate the catalogs of all configured sources concurrently.
+
+    Args:
+        git: Git operations for the project.
+        config: Configuration listing the sources in precedence order.
+        lazy: Decode skill fields on demand (for commands that only look up IDs).
+
+    Returns:
+        FederatedCatalog instance, or None if no source has a catalog.
+
+    Raises:
+        CatalogError: If any source's catalog is invalid.
+    """
+    return load_sources(
+        config.sources,
+        lambda source: load_catalog(git, Path(source.skills_dir), lazy=lazy),
+    )
+
+
+def open_result_cache(git: GitOps, config: Config) -> ResultCache | None:
+    """Open the suggest result cache for the configured sources' catalogs.
+
+    The cache lives in the first source's submodule git directory and is
+    keyed on the HEAD catalog object of every source.
+
+    Returns:
+        ResultCache, or None if a source's catalog is not in a git object
+        store (so there is nothing to key results on).
+    """
+    shas: list[str] = []
+    git_dirs: list[Path] = []
+    for source in config.sources:
+        skills_dir = Path(source.skills_dir)
+        git_dir = git.submodule_git_dir(skills_dir)
+        if git_dir is None:
+            return None
+        found = resolve_catalog_object(git, skills_dir, cache_path_for(git_dir).parent)
+        if found is None:
+            return None
+        shas.append(found[1])
+        git_dirs.append(git_dir)
+    if not git_dirs:
+        return None
+    return ResultCache.for_objects(result_cache_dir_for(git_dirs[0]), shas)
+
+
+def catalog_key(git: GitOps, config: Config) -> str:
+    """Identify the current state of the configured sources' catalogs.
+
+    This is the result cache key when every catalog is in a git object
+    store, and otherwise a hash of the checked-out catalog files.
+    """
+    cache = open_result_cache(git, config)
+    if cache is not None:
+        return cache.catalog_key
+    digest = hashlib.sha256()
+    for source in config.sources:
+        path = catalog_file(git.project_root, Path(source.skills_dir))
+        files = shard_files(path) if path.is_dir() else [path]
+        for file in files:
+            digest.update(f"{file}\0".encode())
+            with contextlib.suppress(OSError):
+                digest.update(hashlib.sha256(file.read_bytes()).digest())
+    return digest.hexdigest()[:16]
+
+
+def iter_federated_skills(project_root: Path, config: Config) -> Iterator[Skill] | None:
+    """Stream the skills of all checked-out sources with first-wins precedence.
+
+    Only skill IDs are kept in memory to drop shadowed duplicates.
+
+    Returns:
+        Skill iterator, or None if no source has a checked-out catalog.
+    """
+    paths = [catalog_file(project_root, Path(source.skills_dir)) for source in config.sources]
+    paths = [path for path in paths if path.exists()]
+    if not paths:
+        return None
+    if len(paths) == 1:
+        return iter_skills(paths[0])
+
+    def generate() -> Iterator[Skill]:
+        seen: set[str] = set()
+        for path in paths:
+            for skill in iter_skills(path):
+                if skill.id not in seen:
+                    seen.add(skill.id)
+                    yield skill
+
+    return generate()
+
+
+def _build_catalog(git: GitOps, skills_dir: Path, path_in_repo: str, sha: str) -> Catalog:
+    """Parse a catalog object from the skills submodule's object database."""
+    if path_in_repo == SHARD_DIR:
+        return Catalog.loads_shards(git.read_tree_blobs(skills_dir, sha))
+    if path_in_repo == JSONL_FILE:
+        return Catalog.loads_jsonl(git.read_blob(skills_dir, sha))
+    return Catalog.loads(git.read_blob(skills_dir, sha))
 
 
 @dataclass
@@ -25,11 +293,18 @@ class CommandContext:
     manifest: Manifest
 
     @classmethod
-    def create(cls, require_config: bool = True) -> CommandContext:
+    def create(
+        cls,
+        require_config: bool = True,
+        with_catalog: bool = True,
+        lazy: bool = False,
+    ) -> CommandContext:
         """Create command context.
 
         Args:
             require_config: If True, raise error if config not found.
+            with_catalog: If False, skip loading the catalog (for streaming commands).
+            lazy: Load the catalog lazily (for commands that only look up IDs).
 
         Returns:
             CommandContext instance.
@@ -45,26 +320,101 @@ class CommandContext:
             with contextlib.suppress(ConfigError):
                 config = Config.load(project_root)
 
-        # Load catalog if config available
-        catalog: Catalog | None = None
-        if config:
-            skills_dir = project_root / config.skills_dir
-            catalog_path = skills_dir / "catalog" / "skills.json"
-            if catalog_path.exists():
-                with contextlib.suppress(CatalogError):
-                    catalog = Catalog.load(catalog_path)
-
         # Load manifest
         manifest_path = project_root / ".claude" / "skills.manifest"
         manifest = Manifest.load(manifest_path)
 
-        return cls(
+        ctx = cls(
             project_root=project_root,
             config=config,
             git=git,
-            catalog=catalog,
+            catalog=None,
             manifest=manifest,
         )
+        # Load catalog if config available
+        if with_catalog:
+            ctx.load_catalog(lazy=lazy)
+        return ctx
+
+    def load_catalog(self, lazy: bool = False) -> Catalog | None:
+        """Load the federated catalog into the context if config is available.
+
+        Args:
+            lazy: Load the catalog lazily (for commands that only look up IDs).
+
+        Returns:
+            The catalog, or None if there is none or it is invalid.
+        """
+        if self.config:
+            with contextlib.suppress(CatalogError):
+                self.catalog = load_federated_catalog(self.git, self.config, lazy=lazy)
+        return self.catalog
+
+
+def _setup_submodules(ctx: CommandContext, sources: list[Source]) -> bool:
+    """Add and initialize the submodules of sources not set up yet.
+
+    Returns:
+        False if setting up a submodule failed (the error is printed).
+    """
+    for source in sources:
+        skills_dir = Path(source.skills_dir)
+        if ctx.git.submodule_exists(skills_dir):
+            continue
+        print(f"Setting up skills submodule at {skills_dir}...")
+        try:
+            ctx.git.submodule_add(
+                url=source.repo_url,
+                path=skills_dir,
+                branch=source.branch,
+            )
+            ctx.git.submodule_init(skills_dir)
+            ctx.git.sparse_checkout_init(skills_dir)
+        except Exception as e:
+            print(f"Error setting up submodule: {e}", file=sys.stderr)
+            return False
+    return True
+
+
+def _check_clean(ctx: CommandContext, sources: list[Source]) -> bool:
+    """Check that no source submodule has uncommitted changes.
+
+    Returns:
+        False if one has (the error is printed).
+    """
+    for source in sources:
+        if ctx.git.submodule_is_dirty(Path(source.skills_dir)):
+            print(
+                "Error: Submodule has uncommitted changes. Commit or discard them first.",
+                file=sys.stderr,
+            )
+            return False
+    return True
+
+
+def _update_sparse_checkouts(ctx: CommandContext, sources: list[Source]) -> None:
+    """Check out the catalog and the installed skills' paths in each source.
+
+    A skill's paths are checked out in the source its ID resolves to.
+
+    Raises:
+        Exception: If git fails to update a sparse-checkout.
+    """
+    paths: dict[str, list[str]] = {source.name: ["catalog"] for source in sources}
+    primary = sources[0].name
+    if ctx.catalog:
+        for skill_id in ctx.manifest.skill_ids:
+            skill = ctx.catalog.get(skill_id)
+            if skill is None:
+                continue
+            owner = primary
+            if isinstance(ctx.catalog, FederatedCatalog):
+                owner = ctx.catalog.source_of(skill_id) or primary
+            if owner in paths:
+                paths[owner].extend(skill.paths)
+
+    for source in sources:
+        ctx.git.sparse_checkout_set(Path(source.skills_dir), paths[source.name])
 
 
 def cmd_doctor() -> int:
@@ -99,28 +449,33 @@ def cmd_doctor() -> int:
     print("\nConfiguration:")
     try:
         config = Config.load(project_root)
-        print(f"  ✓ Repo URL: {config.repo_url}")
-        print(f"  ✓ Branch: {config.branch}")
+        if len(config.sources) == 1:
+            print(f"  ✓ Repo URL: {config.repo_url}")
+            print(f"  ✓ Branch: {config.branch}")
+        else:
+            for source in config.sources:
+                print(f"  ✓ Source {source.name}: {source.repo_url} ({source.branch})")
     except ConfigError as e:
         print(f"  ❌ {e}")
         return 1
 
-    # Skills directory check
-    skills_dir = project_root / config.skills_dir
-    if skills_dir.exists():
-        print(f"\n  ✓ Skills directory exists: {config.skills_dir}")
+    # Skills directory check (one per source)
+    for source in config.sources:
+        skills_dir = project_root / source.skills_dir
+        if skills_dir.exists():
+            print(f"\n  ✓ Skills directory exists: {source.skills_dir}")
 
-        # Check if it's a submodule
-        if git.submodule_exists(Path(config.skills_dir)):
-            print("  ✓ Is a git submodule")
+            # Check if it's a submodule
+            if git.submodule_exists(Path(source.skills_dir)):
+                print("  ✓ Is a git submodule")
 
-            if git.submodule_is_dirty(Path(config.skills_dir)):
-                print("  ⚠ Submodule has uncommitted changes")
+                if git.submodule_is_dirty(Path(source.skills_dir)):
+                    print("  ⚠ Submodule has uncommitted changes")
+            else:
+                print("  ⚠ Not a git submodule")
         else:
-            print("  ⚠ Not a git submodule")
-    else:
-        print(f"\n  ⚠ Skills directory not found: {config.skills_dir}")
-        print("    Run 'skillsctl install <id>' to set up")
+            print(f"\n  ⚠ Skills directory not found: {source.skills_dir}")
+            print("    Run 'skillsctl install <id>' to set up")
 
     # Manifest check
     manifest_path = project_root / ".claude" / "skills.manifest"
@@ -152,14 +507,18 @@ def cmd_status(as_json: bool = False) -> int:
     manifest_path = project_root / ".claude" / "skills.manifest"
     manifest = Manifest.load(manifest_path)
 
-    # Check submodule
+    # Check each source's submodule; the first source's is "the" submodule
     submodule_present = False
     submodule_dirty = False
+    sources: list[dict[str, object]] = []
     if config:
-        skills_dir = Path(config.skills_dir)
-        submodule_present = git.submodule_exists(skills_dir)
-        if submodule_present:
-            submodule_dirty = git.submodule_is_dirty(skills_dir)
+        for number, source in enumerate(config.sources):
+            skills_dir = Path(source.skills_dir)
+            present = git.submodule_exists(skills_dir)
+            dirty = present and git.submodule_is_dirty(skills_dir)
+            sources.append({**source.to_dict(), "present": present, "dirty": dirty})
+            if number == 0:
+                submodule_present, submodule_dirty = present, dirty
 
     selected_ids = sorted(manifest.skill_ids)
 
@@ -168,6 +527,7 @@ def cmd_status(as_json: bool = False) -> int:
         "manifest_path": str(manifest_path),
         "submodule_present": submodule_present,
         "submodule_dirty": submodule_dirty,
+        "sources": sources,
         "git_version": git_status.git_version,
         "is_repo": git_status.is_repo,
     }
@@ -181,6 +541,12 @@ def cmd_status(as_json: bool = False) -> int:
         print(f"Is repository: {git_status.is_repo}")
         print(f"Submodule present: {submodule_present}")
         print(f"Submodule dirty: {submodule_dirty}")
+        print(f"\nSources ({len(sources)}):")
+        for entry in sources:
+            state = "dirty" if entry["dirty"] else "present" if entry["present"] else "missing"
+            print(f"  - {entry['name']}: {entry['skills_dir']} ({state})")
+        if not sources:
+            print("  (none)")
         print(f"\nInstalled skills ({len(selected_ids)}):")
         if selected_ids:
             for skill_id in selected_ids:
@@ -191,48 +557,113 @@ def cmd_status(as_json: bool = False) -> int:
     return 0
 
 
-def cmd_catalog(as_json: bool = False) -> int:
-    """List all available skills."""
+def cmd_catalog(
+    as_json: bool = False,
+    stream: bool = False,
+    limit: int | None = None,
+    offset: int | None = None,
+    cursor: str | None = None,
+    ndjson: bool = False,
+    tags: Sequence[str] = (),
+) -> int:
+    """List all available skills.
+
+    Given tags, only the skills having every one of them are listed (see
+    Catalog.with_tags). At most limit skills are listed. Given an offset or
+    a cursor, the listing is one page starting there, followed by the
+    cursor of the next page (JSON output becomes an object holding both,
+    NDJSON output ends with a line holding the cursor).
+
+    With ndjson, each skill is written as one JSON line as soon as it is
+    read, so with stream neither the catalog nor the output is held in memory.
+    """
     try:
-        ctx = CommandContext.create(require_config=True)
+        ctx = CommandContext.create(require_config=True, with_catalog=not stream)
     except ConfigError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    if ctx.catalog is None:
+    if not ctx.config:
+        print("Error: No configuration found", file=sys.stderr)
+        return 1
+
+    skills: Iterable[Skill] | None = None
+    count: int | None = None
+    if stream:
+        skills = iter_federated_skills(ctx.project_root, ctx.config)
+        if skills is not None and tags:
+            required = {tag.lower() for tag in tags}
+            skills = (s for s in skills if required.issubset([tag.lower() for tag in s.tags]))
+    elif ctx.catalog is not None:
+        skills = ctx.catalog.with_tags(tags)
+        count = len(skills)
+
+    if skills is None:
         print(
             "Error: Catalog not found. Run 'skillsctl sync' first.",
             file=sys.stderr,
         )
         return 1
 
-    skills = ctx.catalog.list_all()
+    if offset is None and cursor is None:
+        if limit is not None:
+            skills = islice(skills, limit)
+        try:
+            if ndjson:
+                _print_ndjson(s.to_dict() for s in skills)
+            elif as_json:
+                _print_json_array(s.to_dict() for s in skills)
+            else:
+                _print_catalog(skills, count)
+        except CatalogError as e:
+            print(f"\nError: {e}", file=sys.stderr)
+            return 1
+        return 0
 
-    if as_json:
-        print(json.dumps([s.to_dict() for s in skills], indent=2))
-    else:
-        print(f"Available skills ({len(skills)}):")
-        print("-" * 40)
-        for skill in skills:
-            tags = ", ".join(skill.tags) if skill.tags else "(no tags)"
-            print(f"\n{skill.id} — {skill.title}")
-            print(f"  tags: {tags}")
-            if skill.description:
-                # Truncate description to first line
-                desc = skill.description.split("\n")[0][:80]
-                print(f"  {desc}")
+    key = catalog_key(ctx.git, ctx.config)
+    request = request_key("catalog", sorted({tag.lower() for tag in tags}))
+    start = offset or 0
+    try:
+        if cursor is not None:
+            position = Cursor.decode(cursor)
+            position.check(key, request)
+            start = position.offset
+        # One skill past the page tells whether there is a next page
+        page = list(islice(skills, start, None if limit is None else start + limit + 1))
+    except (CursorError, CatalogError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
 
+    next_cursor: str | None = None
+    if limit is not None and len(page) > limit:
+        page = page[:limit]
+        next_cursor = Cursor(key, request, start + limit).encode()
+    if ndjson:
+        _print_ndjson(s.to_dict() for s in page)
+        _print_ndjson([{"offset": start, "next_cursor": next_cursor}])
+    elif as_json:
+        data = {"skills": [s.to_dict() for s in page], "offset": start, "next_cursor": next_cursor}
+        print(json.dumps(data, indent=2))
+    else:
+        _print_catalog(page, count)
+        _print_next_page(next_cursor)
     return 0
 
 
-def cmd_suggest(query: str, limit: int = 10, as_json: bool = False) -> int:
-    """Suggest skills based on query."""
+def cmd_catalog_facets(
+    tags: Sequence[str] = (), as_json: bool = False, ndjson: bool = False
+) -> int:
+    """Count the skills having each tag, among the skills having every one of tags."""
     try:
         ctx = CommandContext.create(require_config=True)
     except ConfigError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
+    if not ctx.config:
+        print("Error: No configuration found", file=sys.stderr)
+        return 1
+
     if ctx.catalog is None:
         print(
             "Error: Catalog not found. Run 'skillsctl sync' first.",
@@ -240,18 +671,384 @@ def cmd_suggest(query: str, limit: int = 10, as_json: bool = False) -> int:
         )
         return 1
 
-    results = ctx.catalog.suggest(query, limit=limit)
+    counts = ctx.catalog.facets(tags)
+    if ndjson:
+        _print_ndjson({"tag": tag, "count": count} for tag, count in counts.items())
+    elif as_json:
+        print(json.dumps(counts, indent=2))
+    else:
+        print(f"Tags ({len(counts)}):")
+        print("-" * 40)
+        width = max((len(tag) for tag in counts), default=0)
+        for tag, count in counts.items():
+            print(f"{tag:<{width}}  {count}")
+    return 0
+
+
+def cmd_catalog_diff(rev_range: str, as_json: bool = False) -> int:
+    """Show skills added, removed and changed between two catalog revisions.
+
+    Args:
+        rev_range: "<old>..<new>" revisions of the skills submodule; an
+            omitted side defaults to HEAD.
+        as_json: Output as JSON.
+    """
+    old_rev, sep, new_rev = rev_range.partition("..")
+    if not sep:
+        print(f"Error: Expected <rev>..<rev>, got '{rev_range}'", file=sys.stderr)
+        return 1
+    old_rev = old_rev or "HEAD"
+    new_rev = new_rev or "HEAD"
+
+    try:
+        ctx = CommandContext.create(require_config=True, with_catalog=False)
+    except ConfigError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not ctx.config:
+        print("Error: No configuration found", file=sys.stderr)
+        return 1
+
+    skills_dir = Path(ctx.config.skills_dir)
+    old_found = find_catalog_object(ctx.git, skills_dir, old_rev)
+    if old_found is None:
+        print(f"Error: No catalog found at revision '{old_rev}'", file=sys.stderr)
+        return 1
+    new_found = find_catalog_object(ctx.git, skills_dir, new_rev)
+    if new_found is None:
+        print(f"Error: No catalog found at revision '{new_rev}'", file=sys.stderr)
+        return 1
+
+    # Identical objects need no parsing at all
+    delta = CatalogDelta()
+    if old_found[1] != new_found[1]:
+        try:
+            old = _build_catalog(ctx.git, skills_dir, *old_found)
+            new = _build_catalog(ctx.git, skills_dir, *new_found)
+        except (CatalogError, GitError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        delta = diff_catalogs(old, new)
 
     if as_json:
-        print(json.dumps([r.to_dict() for r in results], indent=2))
+        result = {
+            "from": {"rev": old_rev, "object": old_found[1]},
+            "to": {"rev": new_rev, "object": new_found[1]},
+            **delta.to_dict(),
+        }
+        print(json.dumps(result, indent=2))
     else:
-        if not results:
-            print(f"No skills found matching '{query}'")
+        if delta.is_empty():
+            print(f"No catalog changes between {old_rev} and {new_rev}")
             return 0
 
-        print(f"Skills matching '{query}' ({len(results)} results):")
+        print(f"Catalog changes {old_rev}..{new_rev}:")
         print("-" * 40)
-        for scored in results:
+        for skill in delta.added:
+            print(f"+ {skill.id} — {skill.title}")
+        for skill in delta.removed:
+            print(f"- {skill.id} — {skill.title}")
+        for change in delta.changed:
+            print(f"~ {change.after.id} ({', '.join(change.fields)})")
+
+    return 0
+
+
+def cmd_catalog_validate(as_json: bool = False) -> int:
+    """Validate the catalog of every source, reporting all problems at once."""
+    try:
+        ctx = CommandContext.create(require_config=True, with_catalog=False)
+    except ConfigError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not ctx.config:
+        print("Error: No configuration found", file=sys.stderr)
+        return 1
+
+    results: list[tuple[Source, list[ValidationIssue]]] = []
+    for source in ctx.config.sources:
+        try:
+            issues = validate_source(ctx.git, Path(source.skills_dir))
+        except GitError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        if issues is None:
+            print(
+                f"Error: Catalog not found in {source.skills_dir}. Run 'skillsctl sync' first.",
+                file=sys.stderr,
+            )
+            return 1
+        results.append((source, issues))
+
+    valid = not any(issues for _, issues in results)
+    federated = len(results) > 1
+    if as_json:
+        errors = [
+            {"source": source.name, **issue.to_dict()}
+            for source, issues in results
+            for issue in issues
+        ]
+        print(json.dumps({"valid": valid, "errors": errors}, indent=2))
+    else:
+        for source, issues in results:
+            prefix = f"{source.name}: " if federated else ""
+            for issue in issues:
+                print(f"{prefix}{issue}")
+        count = sum(len(issues) for _, issues in results)
+        print("✓ Catalog is valid" if valid else f"\n❌ {count} problem(s) found")
+
+    return 0 if valid else 1
+
+
+def validate_source(git: GitOps, skills_dir: Path) -> list[ValidationIssue] | None:
+    """Validate a skills submodule's catalog, using the cached verdict if any.
+
+    Like load_catalog, the catalog is read from the submodule's HEAD in its
+    object store, falling back to the working tree. Verdicts are cached by
+    object SHA only, so working tree catalogs are validated every time.
+
+    Args:
+        git: Git operations for the project.
+        skills_dir: Submodule path relative to project root.
+
+    Returns:
+        Issues found (empty if valid), or None if the catalog is not present.
+
+    Raises:
+        GitError: If the catalog object cannot be read.
+    """
+    git_dir = git.submodule_git_dir(skills_dir)
+    if git_dir is not None:
+        found = resolve_catalog_object(git, skills_dir, cache_path_for(git_dir).parent)
+        if found is not None:
+            path_in_repo, sha = found
+            verdict_path = verdict_path_for(git_dir, sha)
+            cached = load_verdict(verdict_path)
+            if cached is not None:
+                return cached
+
+            if path_in_repo == SHARD_DIR:
+                files = [
+                    (f"{SHARD_DIR}/{name}", data)
+                    for name, data in git.read_tree_blobs(skills_dir, sha)
+                ]
+            else:
+                files = [(path_in_repo, git.read_blob(skills_dir, sha))]
+            issues = validate_catalog(files)
+            save_verdict(verdict_path, issues)
+            return issues
+
+    catalog_path = catalog_file(git.project_root, skills_dir)
+    if not catalog_path.exists():
+        return None
+    if catalog_path.is_dir():
+        shards = shard_files(catalog_path)
+        return validate_catalog([(f"{SHARD_DIR}/{p.name}", p.read_bytes()) for p in shards])
+    path_in_repo = catalog_path.relative_to(git.project_root / skills_dir).as_posix()
+    return validate_catalog([(path_in_repo, catalog_path.read_bytes())])
+
+
+def _print_catalog(skills: Iterable[Skill], count: int | None) -> None:
+    """Print catalog listing in human-readable form.
+
+    Args:
+        skills: Skills to print.
+        count: Number of skills, or None when streaming.
+    """
+    if count is None:
+        print("Available skills:")
+    else:
+        print(f"Available skills ({count}):")
+    print("-" * 40)
+    for skill in skills:
+        tags = ", ".join(skill.tags) if skill.tags else "(no tags)"
+        print(f"\n{skill.id} — {skill.title}")
+        print(f"  tags: {tags}")
+        if skill.description:
+            # Truncate description to first line
+            desc = skill.description.split("\n")[0][:80]
+            print(f"  {desc}")
+
+
+def _print_next_page(next_cursor: str | None) -> None:
+    """Print how to request the next page of a paged listing."""
+    if next_cursor is not None:
+        print(f"\nNext page: --cursor {next_cursor}")
+
+
+@contextlib.contextmanager
+def _stdout_reader_may_leave() -> Iterator[None]:
+    """Stop writing quietly if the reader of stdout goes away.
+
+    A pipe may be closed before the output ends (e.g. suggest --ndjson |
+    head -1). The rest of the output is then discarded: stdout is pointed
+    at devnull, so the flush at exit does not fail again.
+    """
+    try:
+        yield
+        sys.stdout.flush()
+    except BrokenPipeError:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+
+
+def _print_ndjson(items: Iterable[Mapping[str, object]]) -> None:
+    """Print items as JSON Lines, writing each one as soon as it is produced."""
+    with _stdout_reader_may_leave():
+        for item in items:
+            sys.stdout.write(json.dumps(item) + "\n")
+
+
+def _print_json_array(items: Iterable[Mapping[str, object]]) -> None:
+    """Print items as an indented JSON array, one element at a time.
+
+    Output is identical to print(json.dumps(list(items), indent=2)), but no
+    element is serialized before the previous one has been written.
+    """
+    with _stdout_reader_may_leave():
+        empty = True
+        for item in items:
+            sys.stdout.write("[\n" if empty else ",\n")
+            empty = False
+            element = json.dumps(item, indent=2)
+            sys.stdout.write("  " + element.replace("\n", "\n  "))
+        sys.stdout.write("[]\n" if empty else "\n]\n")
+
+
+def cmd_suggest(
+    query: str,
+    limit: int = 10,
+    as_json: bool = False,
+    stream: bool = False,
+    ranker: str = RANKER_V1,
+    fuzzy: int = 0,
+    fuzzy_penalty: int = FUZZY_PENALTY,
+    explain: bool = False,
+    offset: int | None = None,
+    cursor: str | None = None,
+    ndjson: bool = False,
+    tags: Sequence[str] = (),
+    workers: int = 1,
+) -> int:
+    """Suggest skills based on query, among the skills having every one of tags.
+
+    Results ranked from the catalog objects in the submodules are cached, so
+    a repeated query is answered without loading the catalog. With explain,
+    results are always ranked afresh and shown with the points each field
+    match added (see explain_score), the candidate counts and stage timings.
+
+    Given an offset or a cursor, one page of limit results is shown,
+    followed by the cursor of the next page (JSON output becomes an object
+    holding both). A cursor resumes the ranking after the previous page
+    (see RankPosition) instead of ranking the earlier pages again.
+
+    With ndjson, each result is written as one JSON line, followed by a
+    line holding the stats and next cursor, if any.
+
+    With workers > 1, large candidate sets are scored in that many processes
+    (see Catalog.suggest); the results are the same.
+    """
+    try:
+        ctx = CommandContext.create(require_config=True, with_catalog=False)
+    except ConfigError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not ctx.config:
+        print("Error: No configuration found", file=sys.stderr)
+        return 1
+
+    paged = offset is not None or cursor is not None
+    key = request = ""
+    start = offset or 0
+    after: RankPosition | None = None
+    if paged:
+        key = catalog_key(ctx.git, ctx.config)
+        penalty = fuzzy_penalty if fuzzy else None
+        required = sorted({tag.lower() for tag in tags})
+        request = request_key("suggest", query.lower(), ranker, fuzzy, penalty, required)
+    if cursor is not None:
+        try:
+            position = Cursor.decode(cursor)
+            position.check(key, request)
+        except CursorError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        start, after = position.offset, position.after
+    # Without a ranking position, an offset page is ranked with the pages before it
+    fetch = start + limit if after is None else limit
+
+    results: list[ScoredSkill] | None = None
+    stats = SuggestStats() if explain else None
+    if stream:
+        skills = iter_federated_skills(ctx.project_root, ctx.config)
+        if skills is not None:
+            try:
+                results = suggest_stream(skills, query, limit=fetch, after=after, tags=tags)
+            except CatalogError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 1
+    else:
+        cache = None if explain or after else open_result_cache(ctx.git, ctx.config)
+        if cache is not None:
+            results = cache.get(query, fetch, ranker, fuzzy, fuzzy_penalty, tags)
+        catalog = ctx.load_catalog() if results is None else None
+        if catalog is not None:
+            results = catalog.suggest(
+                query,
+                limit=fetch,
+                ranker=ranker,
+                fuzzy=fuzzy,
+                fuzzy_penalty=fuzzy_penalty,
+                stats=stats,
+                after=after,
+                tags=tags,
+                workers=workers,
+            )
+            if cache is not None:
+                cache.put(query, fetch, ranker, results, fuzzy, fuzzy_penalty, tags)
+
+    if results is None:
+        print(
+            "Error: Catalog not found. Run 'skillsctl sync' first.",
+            file=sys.stderr,
+        )
+        return 1
+
+    page = results if after is not None else results[start:]
+    next_cursor: str | None = None
+    if paged and limit > 0 and len(page) == limit:
+        position_after = RankPosition.after(results, after)
+        next_cursor = Cursor(key, request, start + limit, position_after).encode()
+    if as_json or ndjson:
+        items = (_suggest_item(scored, query, explain) for scored in page)
+        trailer: dict[str, object] = {}
+        if stats is not None:
+            trailer["stats"] = stats.to_dict()
+        if paged:
+            trailer["offset"] = start
+            trailer["next_cursor"] = next_cursor
+        if ndjson:
+            _print_ndjson(items)
+            if trailer:
+                _print_ndjson([trailer])
+        elif trailer:
+            print(json.dumps({"results": list(items), **trailer}, indent=2))
+        else:
+            _print_json_array(items)
+    else:
+        if not page:
+            print(f"No skills found matching '{query}'")
+        elif paged:
+            print(f"Skills matching '{query}' (results {start + 1}-{start + len(page)}):")
+            print("-" * 40)
+        else:
+            print(f"Skills matching '{query}' ({len(page)} results):")
+            print("-" * 40)
+        for scored in page:
             skill = scored.skill
             tags = ", ".join(skill.tags) if skill.tags else "(no tags)"
             print(f"\n{skill.id} — {skill.title} (score: {scored.score})")
@@ -259,6 +1056,98 @@ def cmd_suggest(query: str, limit: int = 10, as_json: bool = False) -> int:
             if skill.description:
                 desc = skill.description.split("\n")[0][:80]
                 print(f"  {desc}")
+            if stats is not None:
+                for contribution in explain_score(skill, query):
+                    print(f"    {contribution}")
+        if stats is not None:
+            _print_suggest_stats(stats)
+        _print_next_page(next_cursor)
+
+    return 0
+
+
+def _suggest_item(scored: ScoredSkill, query: str, explain: bool) -> dict[str, object]:
+    """Convert a result to its JSON object, with its score breakdown if explain."""
+    item: dict[str, object] = {**scored.to_dict()}
+    if explain:
+        item["explain"] = [c.to_dict() for c in explain_score(scored.skill, query)]
+    return item
+
+
+def _print_suggest_stats(stats: SuggestStats) -> None:
+    """Print the candidate counts and stage timings of an explained suggest."""
+    backend = ", vectorized" if stats.vectorized else ""
+    print(
+        f"\nCandidates: {stats.candidates} ({stats.scored} scored, {stats.pruned} pruned{backend})"
+    )
+    timings = ", ".join(f"{stage} {t * 1000:.2f} ms" for stage, t in stats.timings.items())
+    print(f"Timings: {timings}")
+
+
+def cmd_suggest_batch(
+    limit: int = 10,
+    ranker: str = RANKER_V1,
+    fuzzy: int = 0,
+    fuzzy_penalty: int = FUZZY_PENALTY,
+    tags: Sequence[str] = (),
+) -> int:
+    """Answer NDJSON queries from stdin with one loaded catalog.
+
+    Each input line is an object with a "query" and an optional "limit"
+    (defaulting to the --limit value). Each output line is an object with
+    the query and its "results", or an "error" for an unusable input line.
+    Output is flushed per line so callers can interleave requests and
+    responses over a pipe.
+
+    Queries run in a search-as-you-type session (see SuggestSession): a v1
+    query extending the previous one, such as the next keystroke of an
+    editor, only rescores the skills the previous one matched.
+    """
+    try:
+        ctx = CommandContext.create(require_config=True)
+    except ConfigError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not ctx.config:
+        print("Error: No configuration found", file=sys.stderr)
+        return 1
+
+    if ctx.catalog is None:
+        print(
+            "Error: Catalog not found. Run 'skillsctl sync' first.",
+            file=sys.stderr,
+        )
+        return 1
+
+    session = ctx.catalog.session()
+    for line_no, line in enumerate(sys.stdin, 1):
+        if not line.strip():
+            continue
+        response: dict[str, object]
+        try:
+            request = json.loads(line)
+            query = request["query"]
+            query_limit = request.get("limit", limit)
+            if not isinstance(query, str) or not isinstance(query_limit, int):
+                raise TypeError("'query' must be a string and 'limit' an integer")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            response = {"line": line_no, "error": f"Invalid request: {e}"}
+        else:
+            if ranker == RANKER_V1 and not fuzzy and not tags:
+                results = session.suggest(query, limit=query_limit)
+            else:
+                results = ctx.catalog.suggest(
+                    query,
+                    limit=query_limit,
+                    ranker=ranker,
+                    fuzzy=fuzzy,
+                    fuzzy_penalty=fuzzy_penalty,
+                    tags=tags,
+                )
+            response = {"query": query, "results": [r.to_dict() for r in results]}
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
 
     return 0
 
@@ -270,7 +1159,7 @@ def cmd_install(
 ) -> int:
     """Install skills."""
     try:
-        ctx = CommandContext.create(require_config=True)
+        ctx = CommandContext.create(require_config=True, lazy=True)
     except ConfigError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -279,46 +1168,32 @@ def cmd_install(
         print("Error: No configuration found", file=sys.stderr)
         return 1
 
-    skills_dir = Path(ctx.config.skills_dir)
+    sources = ctx.config.sources
 
-    # Check if submodule exists, if not create it
-    if not ctx.git.submodule_exists(skills_dir):
-        print(f"Setting up skills submodule at {skills_dir}...")
-        try:
-            ctx.git.submodule_add(
-                url=ctx.config.repo_url,
-                path=skills_dir,
-                branch=ctx.config.branch,
-            )
-            ctx.git.submodule_init(skills_dir)
-            ctx.git.sparse_checkout_init(skills_dir)
-        except Exception as e:
-            print(f"Error setting up submodule: {e}", file=sys.stderr)
-            return 1
+    # Check if submodules exist, if not create them
+    if not _setup_submodules(ctx, sources):
+        return 1
 
-    # Check for dirty submodule
-    if ctx.git.submodule_is_dirty(skills_dir):
-        print(
-            "Error: Submodule has uncommitted changes. Commit or discard them first.",
-            file=sys.stderr,
-        )
+    # Check for dirty submodules
+    if not _check_clean(ctx, sources):
         return 1
 
     # Reload catalog after submodule setup
-    catalog_path = ctx.project_root / skills_dir / "catalog" / "skills.json"
-    if catalog_path.exists():
-        ctx.catalog = Catalog.load(catalog_path)
+    catalog = load_federated_catalog(ctx.git, ctx.config, lazy=True)
+    if catalog is not None:
+        ctx.catalog = catalog
 
     if ctx.catalog is None:
         print("Error: Catalog not found in skills repository", file=sys.stderr)
         return 1
 
-    # Validate skill IDs
+    # Validate skill IDs (aliases resolve to their canonical ID)
     valid_ids: list[str] = []
     invalid_ids: list[str] = []
     for skill_id in ids:
-        if ctx.catalog.get(skill_id):
-            valid_ids.append(skill_id)
+        skill = ctx.catalog.get(skill_id)
+        if skill:
+            valid_ids.append(skill.id)
         else:
             invalid_ids.append(skill_id)
 
@@ -330,7 +1205,7 @@ def cmd_install(
     skills_to_install: list[Skill] = []
     for skill_id in valid_ids:
         if not ctx.manifest.contains(skill_id):
-            skill = ctx.catalog.get(skill_id)
+            skill = ctx.catalog.get_by_id(skill_id)
             if skill:
                 skills_to_install.append(skill)
                 ctx.manifest.add(skill_id)
@@ -349,19 +1224,13 @@ def cmd_install(
             print("Aborted.")
             return 1
 
-    # Collect all paths for sparse-checkout
-    all_paths = ["catalog"]  # Always include catalog
-    for skill_id in ctx.manifest.skill_ids:
-        skill = ctx.catalog.get(skill_id)
-        if skill:
-            all_paths.extend(skill.paths)
-
-    # Update sparse-checkout
+    # Update sparse-checkout (always including the catalog)
     try:
-        ctx.git.sparse_checkout_set(skills_dir, all_paths)
+        _update_sparse_checkouts(ctx, sources)
     except Exception as e:
         print(f"Error updating sparse-checkout: {e}", file=sys.stderr)
         return 1
+    _update_search_indexes(ctx, sources)
 
     # Save manifest
     manifest_path = ctx.project_root / ".claude" / "skills.manifest"
@@ -375,7 +1244,7 @@ def cmd_install(
     if stage:
         files_to_stage = [
             Path(".gitmodules"),
-            skills_dir,
+            *(Path(source.skills_dir) for source in sources),
             Path(".claude/skills.manifest"),
         ]
         ctx.git.stage_files(files_to_stage)
@@ -391,7 +1260,7 @@ def cmd_remove(
 ) -> int:
     """Remove skills."""
     try:
-        ctx = CommandContext.create(require_config=True)
+        ctx = CommandContext.create(require_config=True, lazy=True)
     except ConfigError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -400,22 +1269,23 @@ def cmd_remove(
         print("Error: No configuration found", file=sys.stderr)
         return 1
 
-    skills_dir = Path(ctx.config.skills_dir)
+    sources = ctx.config.sources
 
-    # Check for dirty submodule
-    if ctx.git.submodule_is_dirty(skills_dir):
-        print(
-            "Error: Submodule has uncommitted changes. Commit or discard them first.",
-            file=sys.stderr,
-        )
+    # Check for dirty submodules
+    if not _check_clean(ctx, sources):
         return 1
 
-    # Check which skills are installed
+    # Check which skills are installed (aliases resolve to their canonical ID)
     skills_to_remove: list[str] = []
     not_installed: list[str] = []
     for skill_id in ids:
+        if not ctx.manifest.contains(skill_id) and ctx.catalog is not None:
+            skill = ctx.catalog.get_by_alias(skill_id)
+            if skill is not None:
+                skill_id = skill.id
         if ctx.manifest.contains(skill_id):
-            skills_to_remove.append(skill_id)
+            if skill_id not in skills_to_remove:
+                skills_to_remove.append(skill_id)
         else:
             not_installed.append(skill_id)
 
@@ -442,20 +1312,11 @@ def cmd_remove(
 
     # Reload catalog for paths
     if ctx.catalog is None:
-        catalog_path = ctx.project_root / skills_dir / "catalog" / "skills.json"
-        if catalog_path.exists():
-            ctx.catalog = Catalog.load(catalog_path)
+        ctx.catalog = load_federated_catalog(ctx.git, ctx.config, lazy=True)
 
     # Update sparse-checkout with remaining skills
-    all_paths = ["catalog"]
-    if ctx.catalog:
-        for skill_id in ctx.manifest.skill_ids:
-            skill = ctx.catalog.get(skill_id)
-            if skill:
-                all_paths.extend(skill.paths)
-
     try:
-        ctx.git.sparse_checkout_set(skills_dir, all_paths)
+        _update_sparse_checkouts(ctx, sources)
     except Exception as e:
         print(f"Error updating sparse-checkout: {e}", file=sys.stderr)
         return 1
@@ -471,7 +1332,7 @@ def cmd_remove(
     # Stage files if requested
     if stage:
         files_to_stage = [
-            skills_dir,
+            *(Path(source.skills_dir) for source in sources),
             Path(".claude/skills.manifest"),
         ]
         ctx.git.stage_files(files_to_stage)
@@ -487,7 +1348,7 @@ def cmd_set(
 ) -> int:
     """Set exact skill list."""
     try:
-        ctx = CommandContext.create(require_config=True)
+        ctx = CommandContext.create(require_config=True, lazy=True)
     except ConfigError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -496,46 +1357,32 @@ def cmd_set(
         print("Error: No configuration found", file=sys.stderr)
         return 1
 
-    skills_dir = Path(ctx.config.skills_dir)
+    sources = ctx.config.sources
 
-    # Check for dirty submodule
-    if ctx.git.submodule_is_dirty(skills_dir):
-        print(
-            "Error: Submodule has uncommitted changes. Commit or discard them first.",
-            file=sys.stderr,
-        )
+    # Check for dirty submodules
+    if not _check_clean(ctx, sources):
         return 1
 
-    # Check if submodule exists, if not create it
-    if not ctx.git.submodule_exists(skills_dir):
-        print(f"Setting up skills submodule at {skills_dir}...")
-        try:
-            ctx.git.submodule_add(
-                url=ctx.config.repo_url,
-                path=skills_dir,
-                branch=ctx.config.branch,
-            )
-            ctx.git.submodule_init(skills_dir)
-            ctx.git.sparse_checkout_init(skills_dir)
-        except Exception as e:
-            print(f"Error setting up submodule: {e}", file=sys.stderr)
-            return 1
+    # Check if submodules exist, if not create them
+    if not _setup_submodules(ctx, sources):
+        return 1
 
     # Reload catalog
-    catalog_path = ctx.project_root / skills_dir / "catalog" / "skills.json"
-    if catalog_path.exists():
-        ctx.catalog = Catalog.load(catalog_path)
+    catalog = load_federated_catalog(ctx.git, ctx.config, lazy=True)
+    if catalog is not None:
+        ctx.catalog = catalog
 
     if ctx.catalog is None:
         print("Error: Catalog not found in skills repository", file=sys.stderr)
         return 1
 
-    # Validate skill IDs
+    # Validate skill IDs (aliases resolve to their canonical ID)
     valid_ids: list[str] = []
     invalid_ids: list[str] = []
     for skill_id in ids:
-        if ctx.catalog.get(skill_id):
-            valid_ids.append(skill_id)
+        skill = ctx.catalog.get(skill_id)
+        if skill:
+            valid_ids.append(skill.id)
         else:
             invalid_ids.append(skill_id)
 
@@ -572,17 +1419,12 @@ def cmd_set(
     ctx.manifest.set_skills(new_set)
 
     # Update sparse-checkout
-    all_paths = ["catalog"]
-    for skill_id in ctx.manifest.skill_ids:
-        skill = ctx.catalog.get(skill_id)
-        if skill:
-            all_paths.extend(skill.paths)
-
     try:
-        ctx.git.sparse_checkout_set(skills_dir, all_paths)
+        _update_sparse_checkouts(ctx, sources)
     except Exception as e:
         print(f"Error updating sparse-checkout: {e}", file=sys.stderr)
         return 1
+    _update_search_indexes(ctx, sources)
 
     # Save manifest
     manifest_path = ctx.project_root / ".claude" / "skills.manifest"
@@ -600,7 +1442,7 @@ def cmd_set(
     if stage:
         files_to_stage = [
             Path(".gitmodules"),
-            skills_dir,
+            *(Path(source.skills_dir) for source in sources),
             Path(".claude/skills.manifest"),
         ]
         ctx.git.stage_files(files_to_stage)
@@ -612,7 +1454,7 @@ def cmd_set(
 def cmd_sync(stage: bool = False) -> int:
     """Sync skills from manifest."""
     try:
-        ctx = CommandContext.create(require_config=True)
+        ctx = CommandContext.create(require_config=True, lazy=True)
     except ConfigError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -621,45 +1463,42 @@ def cmd_sync(stage: bool = False) -> int:
         print("Error: No configuration found", file=sys.stderr)
         return 1
 
-    skills_dir = Path(ctx.config.skills_dir)
-
-    # Initialize submodule if needed
-    if not ctx.git.submodule_exists(skills_dir):
+    # Only sources whose submodule has been added can be synced
+    sources = [
+        source for source in ctx.config.sources if ctx.git.submodule_exists(Path(source.skills_dir))
+    ]
+    if not sources:
         print("Submodule not found. Nothing to sync.")
         return 0
 
-    # Initialize/update submodule
+    # Initialize/update submodules
     print("Updating submodule...")
-    try:
-        ctx.git.submodule_init(skills_dir)
-    except Exception as e:
-        print(f"Error updating submodule: {e}", file=sys.stderr)
-        return 1
+    for source in sources:
+        skills_dir = Path(source.skills_dir)
+        try:
+            ctx.git.submodule_init(skills_dir)
+        except Exception as e:
+            print(f"Error updating submodule: {e}", file=sys.stderr)
+            return 1
 
-    # Initialize sparse-checkout if needed
-    submodule_path = ctx.project_root / skills_dir
-    sparse_file = submodule_path / ".git" / "info" / "sparse-checkout"
-    if not sparse_file.exists():
-        ctx.git.sparse_checkout_init(skills_dir)
+        # Initialize sparse-checkout if needed
+        submodule_path = ctx.project_root / skills_dir
+        sparse_file = submodule_path / ".git" / "info" / "sparse-checkout"
+        if not sparse_file.exists():
+            ctx.git.sparse_checkout_init(skills_dir)
 
     # Reload catalog
-    catalog_path = ctx.project_root / skills_dir / "catalog" / "skills.json"
-    if catalog_path.exists():
-        ctx.catalog = Catalog.load(catalog_path)
+    catalog = load_federated_catalog(ctx.git, ctx.config, lazy=True)
+    if catalog is not None:
+        ctx.catalog = catalog
 
     # Update sparse-checkout from manifest
-    all_paths = ["catalog"]
-    if ctx.catalog:
-        for skill_id in ctx.manifest.skill_ids:
-            skill = ctx.catalog.get(skill_id)
-            if skill:
-                all_paths.extend(skill.paths)
-
     try:
-        ctx.git.sparse_checkout_set(skills_dir, all_paths)
+        _update_sparse_checkouts(ctx, sources)
     except Exception as e:
         print(f"Error updating sparse-checkout: {e}", file=sys.stderr)
         return 1
+    _update_search_indexes(ctx, sources)
 
     print(f"\n✓ Synced {len(ctx.manifest.skill_ids)} skill(s)")
     for skill_id in sorted(ctx.manifest.skill_ids):
@@ -667,9 +1506,7 @@ def cmd_sync(stage: bool = False) -> int:
 
     # Stage files if requested
     if stage:
-        files_to_stage = [
-            skills_dir,
-        ]
+        files_to_stage = [Path(source.skills_dir) for source in sources]
         ctx.git.stage_files(files_to_stage)
         print("\n✓ Changes staged")
 
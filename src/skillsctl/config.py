@@ -4,20 +4,66 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Self
+from typing import Any, Self
+
+
+@dataclass
+class Source:
+    """A skills repository contributing to the catalog."""
+
+    name: str
+    repo_url: str
+    branch: str = "main"
+    skills_dir: str = ".claude/skills"
+
+    @classmethod
+    def from_dict(cls, data: Any) -> Self:
+        """Create a source from a skills.config.json "sources" entry.
+
+        Raises:
+            ConfigError: If the entry has no name or repo_url.
+        """
+        if not isinstance(data, dict) or not data.get("name") or not data.get("repo_url"):
+            raise ConfigError("Each entry in 'sources' needs 'name' and 'repo_url' fields.")
+        name = str(data["name"])
+        return cls(
+            name=name,
+            repo_url=str(data["repo_url"]),
+            branch=str(data.get("branch", "main")),
+            skills_dir=str(data.get("skills_dir", f".claude/skills/{name}")),
+        )
+
+    def to_dict(self) -> dict[str, str]:
+        """Convert source to dictionary."""
+        return {
+            "name": self.name,
+            "repo_url": self.repo_url,
+            "branch": self.branch,
+            "skills_dir": self.skills_dir,
+        }
 
 
 @dataclass
 class Config:
-    """Configuration for skillsctl."""
+    """Configuration for skillsctl.
+
+    repo_url, branch and skills_dir describe the first (highest precedence)
+    source; sources lists every source in precedence order.
+    """
 
     repo_url: str
     branch: str = "main"
     skills_dir: str = ".claude/skills"
     manifest_path: str = ".claude/skills.manifest"
     config_path: str = ".claude/skills.config.json"
+    sources: list[Source] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        """Default to a single source built from repo_url."""
+        if not self.sources:
+            self.sources = [Source("default", self.repo_url, self.branch, self.skills_dir)]
 
     @classmethod
     def load(cls, project_root: Path | None = None) -> Self:
@@ -27,6 +73,11 @@ class Config:
         1. Environment variables (SKILLS_REPO_URL, SKILLS_REPO_BRANCH)
         2. Project config file (.claude/skills.config.json)
 
+        A "sources" list in the config file federates several skills
+        repositories, earlier entries taking precedence on conflicting skill
+        IDs. Each source is checked out at .claude/skills/<name> unless it
+        sets skills_dir. Environment variables do not apply to sources.
+
         Args:
             project_root: Project root directory. If None, uses current directory.
 
@@ -34,7 +85,7 @@ class Config:
             Config instance.
 
         Raises:
-            ConfigError: If no repo URL is configured.
+            ConfigError: If no repo URL is configured or sources are invalid.
         """
         if project_root is None:
             project_root = Path.cwd()
@@ -45,10 +96,14 @@ class Config:
 
         # Try to load from project config
         config_file = project_root / ".claude" / "skills.config.json"
+        data: dict[str, Any] = {}
         if config_file.exists():
             try:
                 with open(config_file) as f:
-                    data = json.load(f)
+                    loaded = json.load(f)
+                # Like invalid JSON, content other than an object is ignored
+                if isinstance(loaded, dict):
+                    data = loaded
                 if not repo_url and "repo_url" in data:
                     repo_url = data["repo_url"]
                 if "branch" in data:
@@ -56,6 +111,20 @@ class Config:
             except (json.JSONDecodeError, OSError):
                 pass  # Ignore invalid config file
 
+        if isinstance(data.get("sources"), list) and data["sources"]:
+            sources = [Source.from_dict(item) for item in data["sources"]]
+            names = [source.name for source in sources]
+            duplicates = sorted({name for name in names if names.count(name) > 1})
+            if duplicates:
+                raise ConfigError(f"Duplicate source names: {', '.join(duplicates)}")
+            primary = sources[0]
+            return cls(
+                repo_url=primary.repo_url,
+                branch=primary.branch,
+                skills_dir=primary.skills_dir,
+                sources=sources,
+            )
+
         if not repo_url:
             raise ConfigError(
                 "No skills repository URL configured.\n"
@@ -75,10 +144,12 @@ class Config:
         config_dir.mkdir(parents=True, exist_ok=True)
 
         config_file = config_dir / "skills.config.json"
-        data = {
+        data: dict[str, object] = {
             "repo_url": self.repo_url,
             "branch": self.branch,
         }
+        if len(self.sources) > 1:
+            data = {"sources": [source.to_dict() for source in self.sources]}
 
         with open(config_file, "w") as f:
             json.dump(data, f, indent=2)
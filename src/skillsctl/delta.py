@@ -0,0 +1,83 @@
+"""Catalog revision deltas for skillsctl.
+
+Compares two catalogs skill by skill so that consumers holding state
+derived from one revision (caches, sparse path sets, agent indexes) can
+update only the skills that changed when the submodule moves to another.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .catalog import Catalog, Skill
+
+SKILL_FIELDS = ("title", "description", "tags", "paths", "aliases")
+
+
+@dataclass(frozen=True, slots=True)
+class SkillChange:
+    """A skill present in both revisions with different content."""
+
+    before: Skill
+    after: Skill
+    fields: tuple[str, ...]
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert change to dictionary."""
+        return {
+            "id": self.after.id,
+            "fields": list(self.fields),
+            "before": self.before.to_dict(),
+            "after": self.after.to_dict(),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogDelta:
+    """Skills added, removed and changed between two catalog revisions."""
+
+    added: list[Skill] = field(default_factory=list)
+    removed: list[Skill] = field(default_factory=list)
+    changed: list[SkillChange] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """Check if both revisions hold the same skills."""
+        return not (self.added or self.removed or self.changed)
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert delta to dictionary."""
+        return {
+            "added": [s.to_dict() for s in self.added],
+            "removed": [s.to_dict() for s in self.removed],
+            "changed": [c.to_dict() for c in self.changed],
+        }
+
+
+def diff_catalogs(old: Catalog, new: Catalog) -> CatalogDelta:
+    """Compare two catalogs by skill ID.
+
+    Args:
+        old: Catalog at the base revision.
+        new: Catalog at the target revision.
+
+    Returns:
+        CatalogDelta with added and changed skills in new catalog order and
+        removed skills in old catalog order.
+    """
+    old_skills = old.list_all()
+    new_skills = new.list_all()
+    old_by_id = {skill.id: skill for skill in old_skills}
+    new_ids = {skill.id for skill in new_skills}
+
+    delta = CatalogDelta()
+    for skill in new_skills:
+        before = old_by_id.get(skill.id)
+        if before is None:
+            delta.added.append(skill)
+        elif before != skill:
+            fields = tuple(
+                name for name in SKILL_FIELDS if getattr(before, name) != getattr(skill, name)
+            )
+            delta.changed.append(SkillChange(before, skill, fields))
+    delta.removed.extend(skill for skill in old_skills if skill.id not in new_ids)
+    return delta
@@ -0,0 +1,168 @@
+"""Catalog federation across several skills repositories.
+
+Each configured source is a separate skills submodule with its own catalog.
+FederatedCatalog presents them as one catalog: sources are consulted in
+configuration order and the first source defining a skill ID wins, so a
+team repository listed before a vendor repository can override vendor skills.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from .catalog import (
+    FUZZY_PENALTY,
+    RANKER_V1,
+    Catalog,
+    RankPosition,
+    ScoredSkill,
+    Skill,
+    SuggestSession,
+    SuggestStats,
+)
+from .config import Source
+from .index import TagIndex
+
+
+class FederatedCatalog(Catalog):
+    """Catalog merged from per-source catalogs with first-wins precedence.
+
+    get() asks each source in turn (for IDs, then for aliases), so lazy
+    member catalogs stay lazy; list_all() and suggest() see the merged
+    skill list. With a single source, suggest() is answered by its catalog,
+    which may use a persistent search index.
+    """
+
+    def __init__(self, members: Sequence[tuple[str, Catalog]]) -> None:
+        """Initialize from (source name, catalog) pairs in precedence order."""
+        self._members = list(members)
+        self._all: list[Skill] | None = None
+        self._shadowed: list[tuple[str, str]] = []
+
+    @property
+    def skills(self) -> list[Skill]:
+        """All skills, source by source, without shadowed duplicates."""
+        if self._all is None:
+            self._all = self._merge()
+        return self._all
+
+    @property
+    def shadowed(self) -> list[tuple[str, str]]:
+        """(skill ID, source name) pairs hidden by a higher-precedence source."""
+        if self._all is None:
+            self._all = self._merge()
+        return self._shadowed
+
+    def get_by_id(self, skill_id: str) -> Skill | None:
+        """Get skill by ID from the first source that defines it."""
+        for _, catalog in self._members:
+            skill = catalog.get_by_id(skill_id)
+            if skill is not None:
+                return skill
+        return None
+
+    def get_by_alias(self, alias: str) -> Skill | None:
+        """Get skill by alias from the first source that defines it."""
+        for _, catalog in self._members:
+            skill = catalog.get_by_alias(alias)
+            if skill is not None:
+                return skill
+        return None
+
+    def suggest(
+        self,
+        query: str,
+        limit: int = 10,
+        ranker: str = RANKER_V1,
+        fuzzy: int = 0,
+        fuzzy_penalty: int = FUZZY_PENALTY,
+        stats: SuggestStats | None = None,
+        after: RankPosition | None = None,
+        tags: Sequence[str] = (),
+        workers: int = 1,
+    ) -> list[ScoredSkill]:
+        """Suggest skills from all sources (see Catalog.suggest)."""
+        suggest = self._members[0][1].suggest if len(self._members) == 1 else super().suggest
+        return suggest(
+            query,
+            limit=limit,
+            ranker=ranker,
+            fuzzy=fuzzy,
+            fuzzy_penalty=fuzzy_penalty,
+            stats=stats,
+            after=after,
+            tags=tags,
+            workers=workers,
+        )
+
+    @property
+    def tag_index(self) -> TagIndex:
+        """Per-tag skill bitmaps (see Catalog.tag_index)."""
+        if len(self._members) == 1:
+            return self._members[0][1].tag_index
+        return super().tag_index
+
+    def session(self) -> SuggestSession:
+        """Start a search-as-you-type session (see Catalog.session)."""
+        if len(self._members) == 1:
+            return self._members[0][1].session()
+        return super().session()
+
+    def source_of(self, skill_id: str) -> str | None:
+        """Get the name of the source a skill ID resolves to."""
+        for name, catalog in self._members:
+            if catalog.get_by_id(skill_id) is not None:
+                return name
+        return None
+
+    def _merge(self) -> list[Skill]:
+        """Merge member skill lists, recording shadowed duplicates."""
+        if len(self._members) == 1:
+            return self._members[0][1].skills
+        seen: set[str] = set()
+        merged: list[Skill] = []
+        for name, catalog in self._members:
+            for skill in catalog.skills:
+                if skill.id in seen:
+                    self._shadowed.append((skill.id, name))
+                else:
+                    seen.add(skill.id)
+                    merged.append(skill)
+        return merged
+
+
+def load_sources(
+    sources: Sequence[Source],
+    load: Callable[[Source], Catalog | None],
+) -> FederatedCatalog | None:
+    """Load every source's catalog concurrently and federate them.
+
+    Loading is dominated by git subprocesses and file reads, so sources are
+    loaded on threads; a single source is loaded inline.
+
+    Args:
+        sources: Sources in precedence order.
+        load: Loads one source's catalog, or returns None if it is absent.
+
+    Returns:
+        FederatedCatalog over the sources that have a catalog, or None if
+        none has.
+
+    Raises:
+        CatalogError: If any source's catalog is invalid.
+    """
+    if len(sources) == 1:
+        catalogs = [load(sources[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            catalogs = list(executor.map(load, sources))
+
+    members = [
+        (source.name, catalog)
+        for source, catalog in zip(sources, catalogs, strict=True)
+        if catalog is not None
+    ]
+    if not members:
+        return None
+    return FederatedCatalog(members)
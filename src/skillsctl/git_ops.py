@@ -158,6 +158,175 @@ class GitOps:
         )
         return bool(result.stdout.strip())
 
+    def submodule_git_dir(self, path: Path) -> Path | None:
+        """Resolve the git directory of a submodule without spawning git.
+
+        Submodules normally have a `.git` file pointing into the superproject's
+        `.git/modules/`, but a plain nested clone has a `.git` directory.
+
+        Args:
+            path: Submodule path relative to project root.
+
+        Returns:
+            Absolute git directory path, or None if the submodule is not checked out.
+        """
+        dot_git = self.project_root / path / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        try:
+            content = dot_git.read_text().strip()
+        except OSError:
+            return None
+        if not content.startswith("gitdir:"):
+            return None
+        git_dir = Path(content[len("gitdir:") :].strip())
+        if not git_dir.is_absolute():
+            git_dir = (dot_git.parent / git_dir).resolve()
+        return git_dir
+
+    def head_commit(self, path: Path) -> str | None:
+        """Resolve a submodule's HEAD commit by reading its git directory.
+
+        Handles detached HEADs, loose refs and packed-refs. Anything more
+        unusual returns None so callers can fall back to `git rev-parse`.
+
+        Args:
+            path: Submodule path relative to project root.
+
+        Returns:
+            Commit SHA, or None if it cannot be determined without git.
+        """
+        git_dir = self.submodule_git_dir(path)
+        if git_dir is None:
+            return None
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+            if not head.startswith("ref: "):
+                return head or None
+
+            ref = head[len("ref: ") :]
+            common_dir = git_dir
+            commondir_file = git_dir / "commondir"
+            if commondir_file.exists():
+                common_dir = git_dir / commondir_file.read_text().strip()
+
+            ref_file = common_dir / ref
+            if ref_file.is_file():
+                return ref_file.read_text().strip() or None
+
+            with open(common_dir / "packed-refs") as f:
+                for line in f:
+                    sha, _, name = line.strip().partition(" ")
+                    if name == ref:
+                        return sha
+        except OSError:
+            pass
+        return None
+
+    def rev_parse(self, path: Path, rev: str) -> str | None:
+        """Resolve a revision in a submodule to an object SHA.
+
+        Args:
+            path: Submodule path relative to project root.
+            rev: Revision, e.g. "HEAD:catalog/skills.json".
+
+        Returns:
+            Object SHA, or None if the revision does not exist.
+        """
+        try:
+            result = self._run(
+                ["rev-parse", "--verify", "--quiet", rev],
+                cwd=self.project_root / path,
+                check=False,
+            )
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() or None
+
+    def read_blob(self, path: Path, sha: str) -> bytes:
+        """Read a blob from a submodule's object database.
+
+        Args:
+            path: Submodule path relative to project root.
+            sha: Blob SHA.
+
+        Returns:
+            Raw blob content.
+
+        Raises:
+            GitError: If the blob cannot be read.
+        """
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "blob", sha],
+                cwd=self.project_root / path,
+                capture_output=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise GitError(f"Cannot read blob {sha}: {e}") from e
+        return result.stdout
+
+    def read_tree_blobs(
+        self,
+        path: Path,
+        tree_sha: str,
+        suffix: str = ".json",
+    ) -> list[tuple[str, bytes]]:
+        """Read all blobs directly inside a tree from a submodule's object database.
+
+        Args:
+            path: Submodule path relative to project root.
+            tree_sha: Tree SHA.
+            suffix: Only read entries whose name ends with this suffix.
+
+        Returns:
+            (name, content) pairs in tree order.
+
+        Raises:
+            GitError: If the tree cannot be read.
+        """
+        cwd = self.project_root / path
+        try:
+            listing = subprocess.run(
+                ["git", "ls-tree", "-z", tree_sha],
+                cwd=cwd,
+                capture_output=True,
+                check=True,
+            ).stdout
+            entries: list[tuple[str, str]] = []
+            for entry in listing.split(b"\0"):
+                if not entry:
+                    continue
+                meta, _, raw_name = entry.partition(b"\t")
+                _, kind, sha = meta.split()
+                name = raw_name.decode()
+                if kind == b"blob" and name.endswith(suffix):
+                    entries.append((name, sha.decode()))
+
+            batch = subprocess.run(
+                ["git", "cat-file", "--batch"],
+                cwd=cwd,
+                input="".join(f"{sha}\n" for _, sha in entries).encode(),
+                capture_output=True,
+                check=True,
+            ).stdout
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise GitError(f"Cannot read tree {tree_sha}: {e}") from e
+
+        # --batch output: "<sha> <type> <size>\n<content>\n" per object
+        blobs: list[tuple[str, bytes]] = []
+        pos = 0
+        for name, _ in entries:
+            header_end = batch.index(b"\n", pos)
+            size = int(batch[pos:header_end].split()[2])
+            start = header_end + 1
+            blobs.append((name, batch[start : start + size]))
+            pos = start + size + 1
+        return blobs
+
     def sparse_checkout_init(self, path: Path) -> None:
         """Initialize sparse-checkout in cone mode for submodule.
 
@@ -0,0 +1,671 @@
+"""In-memory indexes for Catalog lookups and Catalog.suggest.
+
+Query tokens are runs of ASCII letters and digits, so a token occurs in a
+lowercased field exactly when it occurs inside one of the field's maximal
+[a-z0-9] runs ("words"). The index therefore maps every word of every
+skill's title, description and tags to the skills containing it, and maps
+every 1-, 2- and 3-gram to the words containing it. A token's candidate
+skills are found by intersecting the word lists of its trigrams and checking
+the few surviving words, instead of testing every field of every skill.
+
+ID and alias prefix matches come from PrefixIndex, a sorted array of
+lowercased keys searched with bisect, which also resolves aliases for
+Catalog.get(). Candidates are then scored with the v1 scoring function
+itself, so results are identical to a full scan.
+
+Each posting also records the word's field-weighted frequency in the skill
+and the fields containing it, and each skill its weighted length, which is
+all the BM25 ranker and the vectorized v1 scorer (see vector) need beyond
+the postings themselves.
+
+TagIndex maps every lowercased tag to the skills having it, as int
+bitmaps built on first use, so tag filters are bitwise ANDs and facet counts
+popcounts.
+
+The indexes only need sequence and mapping access to their tables, so the
+same classes also run over the memory-mapped tables of a persistent index
+(see index_cache).
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from .catalog import Skill
+
+GRAM_SIZE = 3
+_WORD = re.compile(r"[a-z0-9]+")
+
+# BM25 field weights, in the proportions of v1's tag/title/description points
+TAG_WEIGHT = 4
+TITLE_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Bits of TermStats.fields: which fields of a skill contain a word
+FIELD_TAGS = 1
+FIELD_TITLE = 2
+FIELD_DESCRIPTION = 4
+
+# Lowercased fields scored by Catalog.suggest:
+# (id, id lower, aliases lower, title lower, description lower, tags lower)
+SkillFields = tuple[str, str, tuple[str, ...], str, str, tuple[str, ...]]
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class Table(Protocol[_T_co]):
+    """Read-only table indexed by position (a list or a mapped file table)."""
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: int, /) -> _T_co: ...
+
+
+class KeyTable:
+    """Sorted lowercased keys with a position for each key.
+
+    Positions are catalog positions for skill IDs and aliases, or word IDs
+    for the word vocabulary. Exact and prefix matches are answered with two
+    binary searches.
+    """
+
+    def __init__(self, keys: Table[str], positions: Sequence[int]) -> None:
+        """Initialize from sorted keys and their positions."""
+        self._keys = keys
+        self._positions = positions
+
+    def prefixed(self, prefix_lower: str) -> Sequence[int]:
+        """Positions of keys starting with prefix_lower.
+
+        Returns:
+            Positions in key order; a skill may appear more than once.
+        """
+        start = bisect_left(self._keys, prefix_lower)
+        return self._positions[start : self._prefix_end(prefix_lower, start, len(self._keys))]
+
+    def fuzzy(self, term: str, max_distance: int) -> list[tuple[str, int, int]]:
+        """Find keys within max_distance edits (Levenshtein distance) of term.
+
+        The sorted keys are walked as an implicit trie, carrying one row of
+        the edit distance table per shared prefix (the state of a
+        Levenshtein automaton for term). A key range is skipped as soon as
+        its prefix is more than max_distance edits from every prefix of
+        term, so only a small part of the table is visited.
+
+        Returns:
+            (key, position, distance) for each matching key, in key order.
+        """
+        keys = self._keys
+        size = len(term)
+        # Distances above max_distance are all stored as cap, and only the
+        # band of columns within max_distance of the diagonal is computed:
+        # cells outside it are more than max_distance edits away anyway
+        cap = max_distance + 1
+        matches: list[tuple[str, int, int]] = []
+        stack = [("", 0, len(keys), [min(column, cap) for column in range(size + 1)])]
+        while stack:
+            prefix, start, end, row = stack.pop()
+            depth = len(prefix)
+            while start < end:
+                key = keys[start]
+                if len(key) == depth:
+                    if row[-1] <= max_distance:
+                        matches.append((key, self._positions[start], row[-1]))
+                    start += 1
+                    continue
+
+                char = key[depth]
+                child = prefix + char
+                child_end = self._prefix_end(child, start, end)
+                child_row = [cap] * (size + 1)
+                child_row[0] = best = min(depth + 1, cap)
+                for column in range(max(1, depth + 1 - max_distance), min(size, depth + cap) + 1):
+                    distance = min(
+                        child_row[column - 1] + 1,
+                        row[column] + 1,
+                        row[column - 1] + (term[column - 1] != char),
+                        cap,
+                    )
+                    child_row[column] = distance
+                    best = min(best, distance)
+                if best <= max_distance:
+                    stack.append((child, start, child_end, child_row))
+                start = child_end
+        matches.sort()
+        return matches
+
+    def _prefix_end(self, prefix: str, start: int, end: int) -> int:
+        """Index of the first key in [start, end) past the keys starting with prefix."""
+        # That key starts with the prefix's successor: its last
+        # (non-maximal) character bumped by one
+        stem = prefix.rstrip(chr(sys.maxunicode))
+        if not stem:
+            return end
+        return bisect_left(self._keys, stem[:-1] + chr(ord(stem[-1]) + 1), start, end)
+
+    def exact(self, key_lower: str) -> Sequence[int]:
+        """Positions of skills with an ID or alias equal to key_lower, ascending."""
+        start = bisect_left(self._keys, key_lower)
+        end = bisect_right(self._keys, key_lower, start)
+        return self._positions[start:end]
+
+
+class PrefixIndex(KeyTable):
+    """Sorted array of lowercased skill IDs and aliases (by catalog position)."""
+
+    def __init__(self, ids: Sequence[str], aliases: Sequence[Sequence[str]]) -> None:
+        """Build the index from per-skill IDs and aliases in catalog order."""
+        keys = sorted_keys(ids, aliases)
+        super().__init__([key for key, _ in keys], array("I", (pos for _, pos in keys)))
+        self._ids = ids
+        self._aliases = aliases
+
+    @classmethod
+    def for_skills(cls, skills: Sequence[Skill]) -> PrefixIndex:
+        """Build the index for skills in catalog order."""
+        return cls([s.id for s in skills], [s.aliases for s in skills])
+
+    def alias_owner(self, alias: str) -> str | None:
+        """Resolve an alias (case-sensitive) to the ID of the first skill defining it."""
+        for pos in self.exact(alias.lower()):
+            if alias in self._aliases[pos]:
+                return self._ids[pos]
+        return None
+
+
+class SearchIndex:
+    """Token and prefix index over a catalog's skills (by catalog position)."""
+
+    def __init__(
+        self,
+        words: Table[str],
+        postings: Table[Sequence[int]],
+        grams: Mapping[str, Sequence[int]],
+        prefix_index: KeyTable,
+        fields: Table[SkillFields],
+        term_stats: TermStats | Callable[[], TermStats],
+        word_order: Sequence[int] | None = None,
+        tags: TagIndex | Callable[[], TagIndex] | None = None,
+    ) -> None:
+        """Initialize from index tables (see WordTables).
+
+        Args:
+            words: Indexed words by word ID.
+            postings: Ascending skill positions containing each word, by word ID.
+            grams: IDs of the words containing each 1-, 2- and 3-gram.
+            prefix_index: ID and alias keys for prefix matches.
+            fields: Scored fields of each skill, by position.
+            term_stats: Per-posting statistics, or a callable computing
+                them on first use.
+            word_order: Word IDs in word order, for fuzzy matching; sorted
+                on first use if not given.
+            tags: Tag index, or a callable building it on first use; built
+                from the fields table if not given.
+        """
+        self._size = len(fields)
+        self._prefix_index = prefix_index
+        self._words = words
+        self._postings = postings
+        self._grams = grams
+        self._fields = fields
+        self._term_stats = term_stats
+        self._word_order = word_order
+        self._tags = tags
+        self._vocabulary: KeyTable | None = None
+        self._average_length: float | None = None
+
+    @classmethod
+    def for_skills(cls, skills: Sequence[Skill], prefix_index: KeyTable) -> SearchIndex:
+        """Build the index for skills in catalog order.
+
+        BM25 statistics are only counted when bm25_scores() is first called.
+        """
+        tables = WordTables.for_skills(skills)
+        return cls(
+            tables.words,
+            tables.postings,
+            tables.grams,
+            prefix_index,
+            _fields_table(skills),
+            lambda: TermStats.for_skills(skills, tables.words),
+            tags=lambda: TagIndex.for_skills(skills),
+        )
+
+    def __len__(self) -> int:
+        """Number of indexed skills."""
+        return self._size
+
+    @property
+    def prefix_index(self) -> KeyTable:
+        """The ID and alias index used for prefix matches."""
+        return self._prefix_index
+
+    @property
+    def postings(self) -> Table[Sequence[int]]:
+        """Ascending skill positions containing each word, by word ID."""
+        return self._postings
+
+    @property
+    def has_term_stats(self) -> bool:
+        """Check if the per-posting statistics are available without computing them."""
+        return isinstance(self._term_stats, TermStats)
+
+    @property
+    def term_stats(self) -> TermStats:
+        """Per-posting statistics, computed on first use for an in-memory index."""
+        if not isinstance(self._term_stats, TermStats):
+            self._term_stats = self._term_stats()
+        return self._term_stats
+
+    @property
+    def tags(self) -> TagIndex:
+        """Per-tag skill bitmaps, built on first use for an in-memory index."""
+        if not isinstance(self._tags, TagIndex):
+            if self._tags is None:
+                tags = (self._fields[pos][5] for pos in range(self._size))
+                self._tags = TagIndex.for_tags(tags)
+            else:
+                self._tags = self._tags()
+        return self._tags
+
+    def fields(self, pos: int) -> SkillFields:
+        """Get the scored fields of the skill at a catalog position."""
+        return self._fields[pos]
+
+    def token_hits(
+        self,
+        tokens: Sequence[str],
+        fuzzy_words: Sequence[Sequence[int]] | None = None,
+        budget: int | None = None,
+    ) -> dict[int, int] | None:
+        """Count, per skill, the query tokens found in its fields.
+
+        Skills missing from the result contain none of the tokens. When the
+        matches cover most of the catalog (very short tokens), counting
+        them costs more than scoring everything, so None is returned.
+
+        Args:
+            tokens: Query tokens (matched as substrings of fields).
+            fuzzy_words: IDs of further words counting as a match, per token.
+            budget: Number of postings to visit before giving up (default:
+                the number of skills).
+
+        Returns:
+            Mapping of skill position to number of tokens it contains, or None.
+        """
+        hits: dict[int, int] = {}
+        if budget is None:
+            budget = self._size
+        for number, token in enumerate(tokens):
+            word_ids = self.matching_words(token)
+            if fuzzy_words:
+                word_ids = [*word_ids, *fuzzy_words[number]]
+            matched: set[int] = set()
+            for word_id in word_ids:
+                positions = self._postings[word_id]
+                budget -= len(positions)
+                if budget < 0:
+                    return None
+                matched.update(positions)
+            for pos in matched:
+                hits[pos] = hits.get(pos, 0) + 1
+        return hits
+
+    def fuzzy_words(self, token: str, max_distance: int) -> list[tuple[str, int, int]]:
+        """Find indexed words near token that do not contain it.
+
+        Args:
+            token: Query token.
+            max_distance: Maximum number of edits.
+
+        Returns:
+            (word, word ID, distance) for each word, closest first.
+        """
+        if self._vocabulary is None:
+            order = self._word_order
+            if order is None:
+                order = sorted(range(len(self._words)), key=self._words.__getitem__)
+            self._vocabulary = KeyTable(_Permuted(self._words, order), order)
+        matches = [m for m in self._vocabulary.fuzzy(token, max_distance) if token not in m[0]]
+        matches.sort(key=lambda m: (m[2], m[0]))
+        return matches
+
+    def bm25_scores(self, tokens: Sequence[str]) -> dict[int, float]:
+        """Score the skills containing any query token with BM25.
+
+        A token's frequency in a skill is the weighted frequency of all the
+        words containing it, and its document frequency the number of skills
+        containing any of them, so the cost is proportional to the matched
+        postings.
+
+        Args:
+            tokens: Query tokens (matched as substrings of words).
+
+        Returns:
+            Mapping of skill position to BM25 score, for skills with matches.
+        """
+        lengths = self.term_stats.lengths
+        frequencies = self.term_stats.frequencies
+        if self._average_length is None:
+            self._average_length = sum(lengths) / self._size if self._size else 0.0
+        average_length = self._average_length or 1.0
+
+        scores: dict[int, float] = {}
+        for token in tokens:
+            token_frequencies: dict[int, int] = {}
+            for word_id in self.matching_words(token):
+                positions = self._postings[word_id]
+                for pos, frequency in zip(positions, frequencies[word_id], strict=True):
+                    token_frequencies[pos] = token_frequencies.get(pos, 0) + frequency
+            if not token_frequencies:
+                continue
+
+            matched = len(token_frequencies)
+            idf = math.log(1 + (self._size - matched + 0.5) / (matched + 0.5))
+            for pos, frequency in token_frequencies.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[pos] / average_length)
+                score = idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                scores[pos] = scores.get(pos, 0.0) + score
+        return scores
+
+    def matching_words(self, token: str) -> Sequence[int]:
+        """Find the IDs of all indexed words containing token."""
+        if len(token) <= GRAM_SIZE:
+            return self._grams.get(token, ())
+
+        # Intersect trigram word lists, rarest first, then verify
+        lists = sorted(
+            (self._grams.get(token[i : i + GRAM_SIZE], ()) for i in range(len(token) - 2)),
+            key=len,
+        )
+        matches = set(lists[0])
+        for word_list in lists[1:]:
+            if not matches:
+                break
+            matches.intersection_update(word_list)
+        return [word_id for word_id in matches if token in self._words[word_id]]
+
+
+class _Permuted:
+    """View of a table in another order."""
+
+    def __init__(self, table: Table[str], order: Sequence[int]) -> None:
+        self._table = table
+        self._order = order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, index: int) -> str:
+        return self._table[self._order[index]]
+
+
+def skill_fields(skill: Skill) -> SkillFields:
+    """Get the lowercased fields of a skill that suggest() scores."""
+    return (
+        skill.id,
+        skill.id.lower(),
+        tuple([alias.lower() for alias in skill.aliases]) if skill.aliases else (),
+        skill.title.lower(),
+        skill.description.lower(),
+        tuple([tag.lower() for tag in skill.tags]),
+    )
+
+
+def _fields_table(skills: Sequence[Skill]) -> list[SkillFields]:
+    """Lowercase every skill's scored fields, sharing unchanged strings and tuples.
+
+    Most descriptions and tags are lowercase already and tag tuples repeat
+    across the catalog, so the table costs little beyond the catalog itself.
+    """
+    tag_sets: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+    def lower(value: str) -> str:
+        lowered = value.lower()
+        return value if lowered == value else lowered
+
+    def lower_all(values: tuple[str, ...]) -> tuple[str, ...]:
+        lowered = tuple([lower(v) for v in values])
+        return values if lowered == values else lowered
+
+    def lower_tags(tags: tuple[str, ...]) -> tuple[str, ...]:
+        lowered = tag_sets.get(tags)
+        if lowered is None:
+            lowered = tag_sets[tags] = lower_all(tags)
+        return lowered
+
+    return [
+        (
+            skill.id,
+            lower(skill.id),
+            lower_all(skill.aliases),
+            lower(skill.title),
+            lower(skill.description),
+            lower_tags(skill.tags),
+        )
+        for skill in skills
+    ]
+
+
+def sorted_keys(ids: Sequence[str], aliases: Sequence[Sequence[str]]) -> list[tuple[str, int]]:
+    """Lowercased IDs and aliases paired with their catalog positions, sorted."""
+    keys = [(skill_id.lower(), pos) for pos, skill_id in enumerate(ids)]
+    for pos, skill_aliases in enumerate(aliases):
+        if skill_aliases:
+            keys.extend((alias.lower(), pos) for alias in skill_aliases)
+    keys.sort()
+    return keys
+
+
+@dataclass(frozen=True, slots=True)
+class WordTables:
+    """Word, postings and gram tables of a SearchIndex."""
+
+    words: list[str]
+    postings: list[list[int]]
+    grams: dict[str, list[int]]
+
+    @classmethod
+    def for_skills(cls, skills: Sequence[Skill]) -> WordTables:
+        """Build the tables for skills in catalog order."""
+        postings: dict[str, list[int]] = {}
+        find_words = _WORD.findall
+
+        for pos, skill in enumerate(skills):
+            text = " ".join((skill.title, skill.description, *skill.tags)).lower()
+            for word in set(find_words(text)):
+                positions = postings.get(word)
+                if positions is None:
+                    postings[word] = [pos]
+                else:
+                    positions.append(pos)
+
+        grams: dict[str, list[int]] = {}
+        for word_id, word in enumerate(postings):
+            for gram in _grams(word):
+                grams.setdefault(gram, []).append(word_id)
+
+        return cls(words=list(postings), postings=list(postings.values()), grams=grams)
+
+
+class PositionSet:
+    """Set of catalog positions held as an int bitmap (bit i for position i)."""
+
+    __slots__ = ("bitmap", "_bytes")
+
+    def __init__(self, bitmap: int) -> None:
+        """Wrap a non-negative bitmap."""
+        self.bitmap = bitmap
+        self._bytes = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+
+    @classmethod
+    def of(cls, positions: Sequence[int]) -> PositionSet:
+        """Build the set of ascending positions."""
+        bits = bytearray((positions[-1] >> 3) + 1 if positions else 0)
+        for pos in positions:
+            bits[pos >> 3] |= 1 << (pos & 7)
+        return cls(int.from_bytes(bits, "little"))
+
+    @property
+    def bits(self) -> bytes:
+        """The bitmap as little-endian bytes (bit i of the whole for position i)."""
+        return self._bytes
+
+    def __contains__(self, pos: object) -> bool:
+        if not isinstance(pos, int) or pos < 0:
+            return False
+        index = pos >> 3
+        return index < len(self._bytes) and bool(self._bytes[index] >> (pos & 7) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the positions in ascending order."""
+        for index, byte in enumerate(self._bytes):
+            while byte:
+                low = byte & -byte
+                yield (index << 3) + low.bit_length() - 1
+                byte ^= low
+
+    def __len__(self) -> int:
+        return self.bitmap.bit_count()
+
+    def __and__(self, other: PositionSet) -> PositionSet:
+        return PositionSet(self.bitmap & other.bitmap)
+
+
+class TagIndex:
+    """Skills by lowercased tag, for tag filters and facet counts."""
+
+    def __init__(self, tags: Mapping[str, Sequence[int]]) -> None:
+        """Initialize from the ascending skill positions of each tag, sorted by tag."""
+        self._tags = tags
+        self._sets: dict[str, PositionSet] = {}
+
+    @classmethod
+    def for_skills(cls, skills: Sequence[Skill]) -> TagIndex:
+        """Build the index for skills in catalog order."""
+        return cls.for_tags(skill.tags for skill in skills)
+
+    @classmethod
+    def for_tags(cls, tags: Iterable[Sequence[str]]) -> TagIndex:
+        """Build the index from each skill's tags, in catalog order."""
+        positions: dict[str, list[int]] = {}
+        for pos, skill_tags in enumerate(tags):
+            for tag in {tag.lower() for tag in skill_tags}:
+                tag_positions = positions.get(tag)
+                if tag_positions is None:
+                    positions[tag] = [pos]
+                else:
+                    tag_positions.append(pos)
+        return cls(dict(sorted(positions.items())))
+
+    @property
+    def positions(self) -> Mapping[str, Sequence[int]]:
+        """Ascending skill positions of each tag, sorted by tag."""
+        return self._tags
+
+    def skills_with(self, tag: str) -> PositionSet:
+        """Get the skills having a tag (case-insensitive)."""
+        tag = tag.lower()
+        found = self._sets.get(tag)
+        if found is None:
+            found = self._sets[tag] = PositionSet.of(self._tags.get(tag, ()))
+        return found
+
+    def skills_with_all(self, tags: Iterable[str]) -> PositionSet | None:
+        """Get the skills having every tag, or None if no tag is given."""
+        matched: PositionSet | None = None
+        for tag in tags:
+            found = self.skills_with(tag)
+            matched = found if matched is None else matched & found
+        return matched
+
+    def counts(self, within: PositionSet | None = None) -> dict[str, int]:
+        """Count the skills having each tag, optionally among some skills only.
+
+        Returns:
+            Non-zero counts by tag, sorted by count descending, then by tag.
+        """
+        if within is None:
+            counts = {tag: len(positions) for tag, positions in self._tags.items()}
+        else:
+            counts = {tag: len(self.skills_with(tag) & within) for tag in self._tags}
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        return {tag: count for tag, count in ranked if count}
+
+
+@dataclass(frozen=True, slots=True)
+class TermStats:
+    """Per-posting word statistics and per-skill lengths.
+
+    frequencies (field-weighted) and lengths are for BM25; fields holds the
+    FIELD_* bits of the fields containing the word, for vectorized v1 scoring.
+    """
+
+    frequencies: Table[Sequence[int]]
+    fields: Table[Sequence[int]]
+    lengths: Sequence[int]
+
+    @classmethod
+    def for_skills(cls, skills: Sequence[Skill], words: Sequence[str]) -> TermStats:
+        """Count the words of skills in catalog order.
+
+        Args:
+            skills: Skills the index was built for.
+            words: Indexed words by word ID (see WordTables).
+
+        Returns:
+            TermStats with frequencies and fields aligned with the
+            WordTables postings.
+        """
+        word_ids = {word: word_id for word_id, word in enumerate(words)}
+        frequencies = [array("I") for _ in words]
+        fields = [array("B") for _ in words]
+        lengths = array("I")
+        find_words = _WORD.findall
+
+        for skill in skills:
+            # Descriptions are the bulk of the text: count them in C
+            description_words = find_words(skill.description.lower())
+            counts = Counter(description_words)
+            masks = dict.fromkeys(counts, FIELD_DESCRIPTION)
+            length = DESCRIPTION_WEIGHT * len(description_words)
+            tags = " ".join(skill.tags)
+            for weight, field, text in (
+                (TITLE_WEIGHT, FIELD_TITLE, skill.title),
+                (TAG_WEIGHT, FIELD_TAGS, tags),
+            ):
+                for word in find_words(text.lower()):
+                    counts[word] += weight
+                    masks[word] = masks.get(word, 0) | field
+                    length += weight
+            lengths.append(length)
+            for word, count in counts.items():
+                word_id = word_ids[word]
+                frequencies[word_id].append(count)
+                fields[word_id].append(masks[word])
+
+        return cls(frequencies=frequencies, fields=fields, lengths=lengths)
+
+
+def field_words(text: str) -> set[str]:
+    """The distinct words of lowercased text, split as the index splits them."""
+    return set(_WORD.findall(text))
+
+
+def _grams(word: str) -> set[str]:
+    """All distinct substrings of word up to GRAM_SIZE characters long."""
+    return {
+        word[i : i + size] for size in range(1, GRAM_SIZE + 1) for i in range(len(word) - size + 1)
+    }
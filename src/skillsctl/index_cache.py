@@ -0,0 +1,336 @@
+"""Persistent search index for skillsctl.
+
+Building the suggest() index means decoding every skill and splitting every
+title and description into words, which costs more than answering the
+query itself. sync, install and set therefore write the index to disk, keyed
+on the git object holding the catalog (like the compiled cache), and
+suggest maps it instead of rebuilding it: lookups bisect the mapped tables
+and only the scored candidates' fields are decoded.
+
+Index file layout::
+
+    header    magic, index version, marshal version, catalog object SHA,
+              skill count
+    sections  (offset, length) of each table below
+    tables    8-byte aligned, native uint32 arrays unless noted:
+              word offsets, UTF-8 words (sorted by first occurrence),
+              word order (word IDs sorted by word, for fuzzy matching),
+              posting offsets, postings (skill positions by word),
+              posting frequencies (BM25, aligned with postings),
+              posting fields (uint8 FIELD_* bits, aligned with postings),
+              skill lengths (BM25, by skill),
+              gram offsets, UTF-8 grams (sorted),
+              gram word offsets, gram words (word IDs by gram),
+              key offsets, UTF-8 keys (sorted lowercased IDs and aliases),
+              key positions,
+              tag offsets, UTF-8 tags (sorted lowercased tags),
+              tag skill offsets, tag skills (skill positions by tag),
+              field offsets (uint64), marshal-encoded scored fields by skill
+"""
+
+from __future__ import annotations
+
+import contextlib
+import marshal
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import chain
+from pathlib import Path
+
+from .catalog import Skill
+from .index import (
+    KeyTable,
+    SearchIndex,
+    SkillFields,
+    TagIndex,
+    TermStats,
+    WordTables,
+    skill_fields,
+    sorted_keys,
+)
+
+INDEX_VERSION = 5
+INDEX_MAGIC = b"SKLI"
+INDEX_FILENAME = "search.idx"
+
+_HEADER = struct.Struct("<4sHH32sQ")
+_SECTION = struct.Struct("<QQ")
+_SECTION_COUNT = 21
+
+
+def search_index_path_for(git_dir: Path) -> Path:
+    """Get the search index location inside a submodule git directory."""
+    return git_dir / "skillsctl" / INDEX_FILENAME
+
+
+def search_index_current(index_path: Path, object_sha: str) -> bool:
+    """Check if the index at index_path was built from a catalog object."""
+    try:
+        with open(index_path, "rb") as f:
+            header = f.read(_HEADER.size)
+    except OSError:
+        return False
+    return _read_header(header, object_sha) is not None
+
+
+def open_search_index(index_path: Path, object_sha: str) -> SearchIndex | None:
+    """Map the search index built from a catalog object.
+
+    The index stays mapped for as long as it is in use.
+
+    Args:
+        index_path: Path to the search index file.
+        object_sha: Hex SHA of the catalog blob or shard tree.
+
+    Returns:
+        SearchIndex over the mapped tables, or None if there is no usable
+        index for object_sha.
+    """
+    try:
+        with open(index_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    count = _read_header(mm[: _HEADER.size], object_sha)
+    if count is None:
+        return None
+    try:
+        return _decode(memoryview(mm), count)
+    except (ValueError, TypeError, struct.error):
+        return None
+
+
+def write_search_index(index_path: Path, skills: Sequence[Skill], object_sha: str) -> None:
+    """Build the search index for a catalog and write it atomically.
+
+    Args:
+        index_path: Path to the search index file.
+        skills: The catalog's skills in catalog order.
+        object_sha: Hex SHA of the catalog blob or shard tree they came from.
+    """
+    word_tables = WordTables.for_skills(skills)
+    words = word_tables.words
+    term_stats = TermStats.for_skills(skills, words)
+    frequencies, word_fields = term_stats.frequencies, term_stats.fields
+    gram_keys = sorted(word_tables.grams)
+    keys = sorted_keys([s.id for s in skills], [s.aliases for s in skills])
+    tags = TagIndex.for_skills(skills).positions
+    fields = [marshal.dumps(skill_fields(s)) for s in skills]
+
+    field_offsets = array("Q", [0])
+    for record in fields:
+        field_offsets.append(field_offsets[-1] + len(record))
+
+    tables = [
+        *_string_table(word_tables.words),
+        array("I", sorted(range(len(words)), key=words.__getitem__)).tobytes(),
+        *_ragged_table(word_tables.postings),
+        array("I", chain.from_iterable(frequencies[i] for i in range(len(frequencies)))).tobytes(),
+        array("B", chain.from_iterable(word_fields[i] for i in range(len(word_fields)))).tobytes(),
+        array("I", term_stats.lengths).tobytes(),
+        *_string_table(gram_keys),
+        *_ragged_table([word_tables.grams[gram] for gram in gram_keys]),
+        *_string_table([key for key, _ in keys]),
+        array("I", (pos for _, pos in keys)).tobytes(),
+        *_string_table(list(tags)),
+        *_ragged_table(list(tags.values())),
+        field_offsets.tobytes(),
+        b"".join(fields),
+    ]
+
+    offset = _HEADER.size + _SECTION.size * _SECTION_COUNT
+    sections = []
+    for table in tables:
+        offset += -offset % 8
+        sections.append(_SECTION.pack(offset, len(table)))
+        offset += len(table)
+
+    header = _HEADER.pack(
+        INDEX_MAGIC, INDEX_VERSION, marshal.version, _key(object_sha), len(skills)
+    )
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.writelines(sections)
+            for table in tables:
+                f.write(b"\0" * (-f.tell() % 8))
+                f.write(table)
+        os.replace(tmp_path, index_path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            tmp_path.unlink()
+
+
+class _Strings:
+    """Mapped table of UTF-8 strings, decoded on access."""
+
+    def __init__(self, offsets: memoryview, blob: memoryview) -> None:
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return str(self._blob[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+
+
+class _Ragged:
+    """Mapped table of uint32 (or uint8) lists stored back to back."""
+
+    def __init__(self, offsets: memoryview, values: memoryview) -> None:
+        self._offsets = offsets
+        self._values = values
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> memoryview:
+        return self._values[self._offsets[index] : self._offsets[index + 1]]
+
+    def flat(self) -> tuple[memoryview, memoryview]:
+        """The (offsets, values) arrays, for zero-copy NumPy views."""
+        return self._offsets, self._values
+
+
+class _Fields:
+    """Mapped table of marshal-encoded scored fields, decoded on access."""
+
+    def __init__(self, offsets: memoryview, records: memoryview) -> None:
+        self._offsets = offsets
+        self._records = records
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> SkillFields:
+        fields: SkillFields = marshal.loads(
+            self._records[self._offsets[index] : self._offsets[index + 1]]
+        )
+        return fields
+
+
+class _SortedMap(Mapping[str, Sequence[int]]):
+    """Mapping over a sorted mapped key table, looked up by binary search."""
+
+    def __init__(self, keys: _Strings, values: _Ragged) -> None:
+        self._keys = keys
+        self._values = values
+
+    def __getitem__(self, key: str) -> Sequence[int]:
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return self._values[index]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._keys[index] for index in range(len(self._keys)))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def _decode(view: memoryview, count: int) -> SearchIndex:
+    """Wrap the mapped tables following the header in a SearchIndex."""
+    tables = []
+    for number in range(_SECTION_COUNT):
+        offset, length = _SECTION.unpack_from(view, _HEADER.size + _SECTION.size * number)
+        if offset + length > len(view):
+            raise ValueError("Truncated search index")
+        tables.append(view[offset : offset + length])
+
+    (
+        word_offsets,
+        words,
+        word_order,
+        posting_offsets,
+        postings,
+        frequencies,
+        posting_fields,
+        lengths,
+        gram_offsets,
+        grams,
+        gram_word_offsets,
+        gram_words,
+        key_offsets,
+        keys,
+        key_positions,
+        tag_offsets,
+        tag_names,
+        tag_skill_offsets,
+        tag_skills,
+        field_offsets,
+        fields,
+    ) = tables
+    field_table = _Fields(field_offsets.cast("Q"), fields)
+    if len(field_table) != count:
+        raise ValueError("Truncated search index")
+
+    return SearchIndex(
+        words=_Strings(word_offsets.cast("I"), words),
+        postings=_Ragged(posting_offsets.cast("I"), postings.cast("I")),
+        grams=_SortedMap(
+            _Strings(gram_offsets.cast("I"), grams),
+            _Ragged(gram_word_offsets.cast("I"), gram_words.cast("I")),
+        ),
+        prefix_index=KeyTable(_Strings(key_offsets.cast("I"), keys), key_positions.cast("I")),
+        fields=field_table,
+        term_stats=TermStats(
+            frequencies=_Ragged(posting_offsets.cast("I"), frequencies.cast("I")),
+            fields=_Ragged(posting_offsets.cast("I"), posting_fields),
+            lengths=lengths.cast("I"),
+        ),
+        word_order=word_order.cast("I"),
+        tags=TagIndex(
+            _SortedMap(
+                _Strings(tag_offsets.cast("I"), tag_names),
+                _Ragged(tag_skill_offsets.cast("I"), tag_skills.cast("I")),
+            )
+        ),
+    )
+
+
+def _string_table(strings: Sequence[str]) -> tuple[bytes, bytes]:
+    """Encode strings as (uint32 offsets, UTF-8 blob)."""
+    encoded = [s.encode() for s in strings]
+    offsets = array("I", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    return offsets.tobytes(), b"".join(encoded)
+
+
+def _ragged_table(lists: Sequence[Sequence[int]]) -> tuple[bytes, bytes]:
+    """Encode lists of ints as (uint32 offsets, uint32 values)."""
+    offsets = array("I", [0])
+    values = array("I")
+    for values_list in lists:
+        values.extend(values_list)
+        offsets.append(len(values))
+    return offsets.tobytes(), values.tobytes()
+
+
+def _key(object_sha: str) -> bytes:
+    """Encode a catalog object SHA as the header key."""
+    return bytes.fromhex(object_sha).ljust(32, b"\0")
+
+
+def _read_header(header: bytes, object_sha: str) -> int | None:
+    """Get the skill count from a header matching object_sha, else None."""
+    if len(header) < _HEADER.size:
+        return None
+    magic, version, marshal_version, key, count = _HEADER.unpack_from(header)
+    if (
+        magic != INDEX_MAGIC
+        or version != INDEX_VERSION
+        or marshal_version != marshal.version
+        or key != _key(object_sha)
+    ):
+        return None
+    return int(count)
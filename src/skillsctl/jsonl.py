@@ -0,0 +1,238 @@
+"""Point lookups in JSON Lines catalogs for skillsctl.
+
+install, remove and set only need the handful of skills named on the
+command line. For a catalog/skills.jsonl catalog, a sidecar index maps every
+skill ID and alias to the byte offset of its line, so a lookup reads one
+index probe path and one catalog line instead of the whole catalog.
+
+Index file layout (text, sorted by key bytes)::
+
+    skillsctl-jsonl-index <version> <catalog size> <catalog mtime ns>
+    <key> TAB <kind> TAB <offset>
+    ...
+
+where kind is "i" for skill IDs and "a" for aliases.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import mmap
+import os
+from pathlib import Path
+
+from .catalog import Catalog, CatalogError, InternTable, Skill, _skill_from_line
+
+INDEX_VERSION = 1
+INDEX_MAGIC = b"skillsctl-jsonl-index"
+INDEX_FILENAME = "skills.jsonl.idx"
+
+KIND_ID = b"i"
+KIND_ALIAS = b"a"
+
+
+class JsonlCatalog(Catalog):
+    """Catalog over a JSON Lines file that decodes only the lines it needs.
+
+    get() resolves IDs and aliases through the sidecar index; list_all()
+    and suggest() read the whole file once.
+    """
+
+    def __init__(self, data: mmap.mmap | bytes, index: mmap.mmap | bytes) -> None:
+        """Initialize from catalog content and its index (header included)."""
+        self._data = data
+        self._index = index
+        self._body_start = index.find(b"\n") + 1
+        self._table = InternTable()
+        self._materialized: dict[int, Skill | None] = {}
+        self._all: list[Skill] | None = None
+
+    @property
+    def skills(self) -> list[Skill]:
+        """All skills in catalog order (reads the whole file)."""
+        if self._all is None:
+            self._all = Catalog.loads_jsonl(bytes(self._data)).skills
+        return self._all
+
+    def get(self, skill_id: str) -> Skill | None:
+        """Get skill by ID, or else by alias, reading only its line."""
+        entries = self.lookup(skill_id)
+        return self._skill_at_offset(entries[0][1]) if entries else None
+
+    def get_by_id(self, skill_id: str) -> Skill | None:
+        """Get skill by ID, reading only its line."""
+        for kind, offset in self.lookup(skill_id):
+            if kind == KIND_ID:
+                return self._skill_at_offset(offset)
+        return None
+
+    def get_by_alias(self, alias: str) -> Skill | None:
+        """Get skill by alias, reading only its line."""
+        for kind, offset in self.lookup(alias):
+            if kind == KIND_ALIAS:
+                return self._skill_at_offset(offset)
+        return None
+
+    def lookup(self, key: str) -> list[tuple[bytes, int]]:
+        """Find index entries for an ID or alias.
+
+        Returns:
+            (kind, line offset) pairs, KIND_ID entries first, then alias
+            entries in catalog order.
+        """
+        target = key.encode()
+        index = self._index
+        end = len(index)
+
+        # Binary search for the first line whose key is >= target
+        lo, hi = self._body_start, end
+        while lo < hi:
+            mid = (lo + hi) // 2
+            line_start = index.rfind(b"\n", self._body_start, mid) + 1 or self._body_start
+            line_end = index.find(b"\n", line_start)
+            if index[line_start : index.find(b"\t", line_start)] < target:
+                lo = line_end + 1
+            else:
+                hi = line_start
+
+        entries: list[tuple[bytes, int]] = []
+        while lo < end:
+            line_end = index.find(b"\n", lo)
+            entry_key, kind, offset = index[lo:line_end].split(b"\t")
+            if entry_key != target:
+                break
+            entries.append((kind, int(offset)))
+            lo = line_end + 1
+        entries.sort(key=lambda e: (e[0] != KIND_ID, e[1]))
+        return entries
+
+    def _skill_at_offset(self, offset: int) -> Skill | None:
+        """Decode (once) the skill whose line starts at offset."""
+        if offset not in self._materialized:
+            end = self._data.find(b"\n", offset)
+            line = self._data[offset : end if end != -1 else len(self._data)]
+            try:
+                skill = _skill_from_line(line, self._table, 0)
+            except CatalogError:
+                # Only count lines for the error message
+                line_no = self._data[:offset].count(b"\n") + 1
+                skill = _skill_from_line(line, self._table, line_no)
+            self._materialized[offset] = skill
+        return self._materialized[offset]
+
+
+def index_path_for(git_dir: Path) -> Path:
+    """Get the JSON Lines index location inside a submodule git directory."""
+    return git_dir / "skillsctl" / INDEX_FILENAME
+
+
+def open_jsonl(jsonl_path: Path, index_path: Path | None) -> JsonlCatalog:
+    """Open a JSON Lines catalog, building its index when missing or stale.
+
+    Args:
+        jsonl_path: Path to catalog/skills.jsonl file.
+        index_path: Where to keep the index, or None to build it in memory.
+
+    Returns:
+        JsonlCatalog instance.
+
+    Raises:
+        CatalogError: If catalog file is missing or invalid.
+    """
+    try:
+        st = jsonl_path.stat()
+        with open(jsonl_path, "rb") as f:
+            data: mmap.mmap | bytes = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else b""
+            )
+    except OSError as e:
+        raise CatalogError(f"Catalog file not found: {jsonl_path}") from e
+
+    header = _index_header(st.st_size, st.st_mtime_ns)
+    if index_path is not None:
+        index = _map_index(index_path, header)
+        if index is not None:
+            return JsonlCatalog(data, index)
+
+    index_bytes = build_jsonl_index(data, header)
+    if index_path is not None:
+        with contextlib.suppress(OSError):
+            _write_atomic(index_path, index_bytes)
+    return JsonlCatalog(data, index_bytes)
+
+
+def build_jsonl_index(data: mmap.mmap | bytes, header: bytes) -> bytes:
+    """Build the sorted ID/alias index for JSON Lines catalog content.
+
+    Args:
+        data: Catalog content.
+        header: Index header line (see _index_header).
+
+    Returns:
+        Index file content.
+
+    Raises:
+        CatalogError: If a line is not valid JSON.
+    """
+    entries: list[tuple[bytes, bytes, int]] = []
+    # Like Catalog.get, a duplicate ID resolves to its last line
+    ids: dict[bytes, int] = {}
+    offset = 0
+    line_no = 0
+    size = len(data)
+    while offset < size:
+        line_no += 1
+        end = data.find(b"\n", offset)
+        if end == -1:
+            end = size
+        line = data[offset:end]
+        if line.strip():
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise CatalogError(f"Invalid JSON in catalog line {line_no}: {e}") from e
+            if isinstance(item, dict) and "id" in item and "title" in item:
+                ids[_key(item["id"])] = offset
+                aliases = item.get("aliases")
+                if isinstance(aliases, list):
+                    entries.extend((_key(alias), KIND_ALIAS, offset) for alias in aliases)
+        offset = end + 1
+
+    entries.extend((key, KIND_ID, offset) for key, offset in ids.items())
+    entries.sort()
+    body = b"".join(b"%s\t%s\t%d\n" % entry for entry in entries)
+    return header + body
+
+
+def _key(value: object) -> bytes:
+    """Encode an ID or alias as an index key (tabs and newlines stripped)."""
+    return str(value).replace("\t", " ").replace("\n", " ").encode()
+
+
+def _index_header(size: int, mtime_ns: int) -> bytes:
+    """Build the index header line for a catalog fingerprint."""
+    return b"%s %d %d %d\n" % (INDEX_MAGIC, INDEX_VERSION, size, mtime_ns)
+
+
+def _map_index(index_path: Path, header: bytes) -> mmap.mmap | None:
+    """Map an existing index if its header matches, else None."""
+    try:
+        with open(index_path, "rb") as f:
+            if f.readline() != header:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    """Write a file via a temporary file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            tmp_path.unlink()
@@ -0,0 +1,88 @@
+"""Cursors for paging through catalog and suggest results.
+
+A page is requested with --offset, or with the opaque cursor printed after
+the previous page. The cursor records the catalog state it was issued for
+and a key of the request, so it is rejected once the catalog changes rather
+than silently skipping or repeating results. For suggest it also holds the
+RankPosition the page ended at: the next page only ranks the results after
+it, so earlier pages are neither kept in memory nor serialized again.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import dataclass
+
+from .catalog import RankPosition
+
+CURSOR_VERSION = 1
+
+
+class CursorError(Exception):
+    """Raised when a cursor is malformed or was issued for another request."""
+
+
+def request_key(command: str, *options: object) -> str:
+    """Key the request a cursor pages through (command, query and ranking options)."""
+    return hashlib.sha256(json.dumps([command, *options]).encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    """Position after a page of results, bound to a catalog and request."""
+
+    catalog_key: str
+    request: str
+    offset: int
+    after: RankPosition | None = None
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe token."""
+        after = None
+        if self.after is not None:
+            after = [self.after.score, self.after.skill_id, self.after.repeats]
+        data = [CURSOR_VERSION, self.catalog_key, self.request, self.offset, after]
+        token = base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode())
+        return token.decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> Cursor:
+        """Decode a token made by encode().
+
+        Raises:
+            CursorError: If the token is not a valid cursor.
+        """
+        try:
+            data = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            version, catalog_key, request, offset, after = data
+            if version != CURSOR_VERSION:
+                raise ValueError(f"unsupported version {version}")
+            if not isinstance(catalog_key, str) or not isinstance(request, str):
+                raise TypeError("bad key")
+            if not isinstance(offset, int) or offset < 0:
+                raise TypeError("bad offset")
+            position = None
+            if after is not None:
+                score, skill_id, repeats = after
+                if not isinstance(score, int | float) or not isinstance(skill_id, str):
+                    raise TypeError("bad position")
+                if not isinstance(repeats, int) or repeats < 1:
+                    raise TypeError("bad position")
+                position = RankPosition(score, skill_id, repeats)
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+            raise CursorError(f"Invalid cursor: {e}") from None
+        return cls(catalog_key, request, offset, position)
+
+    def check(self, catalog_key: str, request: str) -> None:
+        """Check the cursor continues this request on the current catalog.
+
+        Raises:
+            CursorError: If the catalog changed or the cursor is for another request.
+        """
+        if request != self.request:
+            raise CursorError("Cursor was issued for a different query or options")
+        if catalog_key != self.catalog_key:
+            raise CursorError("Catalog changed since the cursor was issued; start over")
@@ -0,0 +1,173 @@
+"""Suggest result cache for skillsctl.
+
+Agents repeat the same handful of queries many times a day. suggest results
+are therefore cached on disk, keyed by the catalog objects they were ranked
+from and by the normalized query and options, so a repeated query is
+answered without loading or scoring the catalog. A changed catalog object
+changes the key, which invalidates every entry ranked from the old one.
+
+Each entry is a small JSON file named after its catalog and key. Reading an
+entry marks it as recently used by touching its mtime; writing one removes
+the entries of other catalogs, then evicts the least recently used entries
+beyond the count and size bounds.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from .catalog import FUZZY_PENALTY, ScoredSkill, Skill
+
+RESULT_CACHE_VERSION = 1
+RESULT_DIR = "results"
+MAX_ENTRIES = 256
+MAX_BYTES = 4 << 20
+
+
+def result_cache_dir_for(git_dir: Path) -> Path:
+    """Get the result cache location inside a submodule git directory."""
+    return git_dir / "skillsctl" / RESULT_DIR
+
+
+@dataclass(frozen=True, slots=True)
+class ResultCache:
+    """Bounded LRU cache of suggest results for one catalog state."""
+
+    directory: Path
+    catalog_key: str
+    max_entries: int = MAX_ENTRIES
+    max_bytes: int = MAX_BYTES
+
+    @classmethod
+    def for_objects(cls, directory: Path, object_shas: Sequence[str]) -> ResultCache:
+        """Create the cache for the catalogs held in git objects.
+
+        Args:
+            directory: Directory holding the cache entries.
+            object_shas: Catalog object SHA of each source, in precedence order.
+        """
+        digest = hashlib.sha256(" ".join(object_shas).encode()).hexdigest()
+        return cls(directory, digest[:16])
+
+    def get(
+        self,
+        query: str,
+        limit: int,
+        ranker: str,
+        fuzzy: int = 0,
+        fuzzy_penalty: int = FUZZY_PENALTY,
+        tags: Sequence[str] = (),
+    ) -> list[ScoredSkill] | None:
+        """Get cached results for a query, marking them as recently used.
+
+        Returns:
+            Results as suggest() returned them, or None on a cache miss.
+        """
+        key = self._key(query, limit, ranker, fuzzy, fuzzy_penalty, tags)
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_bytes())
+            if data["key"] != key:
+                return None
+            results = [
+                ScoredSkill(
+                    skill=Skill(
+                        id=item["id"],
+                        title=item["title"],
+                        description=item["description"],
+                        tags=item["tags"],
+                        paths=item["paths"],
+                        aliases=item["aliases"],
+                    ),
+                    score=item["score"],
+                )
+                for item in data["results"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        with contextlib.suppress(OSError):
+            _touch(path)
+        return results
+
+    def put(
+        self,
+        query: str,
+        limit: int,
+        ranker: str,
+        results: Sequence[ScoredSkill],
+        fuzzy: int = 0,
+        fuzzy_penalty: int = FUZZY_PENALTY,
+        tags: Sequence[str] = (),
+    ) -> None:
+        """Cache results for a query and evict old entries, ignoring write failures."""
+        key = self._key(query, limit, ranker, fuzzy, fuzzy_penalty, tags)
+        path = self._path(key)
+        data = {"key": key, "results": [r.to_dict() for r in results]}
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with contextlib.suppress(OSError):
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data))
+            _touch(tmp_path)
+            os.replace(tmp_path, path)
+            self._evict()
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+
+    def _key(
+        self,
+        query: str,
+        limit: int,
+        ranker: str,
+        fuzzy: int,
+        fuzzy_penalty: int,
+        tags: Sequence[str],
+    ) -> str:
+        """Build the entry key; scores only depend on the lowercased query."""
+        # Without fuzzy matching, the penalty does not change any score
+        penalty = fuzzy_penalty if fuzzy else None
+        options = [RESULT_CACHE_VERSION, self.catalog_key, query.lower(), limit, ranker]
+        return json.dumps([*options, fuzzy, penalty, sorted({tag.lower() for tag in tags})])
+
+    def _path(self, key: str) -> Path:
+        """Get the entry file for a key."""
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return self.directory / f"{self.catalog_key}-{digest}.json"
+
+    def _evict(self) -> None:
+        """Remove other catalogs' entries, then the least recently used ones."""
+        entries: list[tuple[int, str, int]] = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                if not entry.name.startswith(f"{self.catalog_key}-"):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(entry.path)
+                    continue
+                with contextlib.suppress(FileNotFoundError):
+                    st = entry.stat()
+                    entries.append((st.st_mtime_ns, entry.path, st.st_size))
+
+        entries.sort()
+        count = len(entries)
+        size = sum(entry[2] for entry in entries)
+        for _, path, entry_size in entries:
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+            count -= 1
+            size -= entry_size
+
+
+def _touch(path: Path) -> None:
+    """Set a file's mtime to now at full clock resolution."""
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
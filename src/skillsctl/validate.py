@@ -0,0 +1,172 @@
+"""Catalog validation for skillsctl.
+
+Catalog.load() skips entries it cannot use; validation instead reports every
+problem in a catalog at once, in a single pass over the raw entries. Verdicts
+are cached per catalog object SHA, so validating an unchanged catalog again
+(in CI or a pre-commit hook) reads one small file.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+VALIDATOR_VERSION = 1
+VERDICT_DIR = "verdicts"
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationIssue:
+    """A problem found in a catalog entry."""
+
+    location: str
+    message: str
+    skill_id: str | None = None
+
+    def to_dict(self) -> dict[str, str | None]:
+        """Convert issue to dictionary."""
+        return {"location": self.location, "id": self.skill_id, "message": self.message}
+
+    def __str__(self) -> str:
+        """Format issue as "location (id): message"."""
+        where = f"{self.location} ({self.skill_id})" if self.skill_id else self.location
+        return f"{where}: {self.message}"
+
+
+def validate_catalog(files: Sequence[tuple[str, bytes]]) -> list[ValidationIssue]:
+    """Validate catalog files in one pass over their entries.
+
+    Checks that every entry is an object with string id and title, that IDs
+    are unique across all files, that description is a string, that tags and
+    aliases are lists of strings, and that paths are lists of relative paths
+    staying inside the repository.
+
+    Args:
+        files: (name, content) pairs, e.g. ("skills.json", ...) or one pair
+            per shard. Names ending in .jsonl are read as JSON Lines.
+
+    Returns:
+        Issues in file and entry order; empty if the catalog is valid.
+    """
+    issues: list[ValidationIssue] = []
+    seen: dict[str, str] = {}
+    for name, data in files:
+        if name.endswith(".jsonl"):
+            for line_no, line in enumerate(data.splitlines(), 1):
+                if not line.strip():
+                    continue
+                location = f"{name}:{line_no}"
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError as e:
+                    issues.append(ValidationIssue(location, f"Invalid JSON: {e}"))
+                    continue
+                _check_entry(item, location, seen, issues)
+            continue
+
+        try:
+            items = json.loads(data)
+        except json.JSONDecodeError as e:
+            issues.append(ValidationIssue(name, f"Invalid JSON: {e}"))
+            continue
+        if not isinstance(items, list):
+            issues.append(ValidationIssue(name, "Catalog must be a JSON array"))
+            continue
+        for index, item in enumerate(items):
+            _check_entry(item, f"{name}[{index}]", seen, issues)
+    return issues
+
+
+def _check_entry(
+    item: object,
+    location: str,
+    seen: dict[str, str],
+    issues: list[ValidationIssue],
+) -> None:
+    """Check one catalog entry, appending its issues."""
+    if not isinstance(item, dict):
+        issues.append(ValidationIssue(location, "Entry must be a JSON object"))
+        return
+
+    skill_id = item.get("id")
+    if not isinstance(skill_id, str) or not skill_id:
+        message = "Missing 'id'" if skill_id is None else "'id' must be a non-empty string"
+        issues.append(ValidationIssue(location, message))
+        skill_id = None
+    elif skill_id in seen:
+        issues.append(
+            ValidationIssue(location, f"Duplicate id (first defined at {seen[skill_id]})", skill_id)
+        )
+    else:
+        seen[skill_id] = location
+
+    title = item.get("title")
+    if not isinstance(title, str) or not title:
+        message = "Missing 'title'" if title is None else "'title' must be a non-empty string"
+        issues.append(ValidationIssue(location, message, skill_id))
+
+    if not isinstance(item.get("description", ""), str):
+        issues.append(ValidationIssue(location, "'description' must be a string", skill_id))
+
+    for field in ("tags", "aliases"):
+        value = item.get(field, [])
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            message = f"'{field}' must be a list of strings"
+            issues.append(ValidationIssue(location, message, skill_id))
+
+    paths = item.get("paths", [])
+    if not isinstance(paths, list) or not all(isinstance(p, str) for p in paths):
+        issues.append(ValidationIssue(location, "'paths' must be a list of strings", skill_id))
+        return
+    for path in paths:
+        if _escapes_repo(path):
+            issues.append(
+                ValidationIssue(location, f"Path escapes the repository: {path!r}", skill_id)
+            )
+
+
+def _escapes_repo(path: str) -> bool:
+    """Check if a skill path is empty, absolute, or leaves the repository."""
+    if not path or "\\" in path or "\0" in path:
+        return True
+    pure = PurePosixPath(path)
+    return pure.is_absolute() or ".." in pure.parts
+
+
+def verdict_path_for(git_dir: Path, object_sha: str) -> Path:
+    """Get the cached verdict location for a catalog object."""
+    return git_dir / "skillsctl" / VERDICT_DIR / f"{object_sha}.json"
+
+
+def load_verdict(verdict_path: Path) -> list[ValidationIssue] | None:
+    """Load a cached verdict.
+
+    Returns:
+        Cached issues, or None if there is no usable verdict.
+    """
+    try:
+        data = json.loads(verdict_path.read_bytes())
+        if data["version"] != VALIDATOR_VERSION:
+            return None
+        return [
+            ValidationIssue(issue["location"], issue["message"], issue["id"])
+            for issue in data["issues"]
+        ]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_verdict(verdict_path: Path, issues: Sequence[ValidationIssue]) -> None:
+    """Cache a verdict, ignoring write failures."""
+    data = {"version": VALIDATOR_VERSION, "issues": [issue.to_dict() for issue in issues]}
+    tmp_path = verdict_path.with_name(f"{verdict_path.name}.{os.getpid()}.tmp")
+    with contextlib.suppress(OSError):
+        verdict_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, verdict_path)
+    with contextlib.suppress(OSError):
+        tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,158 @@
+"""Vectorized v1 scoring for Catalog.suggest (optional, needs NumPy).
+
+On large catalogs, broad queries (short or common tokens) match most
+skills, and scoring the candidates one by one in Python dominates suggest().
+With NumPy installed, VectorScorer scores the whole catalog at once from the
+search index instead. The FIELD_* bits of the postings form sparse
+word-by-skill incidence matrices for tags, titles and descriptions, so a
+token's field hits are one OR-reduction over the postings of the words
+containing it, and its points one table lookup per skill. ID and alias
+points still come from the few prefix matches, scored by the caller.
+
+Without NumPy, HAVE_NUMPY is False and suggest() keeps scoring in Python.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from itertools import chain
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+from .index import FIELD_DESCRIPTION, FIELD_TAGS, FIELD_TITLE
+
+if TYPE_CHECKING:
+    from .catalog import RankPosition
+    from .index import PositionSet, SearchIndex
+
+try:
+    import numpy as np
+except ImportError:
+    HAVE_NUMPY = False
+else:
+    HAVE_NUMPY = True
+
+# Points of a token by the FIELD_* bits of the fields containing it
+_POINTS = [
+    20 * bool(mask & FIELD_TAGS)
+    + 10 * bool(mask & FIELD_TITLE)
+    + 5 * bool(mask & FIELD_DESCRIPTION)
+    for mask in range(8)
+]
+
+
+@runtime_checkable
+class _FlatTable(Protocol):
+    """Ragged table stored as flat (offsets, values) buffers (see index_cache)."""
+
+    def flat(self) -> tuple[memoryview, memoryview]: ...
+
+
+# Up to this many tied candidates, order them by ID in Python rather than
+# building the catalog-wide ID ranks
+_PYTHON_SORT_LIMIT = 4096
+
+
+class VectorScorer:
+    """Catalog-wide v1 token scoring over a SearchIndex's postings."""
+
+    def __init__(self, index: SearchIndex) -> None:
+        """Lay out the postings and their field bits as flat arrays.
+
+        The mapped tables of a persistent index are viewed in place;
+        in-memory tables are copied.
+        """
+        postings = index.postings
+        fields = index.term_stats.fields
+        if isinstance(postings, _FlatTable) and isinstance(fields, _FlatTable):
+            offsets, positions = postings.flat()
+            self._offsets = np.frombuffer(offsets, np.uint32).astype(np.int64)
+            self._positions = np.frombuffer(positions, np.uint32)
+            self._fields = np.frombuffer(fields.flat()[1], np.uint8)
+        else:
+            words = range(len(postings))
+            sizes = np.fromiter((len(postings[w]) for w in words), np.int64, count=len(words))
+            self._offsets = np.zeros(len(words) + 1, np.int64)
+            np.cumsum(sizes, out=self._offsets[1:])
+            total = int(self._offsets[-1])
+            self._positions = np.fromiter(
+                chain.from_iterable(postings[w] for w in words), np.uint32, count=total
+            )
+            self._fields = np.fromiter(
+                chain.from_iterable(fields[w] for w in words), np.uint8, count=total
+            )
+        self._points = np.array(_POINTS, np.int64)
+        self._index = index
+        self._id_ranks: np.ndarray | None = None
+
+    def rank(
+        self,
+        tokens: Sequence[str],
+        id_points: Mapping[int, int],
+        limit: int,
+        after: RankPosition | None = None,
+        allowed: PositionSet | None = None,
+    ) -> list[tuple[int, int]]:
+        """Rank the catalog for a tokenized query.
+
+        Args:
+            tokens: Query tokens.
+            id_points: ID and alias points by catalog position (see score_ids).
+            limit: Maximum number of results.
+            after: Only rank the skills not ranking before this position.
+            allowed: Only rank these skills.
+
+        Returns:
+            (score, position) of the best skills with a positive score,
+            ordered like Catalog.suggest: by score descending, then by ID,
+            then by position.
+        """
+        size = len(self._index)
+        scores = np.zeros(size, np.int64)
+        for token in tokens:
+            word_ids = np.array(self._index.matching_words(token), np.int64)
+            if not len(word_ids):
+                continue
+            starts = self._offsets[word_ids]
+            counts = self._offsets[word_ids + 1] - starts
+            # Flat indexes of all postings of the matched words
+            shifts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+            postings = np.arange(int(counts.sum())) + shifts
+            masks = np.zeros(size, np.uint8)
+            np.bitwise_or.at(masks, self._positions[postings], self._fields[postings])
+            scores += self._points[masks]
+        for pos, points in id_points.items():
+            scores[pos] += points
+        if allowed is not None:
+            keep = np.unpackbits(np.frombuffer(allowed.bits, np.uint8), bitorder="little")
+            keep.resize(size, refcheck=False)
+            scores[keep == 0] = 0
+        if after is not None:
+            scores[scores > after.score] = 0
+            fields = self._index.fields
+            for pos in np.flatnonzero(scores == after.score).tolist():
+                if fields(pos)[0] < after.skill_id:
+                    scores[pos] = 0
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > limit:
+            cut = len(candidates) - limit
+            cutoff = np.partition(scores[candidates], cut)[cut]
+            candidates = candidates[scores[candidates] >= cutoff]
+
+        if len(candidates) > _PYTHON_SORT_LIMIT:
+            order = np.lexsort((self._ranks()[candidates], -scores[candidates]))[:limit]
+            return [(int(scores[pos]), int(pos)) for pos in candidates[order]]
+        ranked = [(int(scores[pos]), int(pos)) for pos in candidates]
+        fields = self._index.fields
+        ranked.sort(key=lambda entry: (-entry[0], fields(entry[1])[0], entry[1]))
+        return ranked[:limit]
+
+    def _ranks(self) -> np.ndarray:
+        """Rank of each catalog position when ordered by (ID, position)."""
+        if self._id_ranks is None:
+            size = len(self._index)
+            ids = [self._index.fields(pos)[0] for pos in range(size)]
+            ranks = np.empty(size, np.int64)
+            ranks[sorted(range(size), key=ids.__getitem__)] = np.arange(size)
+            self._id_ranks = ranks
+        return self._id_ranks
@@ -0,0 +1,110 @@
+"""Tests for cache module."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from skillsctl.cache import LazyCatalog, load_cached
+
+CATALOG_DATA = [
+    {
+        "id": "skill-1",
+        "title": "Skill One",
+        "description": "First skill",
+        "tags": ["tag1"],
+        "paths": ["skills/one"],
+    },
+    {"id": "skill-2", "title": "Skill Two", "description": "", "tags": [], "paths": []},
+]
+
+
+def test_load_cached_builds_cache() -> None:
+    """Test first load writes a compiled cache with identical content."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        catalog_path = Path(tmpdir) / "skills.json"
+        cache_path = Path(tmpdir) / "cache" / "catalog.cache"
+        catalog_path.write_text(json.dumps(CATALOG_DATA))
+
+        first = load_cached(catalog_path, cache_path)
+        assert cache_path.exists()
+
+        second = load_cached(catalog_path, cache_path)
+        assert [s.to_dict() for s in second.list_all()] == [s.to_dict() for s in first.list_all()]
+
+
+def test_load_cached_rebuilds_when_stale() -> None:
+    """Test cache is rebuilt after the catalog changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        catalog_path = Path(tmpdir) / "skills.json"
+        cache_path = Path(tmpdir) / "catalog.cache"
+        catalog_path.write_text(json.dumps(CATALOG_DATA))
+        load_cached(catalog_path, cache_path)
+
+        catalog_path.write_text(json.dumps(CATALOG_DATA[:1]))
+        catalog = load_cached(catalog_path, cache_path)
+        assert len(catalog.list_all()) == 1
+        assert catalog.get("skill-2") is None
+
+
+def test_load_cached_same_content_new_mtime() -> None:
+    """Test touched catalog with identical content is served from cache."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        catalog_path = Path(tmpdir) / "skills.json"
+        cache_path = Path(tmpdir) / "catalog.cache"
+        catalog_path.write_text(json.dumps(CATALOG_DATA))
+        load_cached(catalog_path, cache_path)
+
+        st = catalog_path.stat()
+        os.utime(catalog_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        catalog = load_cached(catalog_path, cache_path)
+        assert catalog.get("skill-1") is not None
+
+
+def test_load_cached_ignores_corrupt_cache() -> None:
+    """Test corrupt cache file falls back to parsing JSON."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        catalog_path = Path(tmpdir) / "skills.json"
+        cache_path = Path(tmpdir) / "catalog.cache"
+        catalog_path.write_text(json.dumps(CATALOG_DATA))
+        cache_path.write_bytes(b"garbage")
+
+        catalog = load_cached(catalog_path, cache_path)
+        assert len(catalog.list_all()) == 2
+
+
+def test_load_cached_lazy() -> None:
+    """Test lazy catalog decodes skills on demand with identical content."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        catalog_path = Path(tmpdir) / "skills.json"
+        cache_path = Path(tmpdir) / "catalog.cache"
+        catalog_path.write_text(json.dumps(CATALOG_DATA))
+        eager = load_cached(catalog_path, cache_path)
+
+        lazy = load_cached(catalog_path, cache_path, lazy=True)
+        assert isinstance(lazy, LazyCatalog)
+
+        skill = lazy.get("skill-1")
+        eager_skill = eager.get("skill-1")
+        assert skill is not None and eager_skill is not None
+        assert skill.to_dict() == eager_skill.to_dict()
+        assert lazy.get("missing") is None
+        assert lazy.get("skill-1") is skill
+
+        assert [s.to_dict() for s in lazy.list_all()] == [s.to_dict() for s in eager.list_all()]
+        assert [r.to_dict() for r in lazy.suggest("skill")] == [
+            r.to_dict() for r in eager.suggest("skill")
+        ]
+
+
+def test_load_cached_truncated_cache() -> None:
+    """Test truncated cache is detected and rebuilt."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        catalog_path = Path(tmpdir) / "skills.json"
+        cache_path = Path(tmpdir) / "catalog.cache"
+        catalog_path.write_text(json.dumps(CATALOG_DATA))
+        load_cached(catalog_path, cache_path)
+
+        cache_path.write_bytes(cache_path.read_bytes()[:-5])
+        catalog = load_cached(catalog_path, cache_path, lazy=True)
+        assert [s.id for s in catalog.list_all()] == ["skill-1", "skill-2"]
@@ -6,7 +6,17 @@ from pathlib import Path
 
 import pytest
 
-from skillsctl.catalog import Catalog, CatalogError, ScoredSkill, Skill
+from skillsctl.catalog import (
+    Catalog,
+    CatalogError,
+    ScoreContribution,
+    ScoredSkill,
+    Skill,
+    SuggestStats,
+    explain_score,
+    iter_skills,
+    suggest_stream,
+)
 
 
 def test_skill_to_dict() -> None:
@@ -15,9 +25,9 @@ def test_skill_to_dict() -> None:
         id="test-skill",
         title="Test Skill",
         description="A test skill",
-        tags=["test", "example"],
-        paths=["skills/test"],
-        aliases=["ts"],
+        tags=("test", "example"),
+        paths=("skills/test",),
+        aliases=("ts",),
     )
     result = skill.to_dict()
     assert result["id"] == "test-skill"
@@ -27,7 +37,7 @@ def test_skill_to_dict() -> None:
 
 def test_scored_skill_to_dict() -> None:
     """Test ScoredSkill.to_dict()."""
-    skill = Skill(id="test", title="Test", description="", tags=[], paths=[], aliases=[])
+    skill = Skill(id="test", title="Test", description="", tags=(), paths=(), aliases=())
     scored = ScoredSkill(skill=skill, score=50)
     result = scored.to_dict()
     assert result["id"] == "test"
@@ -177,3 +187,248 @@ def test_catalog_suggest_no_match() -> None:
         results = catalog.suggest("nonexistent")
 
         assert len(results) == 0
+
+
+def test_iter_skills_matches_load() -> None:
+    """Test streaming loader yields the same skills as Catalog.load."""
+    catalog_data = [
+        {"id": "skill-1", "title": "Skill One", "description": "x", "tags": ["a"], "paths": []},
+        "not a skill",
+        {"id": "no-title"},
+        {"id": "skill-2", "title": "Skill Two", "description": "", "tags": [], "paths": []},
+        12.5e3,
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        catalog_path = Path(tmpdir) / "skills.json"
+        with open(catalog_path, "w") as f:
+            json.dump(catalog_data, f, indent=2)
+
+        expected = [s.to_dict() for s in Catalog.load(catalog_path).list_all()]
+        for chunk_size in (1, 3, 64):
+            streamed = [s.to_dict() for s in iter_skills(catalog_path, chunk_size=chunk_size)]
+            assert streamed == expected
+
+
+def test_iter_skills_invalid_json() -> None:
+    """Test streaming loader reports malformed catalogs."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        catalog_path = Path(tmpdir) / "skills.json"
+        for text in ('[{"id": "a", "title": "A"} {"id": "b"}]', "[1,", '{"key": "value"}'):
+            catalog_path.write_text(text)
+            with pytest.raises(CatalogError):
+                list(iter_skills(catalog_path, chunk_size=4))
+
+
+def test_suggest_stream_matches_suggest() -> None:
+    """Test streaming suggest returns the same ranking as Catalog.suggest."""
+    catalog_data = [
+        {"id": f"skill-{i}", "title": f"Skill {i}", "description": "test", "tags": [], "paths": []}
+        for i in range(20)
+    ]
+    catalog_data.append(
+        {"id": "test", "title": "Test", "description": "", "tags": ["testing"], "paths": []}
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        catalog_path = Path(tmpdir) / "skills.json"
+        with open(catalog_path, "w") as f:
+            json.dump(catalog_data, f)
+
+        catalog = Catalog.load(catalog_path)
+        expected = [(r.skill.id, r.score) for r in catalog.suggest("test", limit=5)]
+        streamed = suggest_stream(iter_skills(catalog_path), "test", limit=5)
+        assert [(r.skill.id, r.score) for r in streamed] == expected
+
+
+def test_skill_is_immutable() -> None:
+    """Test Skill fields are frozen and list fields become tuples."""
+    skill = Skill(id="s", title="S", description="", tags=["a"])  # type: ignore[arg-type]
+    assert skill.tags == ("a",)
+    with pytest.raises(AttributeError):
+        skill.title = "other"  # type: ignore[misc]
+
+
+def test_catalog_load_interns_tags() -> None:
+    """Test equal tags and tag lists are shared across skills."""
+    catalog_data = [
+        {"id": f"skill-{i}", "title": "T", "tags": ["pdf", "python"], "aliases": ["x"]}
+        for i in range(3)
+    ]
+    catalog_data.append({"id": "bad", "title": "T", "tags": "pdf", "paths": "skills/bad"})
+
+    catalog = Catalog.loads(json.dumps(catalog_data))
+    first, second = catalog.get("skill-0"), catalog.get("skill-1")
+    assert first is not None and second is not None
+    assert first.tags is second.tags
+    assert first.aliases[0] is second.aliases[0]
+
+    bad = catalog.get("bad")
+    assert bad is not None
+    assert bad.to_dict()["tags"] == []
+    assert bad.to_dict()["paths"] == []
+
+
+def test_catalog_load_shard_directory(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test loading a directory of shards, serially and with a process pool."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        shard_dir = Path(tmpdir) / "skills.d"
+        shard_dir.mkdir()
+        (shard_dir / "20-b.json").write_text(json.dumps([{"id": "b", "title": "B"}]))
+        (shard_dir / "10-a.json").write_text(
+            json.dumps([{"id": "a", "title": "A", "tags": ["pdf"]}, {"id": "c", "title": "C"}])
+        )
+        (shard_dir / "README.md").write_text("not a shard")
+
+        catalog = Catalog.load(shard_dir)
+        assert [s.id for s in catalog.list_all()] == ["a", "c", "b"]
+        assert [s.id for s in iter_skills(shard_dir)] == ["a", "c", "b"]
+
+        monkeypatch.setattr("skillsctl.catalog.PARALLEL_LOAD_THRESHOLD", 0)
+        shards = [(p.name, p.read_bytes()) for p in shard_dir.glob("*.json")]
+        parallel = Catalog.loads_shards(shards, max_workers=2)
+        assert [s.to_dict() for s in parallel.list_all()] == [
+            s.to_dict() for s in catalog.list_all()
+        ]
+
+
+def test_catalog_load_shards_duplicate_ids() -> None:
+    """Test duplicate IDs across shards are reported."""
+    shards = [
+        ("a.json", json.dumps([{"id": "x", "title": "X"}]).encode()),
+        ("b.json", json.dumps([{"id": "x", "title": "Other X"}]).encode()),
+    ]
+    with pytest.raises(CatalogError, match=r"x \(a.json, b.json\)"):
+        Catalog.loads_shards(shards)
+
+
+def test_catalog_load_shards_invalid_shard() -> None:
+    """Test invalid shard errors name the shard."""
+    with pytest.raises(CatalogError, match="bad.json: Invalid JSON"):
+        Catalog.loads_shards([("bad.json", b"[{")])
+
+
+def test_catalog_load_jsonl() -> None:
+    """Test loading a JSON Lines catalog skips blank lines and keeps order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        catalog_path = Path(tmpdir) / "skills.jsonl"
+        catalog_path.write_text(
+            '{"id": "b", "title": "B", "tags": ["x"]}\n\n{"id": "a", "title": "A"}\n'
+        )
+
+        catalog = Catalog.load(catalog_path)
+        assert [s.id for s in catalog.list_all()] == ["b", "a"]
+        assert [s.id for s in iter_skills(catalog_path)] == ["b", "a"]
+
+
+def test_catalog_suggest_top_k_ties() -> None:
+    """Test top-k selection orders ties by id, then catalog order."""
+    skills = [
+        Skill(id=skill_id, title=title, description="")
+        for skill_id, title in [
+            ("c", "pdf"),
+            ("a", "pdf"),
+            ("b", "pdf"),
+            ("a", "pdf again"),
+            ("d", "pdf pdf"),
+        ]
+    ]
+    catalog = Catalog(skills)
+    results = catalog.suggest("pdf", limit=3)
+    assert [(r.skill.id, r.skill.title, r.score) for r in results] == [
+        ("a", "pdf", 10),
+        ("a", "pdf again", 10),
+        ("b", "pdf", 10),
+    ]
+    assert catalog.suggest("pdf", limit=0) == []
+
+
+def test_catalog_suggest_bm25() -> None:
+    """Test BM25 ranks focused skills above long generic ones and keeps ID points."""
+    filler = " ".join(f"word{i}" for i in range(60))
+    catalog = Catalog(
+        [
+            Skill(id="alpha", title="Toolbox", description=f"{filler} docker {filler}"),
+            Skill(id="zeta", title="Containers", description="docker compose"),
+            Skill(id="docker", title="Images", description="Build images"),
+        ]
+    )
+    v1 = catalog.suggest("docker")
+    assert [r.skill.id for r in v1] == ["docker", "alpha", "zeta"]
+
+    bm25 = catalog.suggest("docker", ranker="bm25")
+    assert [r.skill.id for r in bm25] == ["docker", "zeta", "alpha"]
+    assert bm25[0].score == 100
+    assert 0 < bm25[2].score < bm25[1].score < 100
+
+    assert catalog.suggest("docker", limit=1, ranker="bm25") == bm25[:1]
+    with pytest.raises(ValueError):
+        catalog.suggest("docker", ranker="tf-idf")
+
+
+def test_catalog_suggest_explain() -> None:
+    """Test score breakdowns add up to the scores and stats are filled in."""
+    catalog = Catalog(
+        [
+            Skill(id="pdf-tools", title="PDF tools", description="Merge PDF files", tags=("pdf",)),
+            Skill(id="docs", title="Docs", description="Write docs", tags=(), aliases=("pdfdoc",)),
+            Skill(id="lint", title="Lint", description="Lint code", tags=("python",)),
+        ]
+    )
+    for query in ("pdf", "PDF tools", "docs", "pdfdoc", "lint python", "merge"):
+        for result in catalog.suggest(query):
+            contributions = explain_score(result.skill, query)
+            assert sum(c.points for c in contributions) == result.score
+
+    assert explain_score(catalog.skills[1], "pdf") == [
+        ScoreContribution("alias", "pdf", "prefix", 40)
+    ]
+    assert str(ScoreContribution("tags", "pdf", "contains", 20)) == "+20 tags contains 'pdf'"
+
+    stats = SuggestStats()
+    results = catalog.suggest("pdf", stats=stats)
+    assert [r.skill.id for r in results] == ["pdf-tools", "docs"]
+    assert stats.candidates == 2
+    assert stats.scored + stats.pruned == stats.candidates
+    assert {"tokenize", "index", "candidates", "score", "sort"} <= set(stats.timings)
+    assert stats.to_dict()["candidates"] == 2
+
+
+def test_catalog_suggest_fuzzy() -> None:
+    """Test fuzzy suggest tolerates typos and still ranks exact hits first."""
+    catalog = Catalog(
+        [
+            Skill(
+                id="kube-deploy", title="Kubernetes deploy", description="", tags=("kubernetes",)
+            ),
+            Skill(id="pdf-tools", title="PDF tools", description="Merge PDF files", tags=("pdf",)),
+            Skill(id="pdg", title="Program graphs", description="", tags=("pdg",)),
+        ]
+    )
+    assert catalog.suggest("kuberntes") == []
+    assert [(r.skill.id, r.score) for r in catalog.suggest("kuberntes", fuzzy=2)] == [
+        ("kube-deploy", 15 + 5)
+    ]
+    assert [r.skill.id for r in catalog.suggest("pdfs-tool", fuzzy=2)] == ["pdf-tools"]
+
+    results = catalog.suggest("pdf", fuzzy=1)
+    assert [(r.skill.id, r.score) for r in results] == [("pdf-tools", 75), ("pdg", 15 + 35)]
+    results = catalog.suggest("pdf", fuzzy=1, fuzzy_penalty=10)
+    assert [(r.skill.id, r.score) for r in results] == [("pdf-tools", 75), ("pdg", 10 + 30)]
+
+    with pytest.raises(ValueError):
+        catalog.suggest("pdf", fuzzy=1, ranker="bm25")
+    with pytest.raises(ValueError):
+        catalog.suggest("pdf", fuzzy=1, fuzzy_penalty=0)
+
+
+def test_catalog_suggest_fuzzy_whole_words() -> None:
+    """Test fuzzy words only score where they are whole words of a field."""
+    catalog = Catalog(
+        [
+            Skill(id="kube-deploy", title="Kubernetes deploy", description=""),
+            Skill(id="kube-ctl", title="Kubernetesctl tools", description=""),
+        ]
+    )
+    results = catalog.suggest("kuberntes tools", fuzzy=2)
+    assert [(r.skill.id, r.score) for r in results] == [("kube-ctl", 10), ("kube-deploy", 10 - 5)]
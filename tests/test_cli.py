@@ -1,5 +1,14 @@
 """Tests for CLI module."""
 
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
 from skillsctl.cli import main
 
 
@@ -28,3 +37,483 @@ def test_main_status_json() -> None:
     """Test status command with JSON output."""
     result = main(["status", "--json"])
     assert result == 0
+
+
+def _make_project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Create a project with a checked-out catalog and chdir into it."""
+    catalog_dir = tmp_path / ".claude" / "skills" / "catalog"
+    catalog_dir.mkdir(parents=True)
+    catalog_data = [
+        {
+            "id": "pdf-tools",
+            "title": "PDF Tools",
+            "description": "Work with PDF files",
+            "tags": ["pdf", "document"],
+            "paths": ["skills/pdf-tools"],
+        },
+        {
+            "id": "markdown-helper",
+            "title": "Markdown Helper",
+            "description": "Markdown\nformatting",
+            "tags": [],
+            "paths": ["skills/markdown-helper"],
+            "aliases": ["md"],
+        },
+    ]
+    (catalog_dir / "skills.json").write_text(json.dumps(catalog_data))
+    monkeypatch.setenv("SKILLS_REPO_URL", "https://github.com/test/skills.git")
+    monkeypatch.chdir(tmp_path)
+
+
+def _commit_catalog(project: Path, message: str = "catalog") -> None:
+    """Commit the project's skills directory and register it as the skills submodule.
+
+    The repository is created on the first call; later calls commit changes to it.
+    """
+    skills = project / ".claude" / "skills"
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    if not (skills / ".git").exists():
+        subprocess.run([*git, "init", "-q"], cwd=skills, check=True)
+        (project / ".gitmodules").write_text('[submodule "skills"]\n\tpath = .claude/skills\n')
+    subprocess.run([*git, "add", "."], cwd=skills, check=True)
+    subprocess.run([*git, "commit", "-q", "-m", message], cwd=skills, check=True)
+
+
+def test_main_catalog_stream_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test streamed catalog JSON is identical to the regular output."""
+    _make_project(tmp_path, monkeypatch)
+
+    assert main(["catalog", "--json"]) == 0
+    regular = capsys.readouterr().out
+    assert main(["catalog", "--json", "--stream"]) == 0
+    streamed = capsys.readouterr().out
+
+    assert streamed == regular
+    assert len(json.loads(streamed)) == 2
+
+
+def test_main_ndjson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test NDJSON output has one line per JSON element, plus a trailer when paged."""
+    _make_project(tmp_path, monkeypatch)
+    for command in (["catalog"], ["catalog", "--stream"], ["suggest", "o"]):
+        assert main([*command, "--json"]) == 0
+        expected = json.loads(capsys.readouterr().out)
+        assert main([*command, "--ndjson"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == expected
+        assert len(lines) == 2
+
+    assert main(["suggest", "o", "--ndjson", "--explain", "--limit", "1", "--offset", "0"]) == 0
+    *results, trailer = map(json.loads, capsys.readouterr().out.splitlines())
+    assert len(results) == 1 and "explain" in results[0]
+    assert set(trailer) == {"stats", "offset", "next_cursor"}
+    assert main(["catalog", "--ndjson", "--limit", "1", "--cursor", trailer["next_cursor"]]) == 1
+    assert "different query" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        main(["catalog", "--json", "--ndjson"])
+    with pytest.raises(SystemExit):
+        main(["catalog", "validate", "--ndjson"])
+
+
+def test_main_ndjson_closed_pipe(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test streamed output into a pipe closed early (e.g. | head -1) ends quietly."""
+    _make_project(tmp_path, monkeypatch)
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    with open(write_fd, "w") as stdout:
+        monkeypatch.setattr(sys, "stdout", stdout)
+        for command in (["suggest", "o", "--ndjson"], ["catalog", "--stream", "--json"]):
+            assert main(command) == 0
+
+
+def test_main_tags_and_facets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test --tag filters catalog and suggest, and --facets counts tags."""
+    _make_project(tmp_path, monkeypatch)
+    assert main(["catalog", "--facets", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out) == {"document": 1, "pdf": 1}
+    assert main(["catalog", "--facets", "--tag", "nope", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out) == {}
+    assert main(["catalog", "--facets"]) == 0
+    assert "document  1" in capsys.readouterr().out
+
+    for stream in ([], ["--stream"]):
+        assert main(["catalog", "--json", "--tag", "PDF", "--tag", "document", *stream]) == 0
+        assert [s["id"] for s in json.loads(capsys.readouterr().out)] == ["pdf-tools"]
+        assert main(["suggest", "o", "--json", "--tag", "pdf", *stream]) == 0
+        assert [r["id"] for r in json.loads(capsys.readouterr().out)] == ["pdf-tools"]
+        assert main(["suggest", "o", "--json", "--tag", "pdf", "--tag", "nope", *stream]) == 0
+        assert json.loads(capsys.readouterr().out) == []
+
+    for flags in (["--stream"], ["--limit", "1"], ["--diff", "HEAD..HEAD"]):
+        with pytest.raises(SystemExit):
+            main(["catalog", "--facets", *flags])
+
+
+def test_main_catalog_paged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test catalog pages follow cursors and cursors expire with the catalog."""
+    _make_project(tmp_path, monkeypatch)
+    assert main(["catalog", "--json", "--limit", "1"]) == 0
+    assert [s["id"] for s in json.loads(capsys.readouterr().out)] == ["pdf-tools"]
+
+    for stream in ([], ["--stream"]):
+        assert main(["catalog", "--json", "--limit", "1", "--offset", "0", *stream]) == 0
+        first = json.loads(capsys.readouterr().out)
+        assert [s["id"] for s in first["skills"]] == ["pdf-tools"]
+        assert main(["catalog", "--json", "--limit", "1", "--cursor", first["next_cursor"]]) == 0
+        second = json.loads(capsys.readouterr().out)
+        assert [s["id"] for s in second["skills"]] == ["markdown-helper"]
+        assert (second["offset"], second["next_cursor"]) == (1, None)
+
+    assert main(["catalog", "--limit", "1", "--offset", "0"]) == 0
+    assert f"--cursor {first['next_cursor']}" in capsys.readouterr().out
+    catalog_path = tmp_path / ".claude" / "skills" / "catalog" / "skills.json"
+    catalog_path.write_text(catalog_path.read_text().replace("Work with", "Edit"))
+    assert main(["catalog", "--limit", "1", "--cursor", first["next_cursor"]]) == 1
+    assert "Catalog changed" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main(["catalog", "--offset", "1", "--cursor", first["next_cursor"]])
+
+
+def test_main_suggest_paged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test suggest pages by offset and by cursor match the full ranking."""
+    _make_project(tmp_path, monkeypatch)
+    assert main(["suggest", "o", "--json"]) == 0
+    full = [r["id"] for r in json.loads(capsys.readouterr().out)]
+    assert len(full) == 2
+
+    assert main(["suggest", "o", "--json", "--limit", "1", "--offset", "1"]) == 0
+    assert [r["id"] for r in json.loads(capsys.readouterr().out)["results"]] == full[1:]
+    for stream in ([], ["--stream"]):
+        assert main(["suggest", "o", "--json", "--limit", "1", "--offset", "0", *stream]) == 0
+        page = json.loads(capsys.readouterr().out)
+        ids = [r["id"] for r in page["results"]]
+        while page["next_cursor"] is not None:
+            next_page = ["--cursor", page["next_cursor"]]
+            assert main(["suggest", "o", "--json", "--limit", "1", *next_page]) == 0
+            page = json.loads(capsys.readouterr().out)
+            ids += [r["id"] for r in page["results"]]
+        assert ids == full
+
+    assert main(["suggest", "o", "--limit", "1", "--offset", "0", "--json"]) == 0
+    cursor = json.loads(capsys.readouterr().out)["next_cursor"]
+    assert main(["suggest", "pdf", "--limit", "1", "--cursor", cursor]) == 1
+    assert "different query" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main(["suggest", "--batch", "--offset", "0"])
+
+
+def test_main_suggest_stream(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test streamed suggest returns the same results."""
+    _make_project(tmp_path, monkeypatch)
+
+    assert main(["suggest", "pdf", "--json"]) == 0
+    regular = capsys.readouterr().out
+    assert main(["suggest", "pdf", "--json", "--stream"]) == 0
+    assert capsys.readouterr().out == regular
+
+
+def test_main_catalog_from_object_store(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test catalog is read from the submodule's HEAD when not checked out."""
+    _make_project(tmp_path, monkeypatch)
+    skills = tmp_path / ".claude" / "skills"
+    _commit_catalog(tmp_path)
+    (skills / "catalog" / "skills.json").unlink()
+
+    for _ in range(2):  # cold, then served from the blob-keyed cache
+        assert main(["catalog", "--json"]) == 0
+        ids = [s["id"] for s in json.loads(capsys.readouterr().out)]
+        assert ids == ["pdf-tools", "markdown-helper"]
+
+
+def test_main_catalog_diff(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test catalog --diff reports changes between submodule revisions."""
+    _make_project(tmp_path, monkeypatch)
+    skills = tmp_path / ".claude" / "skills"
+    catalog_path = skills / "catalog" / "skills.json"
+    _commit_catalog(tmp_path, "v1")
+
+    data = json.loads(catalog_path.read_text())
+    data[0]["title"] = "PDF Toolkit"
+    data[1] = {"id": "csv-tools", "title": "CSV Tools"}
+    catalog_path.write_text(json.dumps(data))
+    _commit_catalog(tmp_path, "v2")
+
+    assert main(["catalog", "--diff", "HEAD~1..HEAD", "--json"]) == 0
+    result = json.loads(capsys.readouterr().out)
+    assert [s["id"] for s in result["added"]] == ["csv-tools"]
+    assert [s["id"] for s in result["removed"]] == ["markdown-helper"]
+    assert [(c["id"], c["fields"]) for c in result["changed"]] == [("pdf-tools", ["title"])]
+
+    assert main(["catalog", "--diff", "HEAD..", "--json"]) == 0
+    result = json.loads(capsys.readouterr().out)
+    assert result["from"]["object"] == result["to"]["object"]
+    assert result["added"] == result["removed"] == result["changed"] == []
+
+    assert main(["catalog", "--diff", "HEAD~5..HEAD"]) == 1
+
+
+def test_main_suggest_federated(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test suggest searches all sources as one catalog, first source winning; status lists them."""
+    monkeypatch.delenv("SKILLS_REPO_URL", raising=False)
+    monkeypatch.chdir(tmp_path)
+    sources = [
+        ("team", [{"id": "pdf-tools", "title": "Team PDF", "tags": ["pdf"]}]),
+        (
+            "vendor",
+            [
+                {"id": "pdf-tools", "title": "Vendor PDF", "tags": ["pdf"]},
+                {"id": "pdf-merge", "title": "Merge PDF files", "tags": ["pdf"]},
+            ],
+        ),
+    ]
+    for name, skills in sources:
+        catalog_dir = tmp_path / ".claude" / "skills" / name / "catalog"
+        catalog_dir.mkdir(parents=True)
+        (catalog_dir / "skills.json").write_text(json.dumps(skills))
+    config = {
+        "sources": [
+            {"name": name, "repo_url": f"https://example.com/{name}.git"} for name, _ in sources
+        ]
+    }
+    (tmp_path / ".claude" / "skills.config.json").write_text(json.dumps(config))
+
+    for stream in ([], ["--stream"]):
+        assert main(["suggest", "pdf", "--json", *stream]) == 0
+        results = json.loads(capsys.readouterr().out)
+        assert [(r["id"], r["title"]) for r in results] == [
+            ("pdf-merge", "Merge PDF files"),
+            ("pdf-tools", "Team PDF"),
+        ]
+
+    assert main(["status", "--json"]) == 0
+    status = json.loads(capsys.readouterr().out)
+    assert [(s["name"], s["skills_dir"]) for s in status["sources"]] == [
+        ("team", ".claude/skills/team"),
+        ("vendor", ".claude/skills/vendor"),
+    ]
+    assert main(["status"]) == 0
+    assert "Sources (2):\n  - team: .claude/skills/team" in capsys.readouterr().out
+
+
+def test_main_catalog_validate(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test catalog validate reports problems and caches the verdict."""
+    _make_project(tmp_path, monkeypatch)
+    skills = tmp_path / ".claude" / "skills"
+    catalog_path = skills / "catalog" / "skills.json"
+    assert main(["catalog", "validate"]) == 0
+    assert "Catalog is valid" in capsys.readouterr().out
+
+    data = json.loads(catalog_path.read_text())
+    data.append({"id": "pdf-tools", "title": "Again"})
+    catalog_path.write_text(json.dumps(data))
+    _commit_catalog(tmp_path)
+
+    for _ in range(2):  # validated, then served from the cached verdict
+        assert main(["catalog", "validate", "--json"]) == 1
+        result = json.loads(capsys.readouterr().out)
+        assert result["valid"] is False
+        assert [(e["location"], e["id"]) for e in result["errors"]] == [
+            ("catalog/skills.json[2]", "pdf-tools")
+        ]
+    assert list((skills / ".git" / "skillsctl" / "verdicts").glob("*.json"))
+
+
+def test_main_install_by_alias(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test installing and removing by alias records the canonical ID."""
+    _make_project(tmp_path, monkeypatch)
+    _commit_catalog(tmp_path)
+
+    assert main(["install", "md", "--yes"]) == 0
+    manifest = tmp_path / ".claude" / "skills.manifest"
+    assert "markdown-helper" in manifest.read_text()
+    assert "md" not in manifest.read_text().split()
+
+    assert main(["remove", "md", "--yes"]) == 0
+    assert "markdown-helper" not in manifest.read_text()
+
+
+def test_main_suggest_persistent_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test install writes the search index and suggest answers from it."""
+    _make_project(tmp_path, monkeypatch)
+    skills = tmp_path / ".claude" / "skills"
+    _commit_catalog(tmp_path)
+
+    assert main(["suggest", "markdown", "--json"]) == 0
+    expected = json.loads(capsys.readouterr().out)
+
+    assert main(["install", "pdf-tools", "--yes"]) == 0
+    index_path = skills / ".git" / "skillsctl" / "search.idx"
+    assert index_path.exists()
+    capsys.readouterr()
+
+    assert main(["suggest", "markdown", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out) == expected
+    assert main(["suggest", "md", "--json"]) == 0
+    assert [r["id"] for r in json.loads(capsys.readouterr().out)] == ["markdown-helper"]
+
+
+def test_main_suggest_result_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test a repeated query is answered from the result cache until the catalog changes."""
+    _make_project(tmp_path, monkeypatch)
+    skills = tmp_path / ".claude" / "skills"
+    _commit_catalog(tmp_path)
+
+    assert main(["suggest", "PDF", "--json"]) == 0
+    expected = capsys.readouterr().out
+    assert list((skills / ".git" / "skillsctl" / "results").iterdir())
+
+    def fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("catalog loaded")
+
+    with monkeypatch.context() as m:
+        m.setattr("skillsctl.commands.load_federated_catalog", fail)
+        assert main(["suggest", "pdf", "--json"]) == 0
+        assert capsys.readouterr().out == expected
+
+    catalog_path = skills / "catalog" / "skills.json"
+    catalog_path.write_text(catalog_path.read_text().replace("PDF Tools", "PDF Kit"))
+    _commit_catalog(tmp_path, "rename")
+    assert main(["suggest", "pdf", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)[0]["title"] == "PDF Kit"
+
+
+def test_main_suggest_bm25(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test suggest with the BM25 ranker."""
+    _make_project(tmp_path, monkeypatch)
+    assert main(["suggest", "formatting", "--ranker", "bm25", "--json"]) == 0
+    results = json.loads(capsys.readouterr().out)
+    assert [r["id"] for r in results] == ["markdown-helper"]
+    assert isinstance(results[0]["score"], float)
+
+    with pytest.raises(SystemExit):
+        main(["suggest", "pdf", "--ranker", "bm25", "--stream"])
+
+
+def test_main_suggest_fuzzy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test suggest with typo tolerance."""
+    _make_project(tmp_path, monkeypatch)
+    assert main(["suggest", "markdwon", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out) == []
+    assert main(["suggest", "markdwon", "--fuzzy", "--json"]) == 0
+    assert [r["id"] for r in json.loads(capsys.readouterr().out)] == ["markdown-helper"]
+
+    for flags in (["--stream"], ["--ranker", "bm25"], ["--fuzzy-penalty", "0"]):
+        with pytest.raises(SystemExit):
+            main(["suggest", "markdwon", "--fuzzy", "1", *flags])
+
+
+def test_main_suggest_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test suggest --workers ranks like a serial suggest."""
+    _make_project(tmp_path, monkeypatch)
+    assert main(["suggest", "pdf", "--json"]) == 0
+    serial = json.loads(capsys.readouterr().out)
+    assert main(["suggest", "pdf", "--json", "--workers", "2"]) == 0
+    assert json.loads(capsys.readouterr().out) == serial
+
+    for flags in (
+        ["--workers", "0"],
+        ["--workers", "2", "--stream"],
+        ["--workers", "2", "--batch"],
+    ):
+        with pytest.raises(SystemExit):
+            main(["suggest", "pdf", *flags])
+
+
+def test_main_suggest_explain(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test suggest --explain reports per-field points and stats."""
+    _make_project(tmp_path, monkeypatch)
+    assert main(["suggest", "pdf", "--explain"]) == 0
+    out = capsys.readouterr().out
+    assert "+40 id prefix 'pdf'" in out
+    assert "+20 tags contains 'pdf'" in out
+    assert "Candidates: 1 (1 scored, 0 pruned)" in out
+    assert "Timings: tokenize" in out
+
+    assert main(["suggest", "pdf", "--explain", "--json"]) == 0
+    data = json.loads(capsys.readouterr().out)
+    result = data["results"][0]
+    assert sum(c["points"] for c in result["explain"]) == result["score"]
+    assert data["stats"]["candidates"] == 1
+    assert set(data["stats"]["timings_ms"]) >= {"tokenize", "candidates", "score", "sort"}
+
+    for flags in (["--stream"], ["--ranker", "bm25"], ["--fuzzy"]):
+        with pytest.raises(SystemExit):
+            main(["suggest", "pdf", "--explain", *flags])
+
+
+def test_main_suggest_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test batch suggest answers one NDJSON line per query."""
+    _make_project(tmp_path, monkeypatch)
+    requests = [
+        {"query": "pdf"},
+        {"query": "markdown", "limit": 1},
+        "not an object",
+        {"limit": 3},
+    ]
+    stdin = "\n".join(json.dumps(r) for r in requests) + "\n\n"
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+
+    assert main(["suggest", "--batch"]) == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(lines) == 4
+    assert lines[0]["query"] == "pdf"
+    assert [r["id"] for r in lines[0]["results"]] == ["pdf-tools"]
+    assert [r["id"] for r in lines[1]["results"]] == ["markdown-helper"]
+    assert lines[2]["line"] == 3 and "error" in lines[2]
+    assert lines[3]["line"] == 4 and "error" in lines[3]
+
+    with pytest.raises(SystemExit):
+        main(["suggest"])
+
+
+def test_main_suggest_batch_keystrokes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test batch answers search-as-you-type queries like separate suggest calls."""
+    _make_project(tmp_path, monkeypatch)
+    queries = ["m", "ma", "mark", "markdown f", "markdown fo", "md", "p", "pdf"]
+    expected = []
+    for query in queries:
+        assert main(["suggest", query, "--json"]) == 0
+        expected.append(json.loads(capsys.readouterr().out))
+
+    stdin = "".join(json.dumps({"query": query}) + "\n" for query in queries)
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    assert main(["suggest", "--batch"]) == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["results"] for line in lines] == expected
@@ -94,3 +94,73 @@ def test_config_save() -> None:
             data = json.load(f)
         assert data["repo_url"] == "https://github.com/test/skills.git"
         assert data["branch"] == "feature"
+
+
+def test_config_load_sources(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test loading an ordered list of sources."""
+    monkeypatch.delenv("SKILLS_REPO_URL", raising=False)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir) / ".claude"
+        config_dir.mkdir()
+        sources = [
+            {"name": "team", "repo_url": "https://github.com/org/team.git"},
+            {
+                "name": "vendor",
+                "repo_url": "https://github.com/vendor/skills.git",
+                "branch": "stable",
+                "skills_dir": ".claude/vendor-skills",
+            },
+        ]
+        (config_dir / "skills.config.json").write_text(json.dumps({"sources": sources}))
+
+        config = Config.load(Path(tmpdir))
+        assert [s.name for s in config.sources] == ["team", "vendor"]
+        assert config.repo_url == "https://github.com/org/team.git"
+        assert config.skills_dir == ".claude/skills/team"
+        assert config.sources[1].branch == "stable"
+        assert config.sources[1].skills_dir == ".claude/vendor-skills"
+
+        config.save(Path(tmpdir))
+        assert Config.load(Path(tmpdir)).sources == config.sources
+
+
+def test_config_load_sources_invalid(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test sources without a URL or with duplicate names are rejected."""
+    monkeypatch.delenv("SKILLS_REPO_URL", raising=False)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir) / ".claude"
+        config_dir.mkdir()
+        config_file = config_dir / "skills.config.json"
+
+        config_file.write_text(json.dumps({"sources": [{"name": "team"}]}))
+        with pytest.raises(ConfigError, match="'name' and 'repo_url'"):
+            Config.load(Path(tmpdir))
+
+        source = {"name": "team", "repo_url": "https://github.com/org/team.git"}
+        config_file.write_text(json.dumps({"sources": [source, source]}))
+        with pytest.raises(ConfigError, match="Duplicate source names: team"):
+            Config.load(Path(tmpdir))
+
+
+def test_config_load_not_an_object(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a config file holding an array or a string is ignored."""
+    monkeypatch.delenv("SKILLS_REPO_URL", raising=False)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir) / ".claude"
+        config_dir.mkdir()
+        config_file = config_dir / "skills.config.json"
+
+        for content in (["repo_url", "sources"], "repo_url"):
+            config_file.write_text(json.dumps(content))
+            with pytest.raises(ConfigError, match="No skills repository URL"):
+                Config.load(Path(tmpdir))
+
+        monkeypatch.setenv("SKILLS_REPO_URL", "https://github.com/env/skills.git")
+        assert Config.load(Path(tmpdir)).repo_url == "https://github.com/env/skills.git"
+
+
+def test_config_single_source_default() -> None:
+    """Test a plain repo_url config has one source at skills_dir."""
+    config = Config(repo_url="https://github.com/test/skills.git")
+    assert len(config.sources) == 1
+    assert config.sources[0].skills_dir == ".claude/skills"
@@ -0,0 +1,43 @@
+"""Tests for delta module."""
+
+from skillsctl.catalog import Catalog, Skill
+from skillsctl.delta import diff_catalogs
+
+
+def test_diff_catalogs() -> None:
+    """Test added, removed and changed skills are reported in order."""
+    old = Catalog(
+        [
+            Skill(id="keep", title="Keep", description=""),
+            Skill(id="gone", title="Gone", description=""),
+            Skill(id="edit", title="Edit", description="", tags=("a",)),
+        ]
+    )
+    new = Catalog(
+        [
+            Skill(id="edit", title="Edited", description="", tags=("a", "b")),
+            Skill(id="keep", title="Keep", description=""),
+            Skill(id="new", title="New", description=""),
+        ]
+    )
+
+    delta = diff_catalogs(old, new)
+    assert [s.id for s in delta.added] == ["new"]
+    assert [s.id for s in delta.removed] == ["gone"]
+    assert len(delta.changed) == 1
+    change = delta.changed[0]
+    assert change.fields == ("title", "tags")
+    assert change.before.title == "Edit"
+    after = change.to_dict()["after"]
+    assert isinstance(after, dict) and after["title"] == "Edited"
+
+
+def test_diff_catalogs_identical() -> None:
+    """Test identical catalogs produce an empty delta."""
+    skills = [
+        Skill(id="a", title="A", description="", tags=("x",)),
+        Skill(id="b", title="B", description=""),
+    ]
+    delta = diff_catalogs(Catalog(skills), Catalog(list(skills)))
+    assert delta.is_empty()
+    assert delta.to_dict() == {"added": [], "removed": [], "changed": []}
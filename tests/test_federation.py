@@ -0,0 +1,45 @@
+"""Tests for federation module."""
+
+import threading
+
+from skillsctl.catalog import Catalog, Skill
+from skillsctl.config import Source
+from skillsctl.federation import FederatedCatalog, load_sources
+
+
+def _catalog(*ids: str, title: str = "") -> Catalog:
+    return Catalog([Skill(id=i, title=title or i, description="") for i in ids])
+
+
+def test_federated_catalog_precedence() -> None:
+    """Test the first source defining an ID wins."""
+    catalog = FederatedCatalog(
+        [
+            ("team", _catalog("shared", "team-only", title="Team")),
+            ("vendor", _catalog("vendor-only", "shared", title="Vendor")),
+        ]
+    )
+    assert [s.id for s in catalog.list_all()] == ["shared", "team-only", "vendor-only"]
+    shared = catalog.get("shared")
+    assert shared is not None
+    assert shared.title == "Team"
+    assert catalog.source_of("shared") == "team"
+    assert catalog.source_of("vendor-only") == "vendor"
+    assert catalog.source_of("missing") is None
+    assert catalog.shadowed == [("shared", "vendor")]
+    assert [r.skill.title for r in catalog.suggest("shared")] == ["Team"]
+
+
+def test_load_sources_concurrent() -> None:
+    """Test sources load on separate threads and absent catalogs are skipped."""
+    sources = [Source(name, f"https://example.com/{name}.git") for name in ("a", "b", "c")]
+    barrier = threading.Barrier(len(sources), timeout=5)
+
+    def load(source: Source) -> Catalog | None:
+        barrier.wait()  # Deadlocks unless all sources load at once
+        return None if source.name == "b" else _catalog(f"{source.name}-skill")
+
+    catalog = load_sources(sources, load)
+    assert catalog is not None
+    assert [s.id for s in catalog.list_all()] == ["a-skill", "c-skill"]
+    assert load_sources(sources[1:2], lambda _source: None) is None
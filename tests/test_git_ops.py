@@ -0,0 +1,90 @@
+"""Tests for git_ops module."""
+
+import subprocess
+from pathlib import Path
+
+from skillsctl.git_ops import GitOps
+
+
+def _git(cwd: Path, *args: str) -> str:
+    """Run git with a fixed identity and return stdout."""
+    result = subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def _make_skills_repo(tmp_path: Path) -> Path:
+    """Create a nested git repository with a committed catalog."""
+    repo = tmp_path / ".claude" / "skills"
+    (repo / "catalog").mkdir(parents=True)
+    (repo / "catalog" / "skills.json").write_text('[{"id": "a", "title": "A"}]')
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "catalog")
+    return repo
+
+
+def test_head_commit_matches_git(tmp_path: Path) -> None:
+    """Test HEAD resolution from files agrees with git, incl. packed refs."""
+    repo = _make_skills_repo(tmp_path)
+    git = GitOps(tmp_path)
+    skills_dir = Path(".claude/skills")
+
+    expected = _git(repo, "rev-parse", "HEAD")
+    assert git.head_commit(skills_dir) == expected
+
+    _git(repo, "pack-refs", "--all")
+    assert git.head_commit(skills_dir) == expected
+
+    _git(repo, "checkout", "-q", "--detach")
+    assert git.head_commit(skills_dir) == expected
+
+
+def test_rev_parse_and_read_blob(tmp_path: Path) -> None:
+    """Test reading a committed file from the object database."""
+    _make_skills_repo(tmp_path)
+    git = GitOps(tmp_path)
+    skills_dir = Path(".claude/skills")
+
+    blob = git.rev_parse(skills_dir, "HEAD:catalog/skills.json")
+    assert blob is not None
+    assert git.read_blob(skills_dir, blob) == b'[{"id": "a", "title": "A"}]'
+    assert git.rev_parse(skills_dir, "HEAD:missing.json") is None
+
+
+def test_submodule_git_dir_from_gitfile(tmp_path: Path) -> None:
+    """Test `.git` files pointing elsewhere are followed."""
+    modules = tmp_path / ".git" / "modules" / "skills"
+    modules.mkdir(parents=True)
+    skills = tmp_path / ".claude" / "skills"
+    skills.mkdir(parents=True)
+    (skills / ".git").write_text("gitdir: ../../.git/modules/skills\n")
+
+    assert GitOps(tmp_path).submodule_git_dir(Path(".claude/skills")) == modules.resolve()
+    assert GitOps(tmp_path).submodule_git_dir(Path("missing")) is None
+
+
+def test_read_tree_blobs(tmp_path: Path) -> None:
+    """Test reading catalog shards from a tree object."""
+    repo = _make_skills_repo(tmp_path)
+    shard_dir = repo / "catalog" / "skills.d"
+    shard_dir.mkdir()
+    (shard_dir / "a.json").write_text("[]")
+    (shard_dir / "b.json").write_bytes(b'[{"id": "b", "title": "B\\n"}]')
+    (shard_dir / "notes.txt").write_text("ignored")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "shards")
+
+    git = GitOps(tmp_path)
+    skills_dir = Path(".claude/skills")
+    tree = git.rev_parse(skills_dir, "HEAD:catalog/skills.d")
+    assert tree is not None
+    assert git.read_tree_blobs(skills_dir, tree) == [
+        ("a.json", b"[]"),
+        ("b.json", b'[{"id": "b", "title": "B\\n"}]'),
+    ]
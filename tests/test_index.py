@@ -0,0 +1,297 @@
+"""Tests for index module."""
+
+import random
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from skillsctl import catalog as catalog_module
+from skillsctl.catalog import (
+    RANKERS,
+    Catalog,
+    RankPosition,
+    Skill,
+    SuggestSession,
+    score_ids,
+    suggest_stream,
+    tokenize,
+)
+from skillsctl.index import KeyTable, PositionSet, PrefixIndex, SearchIndex
+from skillsctl.index_cache import open_search_index, write_search_index
+
+WORDS = ["pdf", "docker", "kube", "Kelvin", "café", "x86", "go", "re-write", "a_b", "ÄPI"]
+
+
+def _random_catalog(seed: int, size: int = 200) -> Catalog:
+    rng = random.Random(seed)
+
+    def text(n: int) -> str:
+        return rng.choice([" ", "-", "/", ""]).join(rng.choice(WORDS) for _ in range(n))
+
+    return Catalog(
+        [
+            Skill(
+                id=f"{rng.choice(WORDS)}-{i}",
+                title=text(3),
+                description=text(rng.randint(0, 8)),
+                tags=tuple(text(1) for _ in range(rng.randint(0, 3))),
+                aliases=tuple(text(1) for _ in range(rng.randint(0, 2))),
+            )
+            for i in range(size)
+        ]
+    )
+
+
+QUERIES = ["", "p", "pd", "pdf", "kube docker", "KELVIN", "caf", "x8", "re-wr", "zzz", "a b"]
+QUERIES += [w.lower()[:n] for w in WORDS for n in (2, 4)]
+
+
+def test_suggest_matches_full_scan() -> None:
+    """Test indexed suggest returns exactly the scores of a full scan."""
+    for seed in range(5):
+        catalog = _random_catalog(seed)
+        for query in QUERIES:
+            for limit in (1, 3, 50):
+                expected = suggest_stream(catalog.skills, query, limit=limit)
+                assert catalog.suggest(query, limit=limit) == expected, (query, limit)
+
+
+def test_mapped_index_matches_in_memory(tmp_path: Path) -> None:
+    """Test suggest answers identically from a persistent (mapped) index."""
+    queries = ["", "p", "pdf", "kube docker", "KELVIN", "caf", "x8", "re-wr", "zzz", "a b"]
+    queries += [w.lower()[:n] for w in WORDS for n in (2, 4)]
+    for seed in range(3):
+        catalog = _random_catalog(seed)
+        index_path = tmp_path / f"{seed}.idx"
+        write_search_index(index_path, catalog.skills, "0" * 40)
+        index = open_search_index(index_path, "0" * 40)
+        assert index is not None
+        mapped = Catalog(list(catalog.skills))
+        mapped.use_search_index(index)
+        for query in queries:
+            for limit in (1, 3, 50):
+                for ranker in RANKERS:
+                    expected = catalog.suggest(query, limit=limit, ranker=ranker)
+                    actual = mapped.suggest(query, limit=limit, ranker=ranker)
+                    assert actual == expected, (query, limit, ranker)
+                expected = catalog.suggest(query, limit=limit, fuzzy=2)
+                assert mapped.suggest(query, limit=limit, fuzzy=2) == expected, (query, limit)
+
+
+def test_token_hits_narrow_to_matches() -> None:
+    """Test token hits count the query tokens each matching skill contains."""
+    catalog = _random_catalog(7)
+    skills = [
+        *catalog.skills,
+        Skill(id="zeta", title="Zebra tools", description="Stripes"),
+        Skill(id="other", title="Other", description="Uses zebra/stripes", aliases=("zebra",)),
+        Skill(id="zebra-kit", title="Kit", description=""),
+    ]
+    index = SearchIndex.for_skills(skills, PrefixIndex.for_skills(skills))
+    _, tokens = tokenize("zebra stripe")
+    hits = index.token_hits(tokens)
+    assert hits is not None
+    assert {skills[pos].id: count for pos, count in hits.items()} == {"zeta": 2, "other": 2}
+    assert sorted(skills[pos].id for pos in index.prefix_index.prefixed("zebra")) == [
+        "other",
+        "zebra-kit",
+    ]
+    assert index.token_hits(["o"]) is None
+
+
+def test_prefix_index() -> None:
+    """Test exact and prefix lookups over IDs and aliases."""
+    index = PrefixIndex(["pdf-tools", "Markdown", "pdf"], [("md", "PDFx"), (), ("MD",)])
+    assert sorted(index.prefixed("pdf")) == [0, 0, 2]
+    assert list(index.prefixed("m")) == [1, 0, 2]
+    assert len(index.prefixed("")) == 6
+    assert list(index.prefixed("q")) == []
+    assert list(index.exact("md")) == [0, 2]
+    assert index.alias_owner("md") == "pdf-tools"
+    assert index.alias_owner("MD") == "pdf"
+    assert index.alias_owner("Md") is None
+
+
+def _levenshtein(a: str, b: str) -> int:
+    row = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        previous, row[0] = row[0], i
+        for j in range(1, len(b) + 1):
+            substitution = previous + (char != b[j - 1])
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, substitution)
+    return row[-1]
+
+
+def test_key_table_fuzzy_matches_brute_force() -> None:
+    """Test the fuzzy walk finds exactly the keys within the edit distance."""
+    rng = random.Random(3)
+    keys = sorted({"".join(rng.choices("abcd", k=rng.randint(0, 6))) for _ in range(300)})
+    table = KeyTable(keys, range(len(keys)))
+    for term in ["", "a", "abc", "dcba", "abcdab", "bbbbbbbb"]:
+        for distance in range(4):
+            expected = [
+                (key, pos, _levenshtein(term, key))
+                for pos, key in enumerate(keys)
+                if _levenshtein(term, key) <= distance
+            ]
+            assert table.fuzzy(term, distance) == expected, (term, distance)
+
+
+def test_fuzzy_suggest_top_k_matches_full_ranking() -> None:
+    """Test fuzzy suggest prunes without changing the best results."""
+    queries = ["pdg", "dokcer", "kbue dcoker", "kelvn", "x87", "rewrite", "cafe"]
+    for seed in range(3):
+        catalog = _random_catalog(seed)
+        for query in queries:
+            ranking = catalog.suggest(query, limit=len(catalog.skills), fuzzy=2)
+            assert ranking, query
+            for limit in (1, 3, 10):
+                assert catalog.suggest(query, limit=limit, fuzzy=2) == ranking[:limit], query
+
+
+def test_vector_scorer_matches_python(tmp_path: Path) -> None:
+    """Test the NumPy backend ranks exactly like pure-Python scoring."""
+    pytest.importorskip("numpy")
+    from skillsctl.vector import VectorScorer
+
+    for seed in range(3):
+        catalog = _random_catalog(seed)
+        positions = {id(skill): pos for pos, skill in enumerate(catalog.skills)}
+        index_path = tmp_path / f"{seed}.idx"
+        write_search_index(index_path, catalog.skills, "0" * 40)
+        mapped = open_search_index(index_path, "0" * 40)
+        assert mapped is not None
+        for index in (catalog.search_index, mapped):
+            scorer = VectorScorer(index)
+            for query in QUERIES:
+                query_lower, tokens = tokenize(query)
+                id_points = {
+                    pos: score_ids(index.fields(pos), query_lower)
+                    for pos in set(index.prefix_index.prefixed(query_lower))
+                }
+                for limit in (1, 3, 50):
+                    expected = [
+                        (r.score, positions[id(r.skill)])
+                        for r in catalog.suggest(query, limit=limit)
+                    ]
+                    assert scorer.rank(tokens, id_points, limit) == expected, (query, limit)
+
+
+def test_suggest_vector_backend_or_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test broad queries give the same results with or without the NumPy backend."""
+    expected = {query: _random_catalog(4).suggest(query) for query in QUERIES}
+    monkeypatch.setattr(catalog_module, "VECTOR_MIN_CANDIDATES", 0)
+
+    def check(vectorized: bool) -> None:
+        catalog = _random_catalog(4)
+        catalog.suggest("pdf", ranker="bm25")  # computes the postings' field bits
+        assert {query: catalog.suggest(query) for query in QUERIES} == expected
+        assert (catalog._vector is not None) == vectorized
+
+    with monkeypatch.context() as m:
+        m.setattr("skillsctl.vector.HAVE_NUMPY", False)
+        check(vectorized=False)
+    pytest.importorskip("numpy")
+    check(vectorized=True)
+
+
+def test_session_matches_suggest() -> None:
+    """Test search-as-you-type sessions return what suggest returns for each keystroke."""
+    typed = ["kube docker", "pdf-x86", "re-write caf", "KELVIN go"]
+    for seed in range(3):
+        catalog = _random_catalog(seed)
+        for max_candidates in (0, 20, 1000):
+            session = SuggestSession(catalog, max_candidates=max_candidates)
+            for text in typed:
+                # Type it, delete back to the first word, type it again
+                keystrokes = [text[:n] for n in range(1, len(text) + 1)]
+                keystrokes += keystrokes[::-1][: len(text) // 2] + keystrokes
+                for query in keystrokes:
+                    for limit in (3, 50):
+                        expected = catalog.suggest(query, limit=limit)
+                        assert session.suggest(query, limit=limit) == expected, (query, limit)
+
+
+def test_pages_match_full_ranking(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test paging with RankPosition walks the full ranking, duplicate IDs included."""
+    base = _random_catalog(5)
+    catalog = Catalog(base.skills + base.skills[::7])
+    catalog.suggest("pdf", ranker="bm25")  # computes the postings' field bits
+    monkeypatch.setattr(catalog_module, "VECTOR_MIN_CANDIDATES", 0)
+    for query in ["", "p", "pdf", "kube docker", "KELVIN", "re-wr", "a b"]:
+        for ranker in RANKERS:
+            full = catalog.suggest(query, limit=len(catalog.skills), ranker=ranker)
+            for size in (1, 3, 7):
+                pages: list[object] = []
+                after = None
+                while page := catalog.suggest(query, limit=size, ranker=ranker, after=after):
+                    pages += page
+                    if ranker == "v1":
+                        streamed = suggest_stream(catalog.skills, query, limit=size, after=after)
+                        assert streamed == page, (query, size)
+                    after = RankPosition.after(page, after)
+                assert pages == full, (query, ranker, size)
+
+
+def test_position_set() -> None:
+    """Test bitmap position sets hold exactly their positions."""
+    positions = [0, 7, 8, 63, 64, 1000]
+    found = PositionSet.of(positions)
+    assert list(found) == positions and len(found) == 6
+    assert all(pos in found for pos in positions)
+    assert not any(pos in found for pos in (-1, 1, 9, 999, 1001, 10**6))
+    assert list(found & PositionSet.of([7, 9, 1000])) == [7, 1000]
+    assert list(PositionSet.of([])) == []
+
+
+def test_tag_filters_match_scan(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test tag bitmaps filter and count like a scan over skill tags, mapped or not."""
+    catalog = _random_catalog(6)
+    write_search_index(tmp_path / "search.idx", catalog.skills, "0" * 40)
+    index = open_search_index(tmp_path / "search.idx", "0" * 40)
+    assert index is not None
+    mapped = Catalog(list(catalog.skills))
+    mapped.use_search_index(index)
+    monkeypatch.setattr(catalog_module, "VECTOR_MIN_CANDIDATES", 0)
+
+    for tags in ([], ["pdf"], ["PDF", "kelvin"], ["äpi"], ["nope"]):
+        wanted = {tag.lower() for tag in tags}
+        having = [s for s in catalog.skills if wanted <= {tag.lower() for tag in s.tags}]
+        ids = {s.id for s in having}
+        counts = Counter(tag for s in having for tag in {tag.lower() for tag in s.tags})
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        for cat in (catalog, mapped):
+            assert cat.with_tags(tags) == having
+            assert list(cat.facets(tags).items()) == ranked
+            for query in ["", "p", "pdf", "kube docker", "re-wr"]:
+                for ranker in RANKERS:
+                    full = cat.suggest(query, limit=len(catalog.skills), ranker=ranker)
+                    expected = [r for r in full if r.skill.id in ids][:5]
+                    assert cat.suggest(query, limit=5, ranker=ranker, tags=tags) == expected
+                    if ranker == "v1":
+                        streamed = suggest_stream(catalog.skills, query, limit=5, tags=tags)
+                        assert streamed == expected, (query, tags)
+
+
+def test_parallel_suggest_matches_serial(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test partitioned suggest in worker processes ranks exactly like serial scoring."""
+    catalog = _random_catalog(7, size=300)
+    write_search_index(tmp_path / "search.idx", catalog.skills, "0" * 40)
+    index = open_search_index(tmp_path / "search.idx", "0" * 40)
+    assert index is not None
+    mapped = Catalog(list(catalog.skills))
+    mapped.use_search_index(index)
+    monkeypatch.setattr(catalog_module, "PARALLEL_SUGGEST_MIN_CANDIDATES", 0)
+    monkeypatch.setattr(catalog_module, "VECTOR_MIN_CANDIDATES", 1 << 30)
+
+    for cat in (catalog, mapped):
+        for query in ["pdf", "kube docker", "café x86 a", "dokcer"]:
+            for fuzzy in (0, 2):
+                serial = cat.suggest(query, limit=7, fuzzy=fuzzy)
+                assert cat.suggest(query, limit=7, fuzzy=fuzzy, workers=3) == serial, query
+        after = RankPosition.after(cat.suggest("kube docker", limit=4))
+        serial = cat.suggest("kube docker", limit=6, after=after, tags=["pdf"])
+        assert cat.suggest("kube docker", limit=6, after=after, tags=["pdf"], workers=2) == serial
+    with pytest.raises(ValueError):
+        catalog.suggest("pdf", workers=0)
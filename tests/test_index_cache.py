@@ -0,0 +1,32 @@
+"""Tests for index_cache module."""
+
+from pathlib import Path
+
+from skillsctl.catalog import Skill
+from skillsctl.index_cache import open_search_index, search_index_current, write_search_index
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+OTHER_SHA = "fedcba9876543210fedcba9876543210fedcba98"
+
+
+def test_index_keyed_on_catalog_object(tmp_path: Path) -> None:
+    """Test an index is only used for the catalog object it was built from."""
+    index_path = tmp_path / "search.idx"
+    assert not search_index_current(index_path, SHA)
+    write_search_index(index_path, [Skill(id="a", title="A", description="")], SHA)
+    assert search_index_current(index_path, SHA)
+    assert not search_index_current(index_path, OTHER_SHA)
+    assert open_search_index(index_path, OTHER_SHA) is None
+
+
+def test_truncated_index_is_ignored(tmp_path: Path) -> None:
+    """Test a truncated index file is treated as missing."""
+    index_path = tmp_path / "search.idx"
+    skills = [Skill(id=f"s{i}", title=f"Skill {i}", description="x" * i) for i in range(50)]
+    write_search_index(index_path, skills, SHA)
+    assert open_search_index(index_path, SHA) is not None
+    data = index_path.read_bytes()
+    index_path.write_bytes(data[: len(data) // 2])
+    assert open_search_index(index_path, SHA) is None
+    index_path.write_bytes(data[:10])
+    assert open_search_index(index_path, SHA) is None
@@ -0,0 +1,130 @@
+"""Tests for jsonl module."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from skillsctl.catalog import Catalog, CatalogError
+from skillsctl.jsonl import KIND_ALIAS, KIND_ID, open_jsonl
+
+CATALOG_DATA: list[dict[str, object]] = [
+    {
+        "id": "skill-1",
+        "title": "Skill One",
+        "description": "First skill",
+        "tags": ["tag1"],
+        "paths": ["skills/one"],
+        "aliases": ["one"],
+    },
+    {"id": "skill-2", "title": "Skill Two", "aliases": ["skill-1", "two"]},
+    {"id": "skill-3", "title": "Skill Three"},
+]
+
+
+def _write_jsonl(path: Path, items: list[dict[str, object]]) -> None:
+    path.write_text("".join(json.dumps(item) + "\n" for item in items))
+
+
+def test_open_jsonl_get() -> None:
+    """Test point lookups return the same skills as a full load."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jsonl_path = Path(tmpdir) / "skills.jsonl"
+        index_path = Path(tmpdir) / "skills.jsonl.idx"
+        _write_jsonl(jsonl_path, CATALOG_DATA)
+
+        catalog = open_jsonl(jsonl_path, index_path)
+        assert index_path.exists()
+
+        skill = catalog.get("skill-1")
+        assert skill is not None
+        assert skill.title == "Skill One"
+        assert skill.paths == ("skills/one",)
+        assert catalog.get("skill-3") is not None
+        assert catalog.get_by_id("one") is None
+        alias_skill = catalog.get("one")
+        assert alias_skill is not None
+        assert alias_skill.id == "skill-1"
+        # IDs win over aliases
+        assert catalog.get("skill-1") == skill
+        assert catalog.get("missing") is None
+        assert [s.id for s in catalog.list_all()] == ["skill-1", "skill-2", "skill-3"]
+
+
+def test_open_jsonl_lookup_aliases() -> None:
+    """Test lookup returns ID entries before alias entries."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jsonl_path = Path(tmpdir) / "skills.jsonl"
+        _write_jsonl(jsonl_path, CATALOG_DATA)
+
+        catalog = open_jsonl(jsonl_path, None)
+        entries = catalog.lookup("skill-1")
+        assert [kind for kind, _ in entries] == [KIND_ID, KIND_ALIAS]
+        assert [kind for kind, _ in catalog.lookup("two")] == [KIND_ALIAS]
+        assert catalog.lookup("zzz") == []
+
+
+def test_open_jsonl_rebuilds_stale_index() -> None:
+    """Test the index is rebuilt after the catalog changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jsonl_path = Path(tmpdir) / "skills.jsonl"
+        index_path = Path(tmpdir) / "skills.jsonl.idx"
+        _write_jsonl(jsonl_path, CATALOG_DATA)
+        open_jsonl(jsonl_path, index_path)
+
+        _write_jsonl(jsonl_path, [{"id": "skill-9", "title": "Nine"}, *CATALOG_DATA])
+        st = jsonl_path.stat()
+        os.utime(jsonl_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        catalog = open_jsonl(jsonl_path, index_path)
+        skill = catalog.get("skill-2")
+        assert skill is not None
+        assert skill.title == "Skill Two"
+        assert catalog.get("skill-9") is not None
+
+
+def test_open_jsonl_invalid_line() -> None:
+    """Test invalid JSON lines are reported with their line number."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jsonl_path = Path(tmpdir) / "skills.jsonl"
+        jsonl_path.write_text('{"id": "a", "title": "A"}\n{not json\n')
+
+        with pytest.raises(CatalogError, match="line 2"):
+            open_jsonl(jsonl_path, None)
+
+
+def test_open_jsonl_duplicate_id() -> None:
+    """Test a duplicate ID resolves to its last line, like a full load."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jsonl_path = Path(tmpdir) / "skills.jsonl"
+        index_path = Path(tmpdir) / "skills.jsonl.idx"
+        _write_jsonl(
+            jsonl_path,
+            [{"id": "dup", "title": "First"}, *CATALOG_DATA, {"id": "dup", "title": "Last"}],
+        )
+
+        expected = Catalog.load(jsonl_path).get("dup")
+        assert expected is not None and expected.title == "Last"
+        for _ in range(2):  # built, then mapped
+            assert open_jsonl(jsonl_path, index_path).get("dup") == expected
+
+
+def test_open_jsonl_invalid_line_behind_index() -> None:
+    """Test a line broken behind a current index is reported when it is read."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jsonl_path = Path(tmpdir) / "skills.jsonl"
+        index_path = Path(tmpdir) / "skills.jsonl.idx"
+        jsonl_path.write_text('{"id": "a", "title": "A"}\n{"id": "b", "title": "B"}\n')
+        open_jsonl(jsonl_path, index_path)
+
+        # Same size and mtime, so the index still matches the (mapped) file
+        st = jsonl_path.stat()
+        jsonl_path.write_text('{"id": "a", "title": "A"}\n{"id": "b", "title": "B"]\n')
+        os.utime(jsonl_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        catalog = open_jsonl(jsonl_path, index_path)
+        assert catalog.get("a") is not None
+        with pytest.raises(CatalogError, match="line 2"):
+            catalog.get("b")
@@ -0,0 +1,30 @@
+"""Tests for paging module."""
+
+import pytest
+
+from skillsctl.catalog import RankPosition
+from skillsctl.paging import Cursor, CursorError, request_key
+
+
+def test_cursor_round_trip() -> None:
+    """Test cursors decode to what was encoded and are checked against the request."""
+    request = request_key("suggest", "pdf", "v1", 0, None)
+    for after in (None, RankPosition(45, "pdf-tools"), RankPosition(1.2345, "é", 3)):
+        cursor = Cursor("abc123", request, 20, after)
+        token = cursor.encode()
+        assert token.isascii() and "=" not in token
+        assert Cursor.decode(token) == cursor
+
+    cursor.check("abc123", request)
+    with pytest.raises(CursorError, match="Catalog changed"):
+        cursor.check("def456", request)
+    with pytest.raises(CursorError, match="different query"):
+        cursor.check("abc123", request_key("suggest", "docker", "v1", 0, None))
+
+
+def test_cursor_decode_rejects_garbage() -> None:
+    """Test malformed tokens raise CursorError."""
+    valid = Cursor("abc123", "req", 20, RankPosition(45, "pdf-tools")).encode()
+    for token in ("", "!!!", valid[:-3], "WzEsMl0", "bnVsbA", valid.upper()):
+        with pytest.raises(CursorError):
+            Cursor.decode(token)
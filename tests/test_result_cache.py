@@ -0,0 +1,49 @@
+"""Tests for result_cache module."""
+
+import os
+from pathlib import Path
+
+from skillsctl.catalog import Catalog, Skill
+from skillsctl.result_cache import ResultCache
+
+CATALOG = Catalog(
+    [
+        Skill(id="pdf-tools", title="PDF tools", description="Merge PDFs", tags=("pdf",)),
+        Skill(id="docker", title="Docker", description="", aliases=("containers",)),
+    ]
+)
+
+
+def test_result_cache_round_trip(tmp_path: Path) -> None:
+    """Test cached results equal the ranked ones and are keyed on every option."""
+    cache = ResultCache.for_objects(tmp_path, ["a" * 40])
+    results = CATALOG.suggest("pdf")
+    assert cache.get("PDF", 10, "v1") is None
+    cache.put("pdf", 10, "v1", results)
+
+    assert cache.get("PDF", 10, "v1") == results
+    assert cache.get("pdf", 5, "v1") is None
+    assert cache.get("pdf", 10, "bm25") is None
+    assert cache.get("pdf", 10, "v1", fuzzy=1) is None
+    assert cache.get("pdf", 10, "v1", fuzzy_penalty=9) == results
+    assert cache.get("pdf", 10, "v1", tags=["pdf"]) is None
+    assert ResultCache.for_objects(tmp_path, ["b" * 40]).get("pdf", 10, "v1") is None
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Test eviction keeps recently read entries and drops other catalogs' entries."""
+    ResultCache.for_objects(tmp_path, ["b" * 40]).put("docker", 10, "v1", [])
+    cache = ResultCache(tmp_path, ResultCache.for_objects(tmp_path, ["a" * 40]).catalog_key, 2)
+    for query in ("pdf", "docker"):
+        cache.put(query, 10, "v1", CATALOG.suggest(query))
+    assert cache.get("pdf", 10, "v1") is not None
+    cache.put("merge", 10, "v1", CATALOG.suggest("merge"))
+
+    assert cache.get("docker", 10, "v1") is None
+    assert cache.get("pdf", 10, "v1") is not None
+    assert cache.get("merge", 10, "v1") is not None
+    assert len(os.listdir(tmp_path)) == 2
+
+    small = ResultCache(tmp_path, cache.catalog_key, max_bytes=1)
+    small.put("pdf", 10, "v1", [])
+    assert os.listdir(tmp_path) == []
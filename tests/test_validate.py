@@ -0,0 +1,71 @@
+"""Tests for validate module."""
+
+import json
+import tempfile
+from pathlib import Path
+
+from skillsctl.validate import (
+    ValidationIssue,
+    load_verdict,
+    save_verdict,
+    validate_catalog,
+)
+
+
+def test_validate_catalog_valid() -> None:
+    """Test a well-formed catalog has no issues."""
+    data = [
+        {"id": "a", "title": "A", "tags": ["x"], "paths": ["skills/a"], "aliases": ["aa"]},
+        {"id": "b", "title": "B", "description": "Bee"},
+    ]
+    assert validate_catalog([("skills.json", json.dumps(data).encode())]) == []
+
+
+def test_validate_catalog_reports_all_issues() -> None:
+    """Test every problem is reported in one pass."""
+    data = [
+        {"id": "a", "title": "A"},
+        {"title": "No ID"},
+        {"id": "a", "title": "Again"},
+        {"id": "c"},
+        {"id": "d", "title": "D", "tags": "pdf"},
+        {"id": "e", "title": "E", "paths": ["../outside", "/abs", "skills/ok"]},
+        "not an object",
+    ]
+    issues = validate_catalog([("skills.json", json.dumps(data).encode())])
+    assert [str(issue) for issue in issues] == [
+        "skills.json[1]: Missing 'id'",
+        "skills.json[2] (a): Duplicate id (first defined at skills.json[0])",
+        "skills.json[3] (c): Missing 'title'",
+        "skills.json[4] (d): 'tags' must be a list of strings",
+        "skills.json[5] (e): Path escapes the repository: '../outside'",
+        "skills.json[5] (e): Path escapes the repository: '/abs'",
+        "skills.json[6]: Entry must be a JSON object",
+    ]
+
+
+def test_validate_catalog_across_files() -> None:
+    """Test duplicates are detected across shards and JSON Lines locations."""
+    issues = validate_catalog(
+        [
+            ("skills.d/a.json", b'[{"id": "x", "title": "X"}]'),
+            ("skills.d/b.json", b"not json"),
+            ("skills.jsonl", b'{"id": "y", "title": "Y"}\n\n{"id": "x", "title": "X2"}\n'),
+        ]
+    )
+    assert [issue.location for issue in issues] == ["skills.d/b.json", "skills.jsonl:3"]
+    assert issues[1].message == "Duplicate id (first defined at skills.d/a.json[0])"
+
+
+def test_verdict_roundtrip() -> None:
+    """Test verdicts are cached and read back."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        verdict_path = Path(tmpdir) / "verdicts" / "abc.json"
+        assert load_verdict(verdict_path) is None
+
+        issues = [ValidationIssue("skills.json[0]", "Missing 'title'", "a")]
+        save_verdict(verdict_path, issues)
+        assert load_verdict(verdict_path) == issues
+
+        save_verdict(verdict_path, [])
+        assert load_verdict(verdict_path) == []